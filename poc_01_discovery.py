@@ -12,16 +12,21 @@ To run: python poc-01_discovery.py
 
 import asyncio
 import base64
+import ipaddress
 import json
 import logging
+import signal
 import socket
+from binascii import a2b_base64
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Coroutine, Dict, Optional, Set
 
+import ifaddr
 import nacl.signing
-from zeroconf import IPVersion, ServiceBrowser, ServiceInfo, ServiceStateChange, Zeroconf
-from zeroconf.asyncio import AsyncZeroconf
+from zeroconf import IPVersion, ServiceInfo, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncZeroconf
 
 # Configure structured logging
 logger = logging.getLogger(__name__)
@@ -32,17 +37,38 @@ logging.basicConfig(
 )
 
 
+@dataclass
+class Peer:
+    """A discovered peer: its address and Zeroconf service name."""
+
+    # Explicit slots keep per-peer records small (dataclass(slots=True)
+    # requires Python 3.10)
+    __slots__ = ("ip", "port", "name")
+
+    ip: str
+    port: int
+    name: str
+
+
 class TAZCOMNode:
     """
     A TAZCOM network node with cryptographic identity, service publishing,
     and peer discovery via mDNS/Zeroconf.
 
-    Thread Safety:
-    - self.peers and self.service_name_to_id are accessed from both the asyncio
-      event loop and the Zeroconf callback thread. We use asyncio locks and
-      run_coroutine_threadsafe to ensure thread-safe access.
+    All mDNS service types are browsed by a single AsyncServiceBrowser, so
+    each incoming packet is processed once. New types are added to
+    BROWSED_SERVICE_TYPES and dispatched in _on_service_state_change rather
+    than getting a browser of their own.
     """
 
+    # Zeroconf service type for TAZCOM nodes
+    SERVICE_TYPE = "_tazcom._tcp.local."
+    # Every service type handled by the node's single browser
+    BROWSED_SERVICE_TYPES = [SERVICE_TYPE]
+
+    # Local IP address, detected once per process
+    _CACHED_LOCAL_IP: Optional[str] = None
+
     def __init__(self) -> None:
         """Initialize a new TAZCOM node instance."""
         self.signing_key: nacl.signing.SigningKey
@@ -50,14 +76,20 @@ class TAZCOMNode:
         self.node_id_b64: str
         self.tcp_port: int
         self.local_ip: str
-        self.peers: Dict[str, Dict[str, str]] = {}
+        self.peers: Dict[str, Peer] = {}
         # Inverse lookup: maps service_name -> peer_id for O(1) removal
         self.service_name_to_id: Dict[str, str] = {}
+        # Note: peers and service_name_to_id are only touched from the event
+        # loop (AsyncServiceBrowser callbacks included), and no update spans an
+        # await, so they need no lock.
         self.aiozc: Optional[AsyncZeroconf] = None
-        self.service_browser: Optional[ServiceBrowser] = None
-        self.peers_lock: asyncio.Lock = asyncio.Lock()
-        # Reference to the event loop for thread-safe operations
-        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.service_browser: Optional[AsyncServiceBrowser] = None
+        # Name of our own published service, used to skip self-announcements
+        self._own_service_name: str = ""
+        # In-flight discovery handlers, kept referenced until they finish
+        self._discovery_tasks: Set[asyncio.Task] = set()
+        # Set by SIGINT/SIGTERM to end run()
+        self._stop: asyncio.Event = asyncio.Event()
 
     def _load_or_create_identity(self) -> None:
         """
@@ -70,10 +102,9 @@ class TAZCOMNode:
         key_file = Path("node.key")
 
         if key_file.exists():
-            # Load existing identity from file
-            with open(key_file, "r") as f:
-                key_data = json.load(f)
-            key_bytes = base64.b64decode(key_data["signing_key"])
+            # Load existing identity from file in a single read
+            key_data = json.loads(key_file.read_bytes())
+            key_bytes = a2b_base64(key_data["signing_key"])
             self.signing_key = nacl.signing.SigningKey(key_bytes)
             logger.info(f"Loaded existing identity from {key_file}")
         else:
@@ -83,14 +114,13 @@ class TAZCOMNode:
                 "signing_key": base64.b64encode(bytes(self.signing_key)).decode(),
                 "created": datetime.now().isoformat(),
             }
-            with open(key_file, "w") as f:
-                json.dump(key_data, f, indent=2)
+            key_file.write_text(json.dumps(key_data, indent=2))
             logger.info(f"Generated new identity and saved to {key_file}")
 
         # Extract the public key (node ID) and encode it for network transmission
         self.node_id = self.signing_key.verify_key
         self.node_id_b64 = (
-            base64.urlsafe_b64encode(bytes(self.node_id)).decode().rstrip("=")
+            base64.urlsafe_b64encode(bytes(self.node_id)).rstrip(b"=").decode("ascii")
         )
 
     def _find_available_port(self) -> int:
@@ -110,6 +140,39 @@ class TAZCOMNode:
         """
         Determine the local IP address for this machine.
 
+        Inspects the network adapters in-process via ifaddr (already required
+        by zeroconf) and picks the first IPv4 address that is neither loopback
+        nor link-local. The result is cached for the lifetime of the process.
+        """
+        if TAZCOMNode._CACHED_LOCAL_IP is None:
+            TAZCOMNode._CACHED_LOCAL_IP = (
+                self._find_adapter_ip() or self._get_routed_ip()
+            )
+        return TAZCOMNode._CACHED_LOCAL_IP
+
+    @staticmethod
+    def _find_adapter_ip() -> Optional[str]:
+        """
+        Return the first usable IPv4 address of the local network adapters.
+
+        Returns:
+            The address as a string, or None if no adapter qualifies.
+        """
+        for adapter in ifaddr.get_adapters():
+            for ip in adapter.ips:
+                # IPv6 addresses are reported as tuples
+                if not isinstance(ip.ip, str):
+                    continue
+                address = ipaddress.IPv4Address(ip.ip)
+                if not (address.is_loopback or address.is_link_local):
+                    return ip.ip
+        return None
+
+    @staticmethod
+    def _get_routed_ip() -> str:
+        """
+        Determine the local IP address from the routing table.
+
         Uses a UDP socket connection to a public DNS server (Google's 8.8.8.8)
         to determine the outbound interface, without actually sending data.
         Falls back to localhost if the detection fails.
@@ -129,7 +192,6 @@ class TAZCOMNode:
 
         This must be called once before running the node.
         """
-        self.event_loop = asyncio.get_event_loop()
         self._load_or_create_identity()
         self.tcp_port = self._find_available_port()
         self.local_ip = self._get_local_ip()
@@ -139,6 +201,7 @@ class TAZCOMNode:
         logger.info(f"Listening on {self.local_ip}:{self.tcp_port}")
 
         await self._setup_zeroconf()
+        self._install_signal_handlers()
 
     async def _setup_zeroconf(self) -> None:
         """
@@ -160,13 +223,14 @@ class TAZCOMNode:
         }
 
         node_id_short = self.node_id_b64[:8]
-        service_name = f"TAZCOM Node {node_id_short}._tazcom._tcp.local."
+        service_name = f"TAZCOM Node {node_id_short}.{self.SERVICE_TYPE}"
+        self._own_service_name = service_name
 
         # Create and register the service
         info = ServiceInfo(
-            "_tazcom._tcp.local.",
+            self.SERVICE_TYPE,
             service_name,
-            addresses=[socket.inet_aton(self.local_ip)],
+            parsed_addresses=[self.local_ip],
             port=self.tcp_port,
             properties=properties,
             server=f"tazcom-{node_id_short}.local.",
@@ -175,10 +239,10 @@ class TAZCOMNode:
         await self.aiozc.async_register_service(info)
         logger.info(f"Publishing service '{service_name}'")
 
-        # Start listening for other nodes
-        self.service_browser = ServiceBrowser(
+        # Start listening for other nodes (one browser for every browsed type)
+        self.service_browser = AsyncServiceBrowser(
             self.aiozc.zeroconf,
-            "_tazcom._tcp.local.",
+            self.BROWSED_SERVICE_TYPES,
             handlers=[self._on_service_state_change],
         )
 
@@ -192,33 +256,44 @@ class TAZCOMNode:
         """
         Handle Zeroconf service state changes (Added/Removed).
 
-        This callback is invoked synchronously by the ServiceBrowser in a
-        separate thread, not in the asyncio event loop. We use
-        run_coroutine_threadsafe to safely schedule async operations.
+        The AsyncServiceBrowser invokes this callback from within the asyncio
+        event loop, so the async handlers can be scheduled directly. Events
+        are dispatched on service_type since all browsed types share this
+        callback.
         """
-        if self.event_loop is None:
+        if service_type != self.SERVICE_TYPE:
             return
 
         if state_change == ServiceStateChange.Added:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_added(zeroconf, service_type, name), self.event_loop
-            )
+            self._spawn_discovery_task(self._on_service_added(service_type, name))
         elif state_change == ServiceStateChange.Removed:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_removed(name), self.event_loop
-            )
+            self._spawn_discovery_task(self._on_service_removed(name))
 
-    async def _on_service_added(
-        self, zeroconf: Zeroconf, service_type: str, name: str
-    ) -> None:
+    def _spawn_discovery_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """
+        Start a discovery handler on the event loop and keep it referenced.
+
+        Args:
+            coro: The handler coroutine
+        """
+        task = asyncio.create_task(coro)
+        self._discovery_tasks.add(task)
+        task.add_done_callback(self._discovery_tasks.discard)
+
+    async def _on_service_added(self, service_type: str, name: str) -> None:
         """
         Process a newly discovered peer service.
 
-        Retrieves the service info, validates it, and if it's not our own
-        service, adds the peer to our peer dictionary and logs the discovery.
+        Resolves the service info asynchronously, validates it, and if it's
+        not our own service, adds the peer to our peer dictionary and logs the
+        discovery.
         """
+        # Our own announcement echoes back; skip it without resolving
+        if name == self._own_service_name:
+            return
+
         try:
-            info = zeroconf.get_service_info(service_type, name)
+            info = await self.aiozc.async_get_service_info(service_type, name)
             if info is None:
                 return
 
@@ -233,23 +308,18 @@ class TAZCOMNode:
                 else peer_id_bytes
             )
 
-            # Ignore our own service announcement
+            # Ignore our own service announcement (defense in depth)
             if peer_id == self.node_id_b64:
                 return
 
             # Extract peer network information
-            addresses = [socket.inet_ntoa(addr) for addr in info.addresses]
-            peer_ip = addresses[0] if addresses else "unknown"
+            parsed = info.parsed_addresses()
+            peer_ip = parsed[0] if parsed else "unknown"
             peer_port = info.port
 
-            # Store peer information with thread-safe lock
-            async with self.peers_lock:
-                self.peers[peer_id] = {
-                    "ip": peer_ip,
-                    "port": str(peer_port),
-                    "name": name,
-                }
-                self.service_name_to_id[name] = peer_id
+            # Store peer information
+            self.peers[peer_id] = Peer(ip=peer_ip, port=peer_port, name=name)
+            self.service_name_to_id[name] = peer_id
 
             logger.info(f"Peer Discovered: {peer_id} @ {peer_ip}:{peer_port}")
 
@@ -262,32 +332,49 @@ class TAZCOMNode:
 
         Uses the inverse lookup table (service_name_to_id) for O(1) removal.
         """
-        async with self.peers_lock:
-            peer_id = self.service_name_to_id.pop(name, None)
-            if peer_id and peer_id in self.peers:
-                del self.peers[peer_id]
-                logger.info(f"Peer Removed: {peer_id}")
+        peer_id = self.service_name_to_id.pop(name, None)
+        if peer_id and peer_id in self.peers:
+            del self.peers[peer_id]
+            logger.info(f"Peer Removed: {peer_id}")
+
+    def _install_signal_handlers(self) -> None:
+        """
+        Stop the node on SIGINT/SIGTERM via the event loop's signal handling.
+
+        Platforms without loop signal handlers (Windows) keep the default
+        KeyboardInterrupt behaviour.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except NotImplementedError:
+                pass
 
     async def run(self) -> None:
         """
         Run the node indefinitely until interrupted.
 
-        The main loop simply keeps the asyncio event loop running.
+        Waits until SIGINT or SIGTERM is received, then shuts down.
         Discovery and service updates happen via callbacks.
         """
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Shutdown signal received...")
-            await self.shutdown()
+        await self._stop.wait()
+        logger.info("Shutdown signal received...")
+        await self.shutdown()
 
     async def shutdown(self) -> None:
         """
         Gracefully shut down the node.
 
-        Unregisters the Zeroconf service and closes the AsyncZeroconf instance.
+        Stops the service browser, unregisters the Zeroconf service and closes
+        the AsyncZeroconf instance.
         """
+        for task in list(self._discovery_tasks):
+            task.cancel()
+
+        if self.service_browser:
+            await self.service_browser.async_cancel()
+
         if self.aiozc:
             await self.aiozc.async_close()
         logger.info("Node shut down successfully.")
@@ -301,4 +388,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-based event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
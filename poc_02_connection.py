@@ -21,16 +21,21 @@ The nodes will discover each other and automatically exchange HELLO messages.
 
 import asyncio
 import base64
+import ipaddress
 import json
 import logging
+import signal
 import socket
+from binascii import a2b_base64
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Coroutine, Dict, Optional, Set, Tuple
 
+import ifaddr
 import nacl.signing
-from zeroconf import IPVersion, ServiceBrowser, ServiceInfo, ServiceStateChange, Zeroconf
-from zeroconf.asyncio import AsyncZeroconf
+from zeroconf import IPVersion, ServiceInfo, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncZeroconf
 
 # Configure structured logging
 logger = logging.getLogger(__name__)
@@ -40,22 +45,56 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
+# Shared compact encoder for wire messages (reused instead of building a new
+# encoder on every json.dumps call with custom separators)
+_WIRE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass
+class Peer:
+    """A discovered peer: its address and Zeroconf service name."""
+
+    # Explicit slots keep per-peer records small (dataclass(slots=True)
+    # requires Python 3.10)
+    __slots__ = ("ip", "port", "name")
+
+    ip: str
+    port: int
+    name: str
+
 
 class TAZCOMNode:
     """
     A TAZCOM network node with cryptographic identity, service publishing,
     peer discovery via mDNS/Zeroconf, and TCP-based P2P communication.
 
-    Thread Safety:
-    - self.peers and self.service_name_to_id are accessed from both the asyncio
-      event loop and the Zeroconf callback thread. We use asyncio locks and
-      run_coroutine_threadsafe to ensure thread-safe access.
+    All mDNS service types are browsed by a single AsyncServiceBrowser, so
+    each incoming packet is processed once. New types are added to
+    BROWSED_SERVICE_TYPES and dispatched in _on_service_state_change rather
+    than getting a browser of their own.
     """
 
+    # Zeroconf service type for TAZCOM nodes
+    SERVICE_TYPE = "_tazcom._tcp.local."
+    # Every service type handled by the node's single browser
+    BROWSED_SERVICE_TYPES = [SERVICE_TYPE]
+
     # Message protocol constants
     MESSAGE_ENCODING = "utf-8"
     MESSAGE_TERMINATOR = b"\n"
     MESSAGE_SIZE_LIMIT = 1024
+    ACK_FRAME = b"ACK\n"
+    # Maximum number of queued frames coalesced into a single write
+    WRITE_BATCH_SIZE = 32
+    # Outbound connections unused for this long (seconds) are closed
+    CONNECTION_IDLE_TIMEOUT = 60.0
+    # How often (seconds) the pool is scanned for idle connections
+    POOL_REAP_INTERVAL = 30.0
+    # Upper bound (seconds) on connecting to a peer and awaiting its ACK
+    PEER_IO_TIMEOUT = 5.0
+
+    # Local IP address, detected once per process
+    _CACHED_LOCAL_IP: Optional[str] = None
 
     def __init__(self) -> None:
         """Initialize a new TAZCOM node instance."""
@@ -64,16 +103,37 @@ class TAZCOMNode:
         self.node_id_b64: str
         self.tcp_port: int
         self.local_ip: str
-        self.peers: Dict[str, Dict[str, str]] = {}
+        self.peers: Dict[str, Peer] = {}
         # Inverse lookup: maps service_name -> peer_id for O(1) removal
         self.service_name_to_id: Dict[str, str] = {}
+        # Note: peers and service_name_to_id are only touched from the event
+        # loop (AsyncServiceBrowser callbacks included), and no update spans an
+        # await, so they need no lock.
         self.aiozc: Optional[AsyncZeroconf] = None
-        self.service_browser: Optional[ServiceBrowser] = None
-        self.peers_lock: asyncio.Lock = asyncio.Lock()
-        # Reference to the event loop for thread-safe operations
-        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.service_browser: Optional[AsyncServiceBrowser] = None
+        # Name of our own published service, used to skip self-announcements
+        self._own_service_name: str = ""
+        # In-flight discovery handlers and HELLO sends, kept referenced
+        # until they finish
+        self._discovery_tasks: Set[asyncio.Task] = set()
         # TCP server
         self.server: Optional[asyncio.Server] = None
+        # Long-lived outbound connections: peer_id -> (reader, writer, frame queue)
+        self.peer_connections: Dict[
+            str, Tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Queue]
+        ] = {}
+        # Writer task draining each peer's queue: peer_id -> task
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
+        # Event loop time at which each peer connection was last used
+        self.peer_last_used: Dict[str, float] = {}
+        # Background task closing idle peer connections
+        self._reaper_task: Optional[asyncio.Task] = None
+        # Writers of inbound connections, closed on shutdown
+        self.inbound_writers: Set[asyncio.StreamWriter] = set()
+        # Set by SIGINT/SIGTERM to end run()
+        self._stop: asyncio.Event = asyncio.Event()
+        # Pre-encoded HELLO frame (set once the identity is loaded)
+        self._hello_bytes: bytes = b""
 
     def _load_or_create_identity(self) -> None:
         """
@@ -86,10 +146,9 @@ class TAZCOMNode:
         key_file = Path("node.key")
 
         if key_file.exists():
-            # Load existing identity from file
-            with open(key_file, "r") as f:
-                key_data = json.load(f)
-            key_bytes = base64.b64decode(key_data["signing_key"])
+            # Load existing identity from file in a single read
+            key_data = json.loads(key_file.read_bytes())
+            key_bytes = a2b_base64(key_data["signing_key"])
             self.signing_key = nacl.signing.SigningKey(key_bytes)
             logger.info(f"Loaded existing identity from {key_file}")
         else:
@@ -99,33 +158,68 @@ class TAZCOMNode:
                 "signing_key": base64.b64encode(bytes(self.signing_key)).decode(),
                 "created": datetime.now().isoformat(),
             }
-            with open(key_file, "w") as f:
-                json.dump(key_data, f, indent=2)
+            key_file.write_text(json.dumps(key_data, indent=2))
             logger.info(f"Generated new identity and saved to {key_file}")
 
         # Extract the public key (node ID) and encode it for network transmission
         self.node_id = self.signing_key.verify_key
         self.node_id_b64 = (
-            base64.urlsafe_b64encode(bytes(self.node_id)).decode().rstrip("=")
+            base64.urlsafe_b64encode(bytes(self.node_id)).rstrip(b"=").decode("ascii")
         )
 
-    def _find_available_port(self) -> int:
+    def _encode_hello(self) -> bytes:
         """
-        Find an available TCP port by binding to port 0.
+        Encode this node's HELLO message as a ready-to-send wire frame.
 
-        The OS will assign an unused port, which we retrieve and return.
-        This allows multiple nodes to run on the same machine without conflict.
+        The HELLO payload only depends on the node ID, so it is encoded once
+        after the identity is loaded and reused for every peer.
         """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(("0.0.0.0", 0))
-            s.listen(1)
-            _, port = s.getsockname()
-        return port
+        hello_message = {
+            "type": "HELLO",
+            "from": self.node_id_b64,
+        }
+        return (
+            _WIRE_ENCODER.encode(hello_message).encode(self.MESSAGE_ENCODING)
+            + self.MESSAGE_TERMINATOR
+        )
 
     def _get_local_ip(self) -> str:
         """
         Determine the local IP address for this machine.
 
+        Inspects the network adapters in-process via ifaddr (already required
+        by zeroconf) and picks the first IPv4 address that is neither loopback
+        nor link-local. The result is cached for the lifetime of the process.
+        """
+        if TAZCOMNode._CACHED_LOCAL_IP is None:
+            TAZCOMNode._CACHED_LOCAL_IP = (
+                self._find_adapter_ip() or self._get_routed_ip()
+            )
+        return TAZCOMNode._CACHED_LOCAL_IP
+
+    @staticmethod
+    def _find_adapter_ip() -> Optional[str]:
+        """
+        Return the first usable IPv4 address of the local network adapters.
+
+        Returns:
+            The address as a string, or None if no adapter qualifies.
+        """
+        for adapter in ifaddr.get_adapters():
+            for ip in adapter.ips:
+                # IPv6 addresses are reported as tuples
+                if not isinstance(ip.ip, str):
+                    continue
+                address = ipaddress.IPv4Address(ip.ip)
+                if not (address.is_loopback or address.is_link_local):
+                    return ip.ip
+        return None
+
+    @staticmethod
+    def _get_routed_ip() -> str:
+        """
+        Determine the local IP address from the routing table.
+
         Uses a UDP socket connection to a public DNS server (Google's 8.8.8.8)
         to determine the outbound interface, without actually sending data.
         Falls back to localhost if the detection fails.
@@ -146,29 +240,37 @@ class TAZCOMNode:
 
         This must be called once before running the node.
         """
-        self.event_loop = asyncio.get_event_loop()
         self._load_or_create_identity()
-        self.tcp_port = self._find_available_port()
+        self._hello_bytes = self._encode_hello()
         self.local_ip = self._get_local_ip()
 
+        # Start the TCP server (this also assigns self.tcp_port)
+        await self._start_tcp_server()
+
         logger.info("TAZCOM Node Initialized.")
         logger.info(f"Node ID: {self.node_id_b64}")
         logger.info(f"Listening on {self.local_ip}:{self.tcp_port}")
 
-        # Start the TCP server
-        await self._start_tcp_server()
-        # Setup Zeroconf discovery
+        # Setup Zeroconf discovery (the TXT record needs the bound port)
         await self._setup_zeroconf()
+        self._reaper_task = asyncio.create_task(self._pool_reaper())
+        self._install_signal_handlers()
 
     async def _start_tcp_server(self) -> None:
         """
         Start an asynchronous TCP server that listens for incoming connections.
 
         Each incoming connection is handled by the handle_connection coroutine.
+        The server binds port 0 and the OS-assigned port is read back from the
+        listening socket, so no other process can grab the port in between.
         """
         self.server = await asyncio.start_server(
-            self.handle_connection, self.local_ip, self.tcp_port
+            self.handle_connection,
+            self.local_ip,
+            0,
+            reuse_address=True,
         )
+        self.tcp_port = self.server.sockets[0].getsockname()[1]
         logger.info(f"TCP server started on {self.local_ip}:{self.tcp_port}")
 
     async def handle_connection(
@@ -177,22 +279,25 @@ class TAZCOMNode:
         """
         Handle an incoming TCP connection from a peer.
 
-        Reads a single line of data, logs it, and sends back an acknowledgment.
+        Peers keep their connection open, so lines are read until the peer
+        disconnects. Each message is logged and acknowledged.
         """
         addr = writer.get_extra_info("peername")
+        self.inbound_writers.add(writer)
         try:
-            # Read up to MESSAGE_SIZE_LIMIT bytes until newline
-            data = await reader.readuntil(self.MESSAGE_TERMINATOR)
+            while True:
+                # Read up to MESSAGE_SIZE_LIMIT bytes until newline
+                data = await reader.readuntil(self.MESSAGE_TERMINATOR)
 
-            if data:
                 message = data.decode(self.MESSAGE_ENCODING).strip()
                 logger.info(f"Message from {addr}: {message}")
 
                 # Send acknowledgment
-                ack_response = b"ACK\n"
-                writer.write(ack_response)
+                writer.write(self.ACK_FRAME)
                 await writer.drain()
 
+        except asyncio.IncompleteReadError:
+            logger.debug(f"Connection closed by {addr}")
         except asyncio.LimitOverrunError:
             logger.warning(f"Message from {addr} exceeds size limit")
             writer.close()
@@ -200,6 +305,7 @@ class TAZCOMNode:
         except Exception as e:
             logger.warning(f"Error handling connection from {addr}: {e}")
         finally:
+            self.inbound_writers.discard(writer)
             writer.close()
             await writer.wait_closed()
 
@@ -223,13 +329,14 @@ class TAZCOMNode:
         }
 
         node_id_short = self.node_id_b64[:8]
-        service_name = f"TAZCOM Node {node_id_short}._tazcom._tcp.local."
+        service_name = f"TAZCOM Node {node_id_short}.{self.SERVICE_TYPE}"
+        self._own_service_name = service_name
 
         # Create and register the service
         info = ServiceInfo(
-            "_tazcom._tcp.local.",
+            self.SERVICE_TYPE,
             service_name,
-            addresses=[socket.inet_aton(self.local_ip)],
+            parsed_addresses=[self.local_ip],
             port=self.tcp_port,
             properties=properties,
             server=f"tazcom-{node_id_short}.local.",
@@ -238,10 +345,10 @@ class TAZCOMNode:
         await self.aiozc.async_register_service(info)
         logger.info(f"Publishing service '{service_name}'")
 
-        # Start listening for other nodes
-        self.service_browser = ServiceBrowser(
+        # Start listening for other nodes (one browser for every browsed type)
+        self.service_browser = AsyncServiceBrowser(
             self.aiozc.zeroconf,
-            "_tazcom._tcp.local.",
+            self.BROWSED_SERVICE_TYPES,
             handlers=[self._on_service_state_change],
         )
 
@@ -255,33 +362,44 @@ class TAZCOMNode:
         """
         Handle Zeroconf service state changes (Added/Removed).
 
-        This callback is invoked synchronously by the ServiceBrowser in a
-        separate thread, not in the asyncio event loop. We use
-        run_coroutine_threadsafe to safely schedule async operations.
+        The AsyncServiceBrowser invokes this callback from within the asyncio
+        event loop, so the async handlers can be scheduled directly. Events
+        are dispatched on service_type since all browsed types share this
+        callback.
         """
-        if self.event_loop is None:
+        if service_type != self.SERVICE_TYPE:
             return
 
         if state_change == ServiceStateChange.Added:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_added(zeroconf, service_type, name), self.event_loop
-            )
+            self._spawn_discovery_task(self._on_service_added(service_type, name))
         elif state_change == ServiceStateChange.Removed:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_removed(name), self.event_loop
-            )
+            self._spawn_discovery_task(self._on_service_removed(name))
 
-    async def _on_service_added(
-        self, zeroconf: Zeroconf, service_type: str, name: str
-    ) -> None:
+    def _spawn_discovery_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """
+        Start a discovery handler on the event loop and keep it referenced.
+
+        Args:
+            coro: The handler coroutine
+        """
+        task = asyncio.create_task(coro)
+        self._discovery_tasks.add(task)
+        task.add_done_callback(self._discovery_tasks.discard)
+
+    async def _on_service_added(self, service_type: str, name: str) -> None:
         """
         Process a newly discovered peer service.
 
-        Retrieves the service info, validates it, adds the peer to our peer
-        dictionary, and automatically sends a "HELLO" message to the new peer.
+        Resolves the service info asynchronously, validates it, adds the peer
+        to our peer dictionary, and automatically sends a "HELLO" message to
+        the new peer.
         """
+        # Our own announcement echoes back; skip it without resolving
+        if name == self._own_service_name:
+            return
+
         try:
-            info = zeroconf.get_service_info(service_type, name)
+            info = await self.aiozc.async_get_service_info(service_type, name)
             if info is None:
                 return
 
@@ -296,28 +414,24 @@ class TAZCOMNode:
                 else peer_id_bytes
             )
 
-            # Ignore our own service announcement
+            # Ignore our own service announcement (defense in depth)
             if peer_id == self.node_id_b64:
                 return
 
             # Extract peer network information
-            addresses = [socket.inet_ntoa(addr) for addr in info.addresses]
-            peer_ip = addresses[0] if addresses else "unknown"
+            parsed = info.parsed_addresses()
+            peer_ip = parsed[0] if parsed else "unknown"
             peer_port = info.port
 
-            # Store peer information with thread-safe lock
-            async with self.peers_lock:
-                self.peers[peer_id] = {
-                    "ip": peer_ip,
-                    "port": str(peer_port),
-                    "name": name,
-                }
-                self.service_name_to_id[name] = peer_id
+            # Store peer information
+            self.peers[peer_id] = Peer(ip=peer_ip, port=peer_port, name=name)
+            self.service_name_to_id[name] = peer_id
 
             logger.info(f"Peer Discovered: {peer_id} @ {peer_ip}:{peer_port}")
 
-            # Automatically send HELLO to the newly discovered peer
-            await self.send_hello(peer_id)
+            # Automatically send HELLO to the newly discovered peer without
+            # holding up resolution of other peers discovered concurrently
+            self._spawn_discovery_task(self.send_hello(peer_id))
 
         except Exception as e:
             logger.warning(f"Error processing service addition: {e}")
@@ -328,92 +442,226 @@ class TAZCOMNode:
 
         Uses the inverse lookup table (service_name_to_id) for O(1) removal.
         """
-        async with self.peers_lock:
-            peer_id = self.service_name_to_id.pop(name, None)
-            if peer_id and peer_id in self.peers:
-                del self.peers[peer_id]
-                logger.info(f"Peer Removed: {peer_id}")
+        peer_id = self.service_name_to_id.pop(name, None)
+        if peer_id and peer_id in self.peers:
+            del self.peers[peer_id]
+            logger.info(f"Peer Removed: {peer_id}")
 
     async def send_hello(self, peer_id: str) -> None:
         """
         Send a HELLO message to a discovered peer.
 
-        Looks up the peer's address, connects via TCP, sends a JSON message,
-        and waits for an acknowledgment.
+        The message is queued on the peer's long-lived connection, which is
+        opened on first use. Acknowledgments are consumed by the peer's
+        writer task.
 
         Args:
             peer_id: The public key ID of the target peer.
         """
-        async with self.peers_lock:
-            peer_info = self.peers.get(peer_id)
-            if not peer_info:
-                logger.warning(f"Peer {peer_id} not found in peer list")
-                return
-            peer_ip = peer_info["ip"]
-            peer_port = int(peer_info["port"])
+        queue = await self._get_peer_queue(peer_id)
+        if queue is None:
+            return
 
-        try:
-            # Establish connection to the peer
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
+        # The HELLO frame never changes, so it is encoded once at startup
+        await queue.put(self._hello_bytes)
+        logger.info(f"Queued HELLO for {peer_id}")
 
-            # Prepare and send HELLO message
-            hello_message = {
-                "type": "HELLO",
-                "from": self.node_id_b64,
-            }
-            message_json = json.dumps(hello_message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+    async def _get_peer_queue(self, peer_id: str) -> Optional[asyncio.Queue]:
+        """
+        Return the outbound frame queue for a peer, connecting if needed.
 
-            writer.write(message_bytes)
-            await writer.drain()
-            logger.info(f"Sent HELLO to {peer_id} @ {peer_ip}:{peer_port}")
+        Opens a TCP connection to the peer and starts a writer task that
+        drains the queue for the lifetime of the connection.
 
-            # Wait for acknowledgment
-            ack_data = await reader.readuntil(self.MESSAGE_TERMINATOR)
-            ack_message = ack_data.decode(self.MESSAGE_ENCODING).strip()
-            logger.info(f"Received {ack_message} from {peer_id}")
+        Args:
+            peer_id: The public key ID of the target peer.
 
-            # Close the connection
-            writer.close()
-            await writer.wait_closed()
+        Returns:
+            The peer's frame queue, or None if the peer is unknown or
+            unreachable.
+        """
+        connection = self.peer_connections.get(peer_id)
+        if connection:
+            if not connection[1].is_closing():
+                self.peer_last_used[peer_id] = asyncio.get_running_loop().time()
+                return connection[2]
+            # Stale connection: drop it and reconnect below
+            self._close_peer_connection(peer_id)
+
+        peer_info = self.peers.get(peer_id)
+        if not peer_info:
+            logger.warning(f"Peer {peer_id} not found in peer list")
+            return None
+        peer_ip = peer_info.ip
+        peer_port = peer_info.port
 
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(peer_ip, peer_port),
+                timeout=self.PEER_IO_TIMEOUT,
+            )
         except ConnectionRefusedError:
             logger.warning(f"Connection refused by {peer_id} @ {peer_ip}:{peer_port}")
+            return None
         except asyncio.TimeoutError:
-            logger.warning(f"Connection timeout to {peer_id} @ {peer_ip}:{peer_port}")
+            logger.warning(f"Timeout connecting to {peer_id} @ {peer_ip}:{peer_port}")
+            return None
         except Exception as e:
             logger.warning(
-                f"Error communicating with {peer_id} @ {peer_ip}:{peer_port}: {e}"
+                f"Error connecting to {peer_id} @ {peer_ip}:{peer_port}: {e}"
             )
+            return None
+
+        # Another task may have connected to the same peer in the meantime
+        connection = self.peer_connections.get(peer_id)
+        if connection:
+            writer.close()
+            return connection[2]
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self.peer_connections[peer_id] = (reader, writer, queue)
+        self.peer_last_used[peer_id] = asyncio.get_running_loop().time()
+        logger.info(f"Connected to {peer_id} @ {peer_ip}:{peer_port}")
+
+        self.writer_tasks[peer_id] = asyncio.create_task(self._peer_writer(peer_id))
+
+        return queue
+
+    def _close_peer_connection(self, peer_id: str) -> None:
+        """
+        Remove a peer's pooled connection and stop its writer task.
+
+        Args:
+            peer_id: The public key ID of the peer.
+        """
+        connection = self.peer_connections.pop(peer_id, None)
+        self.peer_last_used.pop(peer_id, None)
+        task = self.writer_tasks.pop(peer_id, None)
+        if task:
+            task.cancel()
+        if connection:
+            connection[1].close()
+
+    async def _pool_reaper(self) -> None:
+        """
+        Periodically close outbound connections that have gone idle.
+
+        Every POOL_REAP_INTERVAL seconds, connections with an empty queue
+        that have not been used for CONNECTION_IDLE_TIMEOUT seconds are
+        closed. They are reopened on the next send.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.POOL_REAP_INTERVAL)
+            now = loop.time()
+            for peer_id, (_, _, queue) in list(self.peer_connections.items()):
+                last_used = self.peer_last_used.get(peer_id, now)
+                if queue.empty() and now - last_used >= self.CONNECTION_IDLE_TIMEOUT:
+                    logger.info(f"Closing idle connection to {peer_id}")
+                    self._close_peer_connection(peer_id)
+
+    async def _peer_writer(self, peer_id: str) -> None:
+        """
+        Drain a peer's outbound queue over its long-lived connection.
+
+        After the first blocking get(), any further queued frames (up to
+        WRITE_BATCH_SIZE) are flushed together with a single writelines()
+        and drain(). One acknowledgment is then read per frame sent.
+
+        Args:
+            peer_id: The public key ID of the target peer.
+        """
+        reader, writer, queue = self.peer_connections[peer_id]
+
+        try:
+            while True:
+                frames = [await queue.get()]
+                while len(frames) < self.WRITE_BATCH_SIZE and not queue.empty():
+                    frames.append(queue.get_nowait())
+
+                writer.writelines(frames)
+                await writer.drain()
+                logger.debug(f"Sent {len(frames)} frame(s) to {peer_id}")
+
+                # Wait for acknowledgments (fixed-size, no delimiter scan)
+                for _ in frames:
+                    ack_data = await asyncio.wait_for(
+                        reader.readexactly(len(self.ACK_FRAME)),
+                        timeout=self.PEER_IO_TIMEOUT,
+                    )
+                    if ack_data != self.ACK_FRAME:
+                        logger.warning(f"Unexpected reply from {peer_id}: {ack_data!r}")
+                    else:
+                        logger.info(f"Received ACK from {peer_id}")
+
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            logger.warning(f"Connection to {peer_id} was closed")
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout waiting for ACK from {peer_id}")
+        except Exception as e:
+            logger.warning(f"Error communicating with {peer_id}: {e}")
+        finally:
+            # Only clean up the pool entry if it still belongs to this task
+            if self.writer_tasks.get(peer_id) is asyncio.current_task():
+                del self.writer_tasks[peer_id]
+                self.peer_connections.pop(peer_id, None)
+                self.peer_last_used.pop(peer_id, None)
+            writer.close()
+
+    def _install_signal_handlers(self) -> None:
+        """
+        Stop the node on SIGINT/SIGTERM via the event loop's signal handling.
+
+        Platforms without loop signal handlers (Windows) keep the default
+        KeyboardInterrupt behaviour.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except NotImplementedError:
+                pass
 
     async def run(self) -> None:
         """
         Run the node indefinitely until interrupted.
 
-        The main loop simply keeps the asyncio event loop running.
+        Waits until SIGINT or SIGTERM is received, then shuts down.
         Discovery and service updates happen via callbacks, and communication
         happens via the TCP server and client mechanisms.
         """
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Shutdown signal received...")
-            await self.shutdown()
+        await self._stop.wait()
+        logger.info("Shutdown signal received...")
+        await self.shutdown()
 
     async def shutdown(self) -> None:
         """
         Gracefully shut down the node.
 
-        Closes the TCP server, unregisters the Zeroconf service, and cleans up
-        all resources.
+        Closes outbound peer connections and the TCP server, unregisters the
+        Zeroconf service, and cleans up all resources.
         """
-        # Close TCP server
+        # Stop the pool reaper, discovery and peer writer tasks, and outbound
+        # connections
+        tasks = list(self.writer_tasks.values()) + list(self._discovery_tasks)
+        if self._reaper_task:
+            tasks.append(self._reaper_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Close TCP server along with any inbound peer connections
         if self.server:
             self.server.close()
+            for writer in list(self.inbound_writers):
+                writer.close()
             await self.server.wait_closed()
             logger.info("TCP server closed")
 
+        # Stop browsing for peers
+        if self.service_browser:
+            await self.service_browser.async_cancel()
+
         # Close Zeroconf
         if self.aiozc:
             await self.aiozc.async_close()
@@ -430,4 +678,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-based event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -27,20 +27,27 @@ Controls:
 
 import asyncio
 import base64
+import ipaddress
 import json
 import logging
 import socket
+import struct
+from binascii import a2b_base64
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import nacl.signing
+from rich.markup import escape
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal
+from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Header, Footer, Input, RichLog, Static
 from textual.app import App
-from zeroconf import IPVersion, ServiceBrowser, ServiceInfo, ServiceStateChange, Zeroconf
-from zeroconf.asyncio import AsyncZeroconf
+from zeroconf import IPVersion, ServiceInfo, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
 # Configure logging (minimal output, mostly for backend errors)
 logger = logging.getLogger(__name__)
@@ -49,6 +56,19 @@ logging.basicConfig(
     format="[%(levelname)-5s] %(message)s",
 )
 
+# Shared compact encoder for wire messages (reused instead of building a new
+# encoder on every json.dumps call with custom separators)
+_WIRE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class MessageArrived(Message):
+    """Posted to the app when a CHAT message is received from a peer."""
+
+    def __init__(self, from_peer: str, content: str) -> None:
+        super().__init__()
+        self.from_peer = from_peer
+        self.content = content
+
 
 class TAZCOMNode:
     """
@@ -60,13 +80,40 @@ class TAZCOMNode:
     Events emitted:
     - peer_added(peer_id, peer_ip, peer_port)
     - peer_removed(peer_id)
-    - message_received(from_peer_id, message_content)
+    - message_received(from_peer_id, message_content), posted as MessageArrived
     """
 
     # Message protocol constants
     MESSAGE_ENCODING = "utf-8"
-    MESSAGE_TERMINATOR = b"\n"
-    MESSAGE_SIZE_LIMIT = 1024
+    # Largest payload accepted; the StreamReader default that bounded
+    # newline-framed messages before frames were length-prefixed
+    MESSAGE_SIZE_LIMIT = 64 * 1024
+    # Every frame is a 4-byte big-endian payload length followed by the payload
+    FRAME_HEADER = struct.Struct(">I")
+    ACK_FRAME = FRAME_HEADER.pack(3) + b"ACK"
+    ERROR_FRAME = FRAME_HEADER.pack(5) + b"ERROR"
+    # Transport write buffer limits; drain() is only awaited past DRAIN_THRESHOLD
+    WRITE_BUFFER_HIGH = 32768
+    WRITE_BUFFER_LOW = 8192
+    DRAIN_THRESHOLD = 16384
+
+    # Local IP address advertised over mDNS, detected once per process
+    _CACHED_LOCAL_IP: Optional[str] = None
+
+    # Every TAZCOM service instance name starts with this
+    SERVICE_NAME_PREFIX = "TAZCOM Node "
+
+    # mDNS events arriving within this window (seconds) are handled together
+    MDNS_COALESCE_DELAY = 0.05
+
+    # How long to wait for a discovered service's records (milliseconds)
+    SERVICE_INFO_TIMEOUT_MS = 3000
+
+    # Outbound connection pool constants
+    POOL_SIZE_PER_PEER = 4
+    POOL_MAX_LIFETIME = 30.0  # seconds a pooled connection may be reused
+    POOL_REAP_INTERVAL = 10.0  # seconds between expired-connection sweeps
+    SEND_TIMEOUT = 5.0  # seconds allowed per peer for connect, send and ACK
 
     def __init__(self, app: "TAZCOMChatApp") -> None:
         """
@@ -79,24 +126,43 @@ class TAZCOMNode:
         self.signing_key: nacl.signing.SigningKey
         self.node_id: nacl.signing.VerifyKey
         self.node_id_b64: str
+        self.node_id_b64_bytes: bytes
+        self.node_id_short: str
         self.tcp_port: int
         self.local_ip: str
-        self.peers: Dict[str, Dict[str, str]] = {}
+        self._local_ip_packed: bytes = b""
+        # peer_id -> {"ip", "port" (int), "name", "addr": (ip, port)}
+        self.peers: Dict[str, Dict[str, Any]] = {}
         self.service_name_to_id: Dict[str, str] = {}
+        # Service names already resolved (plus our own), skipped on re-announce
+        self._seen_names: Set[str] = set()
         self.aiozc: Optional[AsyncZeroconf] = None
-        self.service_browser: Optional[ServiceBrowser] = None
+        self.service_browser: Optional[AsyncServiceBrowser] = None
         self.peers_lock: asyncio.Lock = asyncio.Lock()
-        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
         self.server: Optional[asyncio.Server] = None
+        # Pre-encoded CHAT frame prefix (built once the identity is loaded)
+        self._chat_prefix: bytes = b""
+        # Idle outbound connections: peer_id -> queue of (reader, writer, created_at)
+        self.conn_pool: Dict[str, asyncio.Queue] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
+        # Pending mDNS events: (state_change, zeroconf, service_type, name)
+        self._mdns_events: asyncio.Queue = asyncio.Queue()
+        self._mdns_task: Optional[asyncio.Task] = None
+        # In-flight service resolutions started by _mdns_worker, by name
+        self._resolve_tasks: Dict[str, asyncio.Task] = {}
+        # In-flight broadcasts started by spawn_broadcast()
+        self._broadcast_tasks: Set[asyncio.Task] = set()
+        # Writers of inbound connections, closed on shutdown
+        self.inbound_writers: Set[asyncio.StreamWriter] = set()
 
     def _load_or_create_identity(self) -> None:
         """Load or create Ed25519 cryptographic identity."""
         key_file = Path("node.key")
 
         if key_file.exists():
-            with open(key_file, "r") as f:
-                key_data = json.load(f)
-            key_bytes = base64.b64decode(key_data["signing_key"])
+            # Single read; a2b_base64 skips b64decode's generic argument handling
+            key_data = json.loads(key_file.read_bytes())
+            key_bytes = a2b_base64(key_data["signing_key"])
             self.signing_key = nacl.signing.SigningKey(key_bytes)
         else:
             self.signing_key = nacl.signing.SigningKey.generate()
@@ -108,10 +174,77 @@ class TAZCOMNode:
                 json.dump(key_data, f, indent=2)
 
         self.node_id = self.signing_key.verify_key
-        self.node_id_b64 = (
-            base64.urlsafe_b64encode(bytes(self.node_id)).decode().rstrip("=")
+        # Keep the ASCII bytes too, so frame templates need no re-encoding
+        self.node_id_b64_bytes = base64.urlsafe_b64encode(
+            bytes(self.node_id)
+        ).rstrip(b"=")
+        self.node_id_b64 = self.node_id_b64_bytes.decode("ascii")
+        # Short form used in service names and the UI
+        self.node_id_short = self.node_id_b64[:8]
+        self._build_frame_templates()
+
+    def _build_frame_templates(self) -> None:
+        """
+        Pre-encode the parts of outgoing frames that depend only on our ID.
+
+        Every CHAT frame starts with the same type/from prefix, so only the
+        timestamp and content are encoded per message.
+        """
+        # URL-safe base64 needs no JSON escaping, so the ID bytes go in as-is
+        self._chat_prefix = (
+            b'{"type":"CHAT","from":"' + self.node_id_b64_bytes + b'","timestamp":'
+        )
+
+    def _encode_chat(self, content: str, timestamp: str) -> bytes:
+        """
+        Encode a CHAT frame for the given content.
+
+        Args:
+            content: The message content.
+            timestamp: ISO 8601 send time (contains nothing JSON must escape).
+
+        Returns:
+            The length-prefixed JSON frame.
+        """
+        body = _WIRE_ENCODER.encode(content)
+        return self._frame(
+            self._chat_prefix
+            + f'"{timestamp}","content":{body}}}'.encode(self.MESSAGE_ENCODING)
         )
 
+    @classmethod
+    def _frame(cls, payload: bytes) -> bytes:
+        """
+        Prefix a payload with its length header.
+
+        Args:
+            payload: The encoded message.
+
+        Returns:
+            The frame ready to be written to a stream.
+        """
+        return cls.FRAME_HEADER.pack(len(payload)) + payload
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Read one length-prefixed frame from a stream.
+
+        Args:
+            reader: The stream to read from.
+
+        Returns:
+            The frame payload, or None if the announced length exceeds
+            MESSAGE_SIZE_LIMIT.
+
+        Raises:
+            asyncio.IncompleteReadError: If the stream ends mid-frame.
+        """
+        header = await reader.readexactly(self.FRAME_HEADER.size)
+        (length,) = self.FRAME_HEADER.unpack(header)
+        if length > self.MESSAGE_SIZE_LIMIT:
+            return None
+        return await reader.readexactly(length)
+
     def _find_available_port(self) -> int:
         """Find an available TCP port."""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -121,7 +254,40 @@ class TAZCOMNode:
         return port
 
     def _get_local_ip(self) -> str:
-        """Determine the local IP address."""
+        """
+        Determine the local IP address to advertise over mDNS.
+
+        The server listens on all interfaces, so this address is only used
+        for the service announcement. It is cached for the lifetime of the
+        process.
+        """
+        if TAZCOMNode._CACHED_LOCAL_IP is None:
+            TAZCOMNode._CACHED_LOCAL_IP = (
+                self._get_hostname_ip() or self._get_routed_ip()
+            )
+        return TAZCOMNode._CACHED_LOCAL_IP
+
+    @staticmethod
+    def _get_hostname_ip() -> Optional[str]:
+        """
+        Resolve the machine's hostname to a usable IPv4 address.
+
+        Returns:
+            The address, or None if the hostname does not resolve or maps to
+            a loopback/link-local address (common in /etc/hosts).
+        """
+        try:
+            ip = socket.gethostbyname(socket.gethostname())
+        except OSError:
+            return None
+        address = ipaddress.IPv4Address(ip)
+        if address.is_loopback or address.is_link_local:
+            return None
+        return ip
+
+    @staticmethod
+    def _get_routed_ip() -> str:
+        """Determine the local IP address from the routing table."""
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             s.connect(("8.8.8.8", 80))
@@ -133,59 +299,101 @@ class TAZCOMNode:
 
     async def initialize(self) -> None:
         """Initialize the node: identity, port, Zeroconf, and TCP server."""
-        self.event_loop = asyncio.get_event_loop()
         self._load_or_create_identity()
         self.tcp_port = self._find_available_port()
         self.local_ip = self._get_local_ip()
+        self._local_ip_packed = socket.inet_aton(self.local_ip)
 
         await self._start_tcp_server()
         await self._setup_zeroconf()
+        self._reaper_task = asyncio.create_task(self._reap_pool())
+        self._mdns_task = asyncio.create_task(self._mdns_worker())
 
     async def _start_tcp_server(self) -> None:
-        """Start the TCP server."""
+        """
+        Start the TCP server.
+
+        Listens on all interfaces so peers can reach us via any NIC
+        (including loopback), not just the address advertised over mDNS.
+        """
         self.server = await asyncio.start_server(
-            self.handle_connection, self.local_ip, self.tcp_port
+            self.handle_connection, "0.0.0.0", self.tcp_port, reuse_address=True
         )
 
+    def _configure_connection(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Tune a new connection for small, frequent frames.
+
+        Sets the transport's write buffer limits used by _write_frame().
+        asyncio already disables Nagle's algorithm on TCP connections, so
+        frames are sent immediately without a setsockopt() here.
+        """
+        writer.transport.set_write_buffer_limits(
+            high=self.WRITE_BUFFER_HIGH, low=self.WRITE_BUFFER_LOW
+        )
+
+    async def _write_frame(self, writer: asyncio.StreamWriter, frame: bytes) -> None:
+        """
+        Write a frame, awaiting drain() only when the buffer is filling up.
+
+        A small frame fits in the transport buffer, so yielding to the loop
+        after every write buys nothing.
+
+        Args:
+            writer: The connection to write to.
+            frame: The encoded frame.
+        """
+        writer.write(frame)
+        if writer.transport.get_write_buffer_size() > self.DRAIN_THRESHOLD:
+            await writer.drain()
+
     async def handle_connection(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
-        """Handle incoming TCP connection."""
+        """
+        Handle incoming TCP connection.
+
+        Peers keep pooled connections open, so frames are read until the
+        peer closes its end.
+        """
         addr = writer.get_extra_info("peername")
+        self._configure_connection(writer)
+        self.inbound_writers.add(writer)
         try:
-            data = await reader.readuntil(self.MESSAGE_TERMINATOR)
+            while True:
+                try:
+                    data = await self._read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break  # Peer closed the connection
+
+                if data is None:
+                    logger.warning(f"Message from {addr} exceeds size limit")
+                    break
 
-            if data:
-                message_json = data.decode(self.MESSAGE_ENCODING).strip()
                 try:
-                    message = json.loads(message_json)
+                    # json.loads accepts UTF-8 bytes directly
+                    message = json.loads(data)
                     msg_type = message.get("type")
 
-                    if msg_type == "HELLO":
-                        # HELLO message: just send ACK
-                        writer.write(b"ACK\n")
-                        await writer.drain()
-
-                    elif msg_type == "CHAT":
-                        # CHAT message: emit to UI and send ACK
+                    if msg_type == "CHAT":
+                        # CHAT message: post to the UI's message queue and ACK
+                        # right away; rendering happens in the app's handler
                         from_peer = message.get("from", "Unknown")
                         content = message.get("content", "")
-                        self.app.on_message_received(from_peer, content)
-                        writer.write(b"ACK\n")
-                        await writer.drain()
+                        self.app.post_message(MessageArrived(from_peer, content))
+
+                    # Other types (e.g. HELLO from older peers) are just
+                    # acknowledged so the sender never waits for a reply
+                    await self._write_frame(writer, self.ACK_FRAME)
 
                 except json.JSONDecodeError:
                     # Invalid JSON, send error ACK
-                    writer.write(b"ERROR\n")
-                    await writer.drain()
+                    await self._write_frame(writer, self.ERROR_FRAME)
 
-        except asyncio.LimitOverrunError:
-            logger.warning(f"Message from {addr} exceeds size limit")
-            writer.close()
-            await writer.wait_closed()
         except Exception as e:
             logger.warning(f"Error handling connection from {addr}: {e}")
         finally:
+            self.inbound_writers.discard(writer)
             writer.close()
             await writer.wait_closed()
 
@@ -199,13 +407,14 @@ class TAZCOMNode:
             "p": str(self.tcp_port),
         }
 
-        node_id_short = self.node_id_b64[:8]
-        service_name = f"TAZCOM Node {node_id_short}._tazcom._tcp.local."
+        node_id_short = self.node_id_short
+        service_name = f"{self.SERVICE_NAME_PREFIX}{node_id_short}._tazcom._tcp.local."
+        self._seen_names.add(service_name)
 
         info = ServiceInfo(
             "_tazcom._tcp.local.",
             service_name,
-            addresses=[socket.inet_aton(self.local_ip)],
+            addresses=[self._local_ip_packed],
             port=self.tcp_port,
             properties=properties,
             server=f"tazcom-{node_id_short}.local.",
@@ -213,7 +422,7 @@ class TAZCOMNode:
 
         await self.aiozc.async_register_service(info)
 
-        self.service_browser = ServiceBrowser(
+        self.service_browser = AsyncServiceBrowser(
             self.aiozc.zeroconf,
             "_tazcom._tcp.local.",
             handlers=[self._on_service_state_change],
@@ -226,26 +435,84 @@ class TAZCOMNode:
         name: str,
         state_change: ServiceStateChange,
     ) -> None:
-        """Handle service state changes."""
-        if self.event_loop is None:
+        """
+        Handle service state changes.
+
+        AsyncServiceBrowser invokes this on the event loop. Names without the
+        TAZCOM prefix are dropped; other Added/Removed events are queued for
+        _mdns_worker.
+        """
+        if not name.startswith(self.SERVICE_NAME_PREFIX):
             return
 
-        if state_change == ServiceStateChange.Added:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_added(zeroconf, service_type, name), self.event_loop
-            )
-        elif state_change == ServiceStateChange.Removed:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_removed(name), self.event_loop
-            )
+        if state_change in (ServiceStateChange.Added, ServiceStateChange.Removed):
+            self._mdns_events.put_nowait((state_change, zeroconf, service_type, name))
+
+    async def _mdns_worker(self) -> None:
+        """
+        Apply queued mDNS events in coalesced batches.
+
+        After the first event arrives, the worker waits MDNS_COALESCE_DELAY
+        for more, then keeps only the last state per service name. A service
+        that flaps within the window therefore costs at most one update.
+        Added events for names that are already resolved are skipped, unless
+        the same batch also removed the name: the service may have come back
+        with a new address, so it is resolved again. Removed events for
+        unknown peers are skipped.
+
+        Resolutions run as tracked background tasks, so one slow service
+        does not hold up the next batch; a Removed event cancels the name's
+        pending resolution.
+        """
+        while True:
+            events = [await self._mdns_events.get()]
+            await asyncio.sleep(self.MDNS_COALESCE_DELAY)
+            while not self._mdns_events.empty():
+                events.append(self._mdns_events.get_nowait())
+
+            latest = {event[3]: event for event in events}
+            removed = {
+                event[3] for event in events if event[0] == ServiceStateChange.Removed
+            }
+
+            for state_change, zeroconf, service_type, name in latest.values():
+                if state_change == ServiceStateChange.Added:
+                    if name in self._resolve_tasks:
+                        if name not in removed:
+                            continue
+                        self._resolve_tasks.pop(name).cancel()
+                    elif name in self._seen_names and name not in removed:
+                        continue
+                    self._spawn_resolve(zeroconf, service_type, name)
+                else:
+                    task = self._resolve_tasks.pop(name, None)
+                    if task is not None:
+                        task.cancel()
+                    if name in self.service_name_to_id:
+                        await self._on_service_removed(name)
+
+    def _spawn_resolve(
+        self, zeroconf: Zeroconf, service_type: str, name: str
+    ) -> None:
+        """Resolve a discovered service in a tracked background task."""
+        task = asyncio.create_task(
+            self._on_service_added(zeroconf, service_type, name)
+        )
+        self._resolve_tasks[name] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if self._resolve_tasks.get(name) is finished:
+                del self._resolve_tasks[name]
+
+        task.add_done_callback(_done)
 
     async def _on_service_added(
         self, zeroconf: Zeroconf, service_type: str, name: str
     ) -> None:
         """Handle peer discovery."""
         try:
-            info = zeroconf.get_service_info(service_type, name)
-            if info is None:
+            info = AsyncServiceInfo(service_type, name)
+            if not await info.async_request(zeroconf, self.SERVICE_INFO_TIMEOUT_MS):
                 return
 
             properties = info.properties or {}
@@ -261,24 +528,31 @@ class TAZCOMNode:
             if peer_id == self.node_id_b64:
                 return
 
-            addresses = [socket.inet_ntoa(addr) for addr in info.addresses]
-            peer_ip = addresses[0] if addresses else "unknown"
+            # Only the first address is used, so only that one is converted
+            addresses = info.addresses
+            peer_ip = socket.inet_ntoa(addresses[0]) if addresses else "unknown"
             peer_port = info.port
 
             async with self.peers_lock:
+                # A re-announced name may now belong to a different identity
+                old_peer_id = self.service_name_to_id.get(name)
+                if old_peer_id is not None and old_peer_id != peer_id:
+                    self.peers.pop(old_peer_id, None)
+                    self._drop_pool(old_peer_id)
                 self.peers[peer_id] = {
                     "ip": peer_ip,
-                    "port": str(peer_port),
+                    "port": peer_port,
                     "name": name,
+                    "addr": (peer_ip, peer_port),
                 }
                 self.service_name_to_id[name] = peer_id
+                self._seen_names.add(name)
 
-            # Notify UI of peer addition
+            # Notify UI of peer addition. No HELLO is sent: mDNS already told
+            # both sides about each other, and the first CHAT opens the
+            # pooled connection.
             self.app.on_peer_update()
 
-            # Send HELLO to new peer
-            await self.send_hello(peer_id)
-
         except Exception as e:
             logger.warning(f"Error processing service addition: {e}")
 
@@ -286,92 +560,218 @@ class TAZCOMNode:
         """Handle peer removal."""
         async with self.peers_lock:
             peer_id = self.service_name_to_id.pop(name, None)
+            self._seen_names.discard(name)
             if peer_id and peer_id in self.peers:
                 del self.peers[peer_id]
 
+        if peer_id:
+            self._drop_pool(peer_id)
+
         # Notify UI of peer removal
         self.app.on_peer_update()
 
-    async def send_hello(self, peer_id: str) -> None:
-        """Send a HELLO greeting to a peer."""
+    async def broadcast_message(self, content: str) -> None:
+        """
+        Broadcast a CHAT message to all discovered peers.
+
+        Args:
+            content: The message content to broadcast.
+        """
         async with self.peers_lock:
-            peer_info = self.peers.get(peer_id)
-            if not peer_info:
-                return
-            peer_ip = peer_info["ip"]
-            peer_port = int(peer_info["port"])
+            peer_list = list(self.peers.items())
 
-        try:
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
-            hello_message = {
-                "type": "HELLO",
-                "from": self.node_id_b64,
-            }
-            message_json = json.dumps(hello_message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+        # One timestamp and one encode per message; every peer receives the
+        # same frame
+        timestamp = datetime.now().isoformat()
+        message_bytes = self._encode_chat(content, timestamp)
+        if len(message_bytes) - self.FRAME_HEADER.size > self.MESSAGE_SIZE_LIMIT:
+            logger.warning("Message exceeds size limit, not sent")
+            return
 
-            writer.write(message_bytes)
-            await writer.drain()
+        # Send to all peers concurrently; failures are logged per peer
+        await asyncio.gather(
+            *(
+                self._send_chat_message(peer_id, peer_info, message_bytes)
+                for peer_id, peer_info in peer_list
+            ),
+            return_exceptions=True,
+        )
 
-            ack_data = await reader.readuntil(self.MESSAGE_TERMINATOR)
-            writer.close()
-            await writer.wait_closed()
+    def spawn_broadcast(self, content: str) -> None:
+        """
+        Run broadcast_message() as a background task.
+
+        The caller returns immediately; the task is kept until completion
+        so it is not garbage-collected mid-flight.
+
+        Args:
+            content: The message content to broadcast.
+        """
+        task = asyncio.create_task(self.broadcast_message(content))
+        self._broadcast_tasks.add(task)
+        task.add_done_callback(self._broadcast_tasks.discard)
+
+    async def _send_chat_message(
+        self, peer_id: str, peer_info: Dict[str, Any], message_bytes: bytes
+    ) -> None:
+        """
+        Send an encoded CHAT frame to a specific peer.
 
+        Args:
+            peer_id: The public key ID of the target peer.
+            peer_info: The peer's entry from self.peers.
+            message_bytes: The frame produced by _encode_chat().
+        """
+        peer_ip, peer_port = peer_info["addr"]
+
+        try:
+            # One slow or silent peer must not stall the whole broadcast
+            await asyncio.wait_for(
+                self._send_frame(peer_id, peer_ip, peer_port, message_bytes),
+                timeout=self.SEND_TIMEOUT,
+            )
         except (ConnectionRefusedError, asyncio.TimeoutError):
-            pass  # Silently handle connection issues
+            pass
         except Exception as e:
-            logger.debug(f"Error sending HELLO to {peer_id}: {e}")
+            logger.debug(f"Error sending CHAT to {peer_id}: {e}")
 
-    async def broadcast_message(self, content: str) -> None:
+    # ========== Connection Pool ==========
+
+    async def _send_frame(
+        self, peer_id: str, peer_ip: str, peer_port: int, message_bytes: bytes
+    ) -> bytes:
         """
-        Broadcast a CHAT message to all discovered peers.
+        Send one framed message over a pooled connection and await the reply.
+
+        The connection is returned to the pool on success and closed on any
+        error, so a broken socket is never reused.
 
         Args:
-            content: The message content to broadcast.
+            peer_id: The public key ID of the target peer.
+            peer_ip: The peer's IP address.
+            peer_port: The peer's TCP port.
+            message_bytes: The encoded, length-prefixed frame.
+
+        Returns:
+            The payload of the peer's reply (e.g. b"ACK").
         """
-        async with self.peers_lock:
-            peer_list = list(self.peers.items())
+        conn = await self._acquire(peer_id, peer_ip, peer_port)
+        reader, writer, _ = conn
+        try:
+            # Waiting for the ACK provides backpressure on pooled connections
+            await self._write_frame(writer, message_bytes)
+            ack_data = await self._read_frame(reader)
+            if ack_data is None:
+                raise ValueError(f"Oversized reply from {peer_id}")
+        except BaseException:
+            writer.close()
+            raise
 
-        for peer_id, peer_info in peer_list:
-            asyncio.create_task(
-                self._send_chat_message(peer_id, peer_info, content)
-            )
+        self._release(peer_id, conn)
+        return ack_data
 
-    async def _send_chat_message(
-        self, peer_id: str, peer_info: Dict[str, str], content: str
+    async def _acquire(
+        self, peer_id: str, peer_ip: str, peer_port: int
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]:
+        """
+        Take an idle connection to a peer from the pool, or open a new one.
+
+        Pooled connections that were closed by the peer or have outlived
+        POOL_MAX_LIFETIME are discarded.
+
+        Args:
+            peer_id: The public key ID of the target peer.
+            peer_ip: The peer's IP address.
+            peer_port: The peer's TCP port.
+
+        Returns:
+            A (reader, writer, created_at) connection tuple.
+        """
+        now = asyncio.get_running_loop().time()
+        pool = self.conn_pool.get(peer_id)
+        while pool is not None and not pool.empty():
+            reader, writer, created_at = pool.get_nowait()
+            if (
+                writer.is_closing()
+                or reader.at_eof()
+                or now - created_at > self.POOL_MAX_LIFETIME
+            ):
+                writer.close()
+                continue
+            return reader, writer, created_at
+
+        reader, writer = await asyncio.open_connection(peer_ip, peer_port)
+        self._configure_connection(writer)
+        return reader, writer, now
+
+    def _release(
+        self,
+        peer_id: str,
+        conn: Tuple[asyncio.StreamReader, asyncio.StreamWriter, float],
     ) -> None:
-        """Send a CHAT message to a specific peer."""
-        peer_ip = peer_info["ip"]
-        peer_port = int(peer_info["port"])
+        """
+        Return a healthy connection to the peer's pool.
 
-        try:
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
+        The connection is closed instead if the pool is already full.
 
-            chat_message = {
-                "type": "CHAT",
-                "from": self.node_id_b64,
-                "timestamp": datetime.now().isoformat(),
-                "content": content,
-            }
-            message_json = json.dumps(chat_message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+        Args:
+            peer_id: The public key ID of the peer.
+            conn: The (reader, writer, created_at) tuple from _acquire().
+        """
+        pool = self.conn_pool.get(peer_id)
+        if pool is None:
+            pool = asyncio.Queue(maxsize=self.POOL_SIZE_PER_PEER)
+            self.conn_pool[peer_id] = pool
+        try:
+            pool.put_nowait(conn)
+        except asyncio.QueueFull:
+            conn[1].close()
 
-            writer.write(message_bytes)
-            await writer.drain()
+    def _drop_pool(self, peer_id: str) -> None:
+        """
+        Close all idle connections to a peer and forget its pool.
 
-            ack_data = await reader.readuntil(self.MESSAGE_TERMINATOR)
+        Args:
+            peer_id: The public key ID of the peer.
+        """
+        pool = self.conn_pool.pop(peer_id, None)
+        while pool is not None and not pool.empty():
+            _, writer, _ = pool.get_nowait()
             writer.close()
-            await writer.wait_closed()
 
-        except (ConnectionRefusedError, asyncio.TimeoutError):
-            pass
-        except Exception as e:
-            logger.debug(f"Error sending CHAT to {peer_id}: {e}")
+    async def _reap_pool(self) -> None:
+        """Periodically close pooled connections past POOL_MAX_LIFETIME."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.POOL_REAP_INTERVAL)
+            now = loop.time()
+            for pool in list(self.conn_pool.values()):
+                for _ in range(pool.qsize()):
+                    reader, writer, created_at = pool.get_nowait()
+                    if writer.is_closing() or now - created_at > self.POOL_MAX_LIFETIME:
+                        writer.close()
+                    else:
+                        pool.put_nowait((reader, writer, created_at))
 
     async def shutdown(self) -> None:
         """Gracefully shut down the node."""
+        for task in (self._reaper_task, self._mdns_task):
+            if task:
+                task.cancel()
+        for task in list(self._resolve_tasks.values()):
+            task.cancel()
+        for task in list(self._broadcast_tasks):
+            task.cancel()
+        for peer_id in list(self.conn_pool):
+            self._drop_pool(peer_id)
+
+        if self.service_browser:
+            await self.service_browser.async_cancel()
+
         if self.server:
             self.server.close()
+            for writer in list(self.inbound_writers):
+                writer.close()
             await self.server.wait_closed()
 
         if self.aiozc:
@@ -381,59 +781,112 @@ class TAZCOMNode:
 class HeaderWidget(Static):
     """Header showing node ID and status."""
 
-    def __init__(self, node_id: str, node_ip: str, node_port: int) -> None:
+    def __init__(self, node_id_short: str, node_ip: str, node_port: int) -> None:
         super().__init__()
-        self.node_id = node_id[:8]
+        self.node_id = node_id_short
         self.node_ip = node_ip
         self.node_port = node_port
+        # None of the fields change, so the markup is built once
+        self._markup = (
+            f"[bold cyan]TAZCOM Chat[/bold cyan] | Node: [yellow]{self.node_id}[/yellow]"
+            f" | {self.node_ip}:{self.node_port}"
+        )
 
     def render(self) -> str:
         """Render the header."""
-        return f"[bold cyan]TAZCOM Chat[/bold cyan] | Node: [yellow]{self.node_id}[/yellow] | {self.node_ip}:{self.node_port}"
+        return self._markup
 
 
 class PeerListWidget(Static):
     """Display list of discovered peers."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    EMPTY_MARKUP = "[dim]No peers discovered[/dim]"
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
         self.peers: Dict[str, str] = {}  # peer_id -> display_name
+        # Markup returned by render(), rebuilt only when the peer set changes
+        self._cached_render: str = self.EMPTY_MARKUP
+        self._last_keys: frozenset = frozenset()
+
+    def update_peers(self, peers: Dict[str, Dict[str, Any]]) -> None:
+        """Update the peer list, re-rendering only if the peer set changed."""
+        new_keys = frozenset(peers)
+        if new_keys == self._last_keys:
+            return
+        self._last_keys = new_keys
 
-    def update_peers(self, peers: Dict[str, Dict[str, str]]) -> None:
-        """Update the peer list."""
-        self.peers = {pid: pid[:8] for pid in peers.keys()}
+        self.peers = {pid: pid[:8] for pid in sorted(new_keys)}
+        if self.peers:
+            peer_lines = [f"[green]●[/green] {name}" for name in self.peers.values()]
+            self._cached_render = "[bold]Peers:[/bold]\n" + "\n".join(peer_lines)
+        else:
+            self._cached_render = self.EMPTY_MARKUP
         self.refresh()
 
     def render(self) -> str:
         """Render the peer list."""
-        if not self.peers:
-            return "[dim]No peers discovered[/dim]"
-
-        peer_lines = [f"[green]●[/green] {name}" for name in self.peers.values()]
-        return "[bold]Peers:[/bold]\n" + "\n".join(peer_lines)
+        return self._cached_render
 
 
 class MessageHistoryWidget(RichLog):
-    """Display chat message history."""
+    """
+    Display chat message history.
 
-    def __init__(self) -> None:
-        super().__init__()
+    The log keeps at most MAX_LINES lines. Lines added within one
+    FLUSH_DELAY window (about a frame at 60 fps) are written together.
+    """
+
+    MAX_LINES = 1000
+    FLUSH_DELAY = 0.016
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(
+            max_lines=self.MAX_LINES, highlight=False, markup=True, **kwargs
+        )
         self.message_count = 0
+        # Lines waiting for the next flush
+        self._pending: List[Text] = []
+        self._flush_timer: Optional[Timer] = None
 
     def add_local_message(self, content: str) -> None:
         """Add a message sent by this node."""
-        self.write(f"[bold cyan]You:[/bold cyan] {content}")
+        self._enqueue(f"[bold cyan]You:[/bold cyan] {escape(content)}")
         self.message_count += 1
 
     def add_remote_message(self, from_peer: str, content: str) -> None:
         """Add a message received from a peer."""
-        peer_short = from_peer[:8]
-        self.write(f"[bold green]{peer_short}:[/bold green] {content}")
+        peer_short = escape(from_peer[:8])
+        self._enqueue(f"[bold green]{peer_short}:[/bold green] {escape(content)}")
         self.message_count += 1
 
     def add_system_message(self, content: str) -> None:
         """Add a system message."""
-        self.write(f"[dim]{content}[/dim]")
+        self._enqueue(f"[dim]{content}[/dim]")
+
+    def _enqueue(self, markup: str) -> None:
+        """
+        Buffer a line and schedule a flush if none is pending.
+
+        Each line is parsed on its own, so a tag left open in one message
+        cannot style the lines written with it.
+        """
+        self._pending.append(Text.from_markup(markup))
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(self.FLUSH_DELAY, self._flush)
+
+    def _flush(self) -> None:
+        """Write all buffered lines with a single write()."""
+        self._flush_timer = None
+        if self._pending:
+            lines, self._pending = self._pending, []
+            self.write(Text("\n").join(lines))
+
+    def on_unmount(self) -> None:
+        """Cancel a pending flush when the widget is removed."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
 
 
 class TAZCOMChatApp(App):
@@ -443,6 +896,9 @@ class TAZCOMChatApp(App):
         ("ctrl+c", "quit", "Quit"),
     ]
 
+    # Peer list updates arriving within this window (seconds) share one render
+    PEER_REFRESH_DELAY = 0.1
+
     CSS = """
     Screen {
         layout: vertical;
@@ -491,6 +947,8 @@ class TAZCOMChatApp(App):
         self.peer_list: Optional[PeerListWidget] = None
         self.message_history: Optional[MessageHistoryWidget] = None
         self.input_widget: Optional[Input] = None
+        # Pending coalesced peer list refresh, if any
+        self._peer_refresh_handle: Optional[asyncio.TimerHandle] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -523,11 +981,11 @@ class TAZCOMChatApp(App):
         await self.node.initialize()
 
         # Update header with node info
-        self.title = f"TAZCOM Chat - {self.node.node_id_b64[:8]}"
+        self.title = f"TAZCOM Chat - {self.node.node_id_short}"
 
         # Show initial message
         self.message_history.add_system_message(
-            f"[bold]Node initialized:[/bold] {self.node.node_id_b64[:8]} @ "
+            f"[bold]Node initialized:[/bold] {self.node.node_id_short} @ "
             f"{self.node.local_ip}:{self.node.tcp_port}"
         )
 
@@ -549,21 +1007,43 @@ class TAZCOMChatApp(App):
         # Display local message
         self.message_history.add_local_message(content)
 
-        # Broadcast to peers
-        await self.node.broadcast_message(content)
+        # Broadcast to peers without blocking the input handler
+        self.node.spawn_broadcast(content)
 
     def on_peer_update(self) -> None:
-        """Called by backend when peer list changes."""
+        """
+        Called by backend when peer list changes.
+
+        Bursts of mDNS events are coalesced: the refresh runs once,
+        PEER_REFRESH_DELAY seconds after the first update.
+        """
+        if not (self.node and self.peer_list):
+            return
+        if self._peer_refresh_handle is not None:
+            return
+        self._peer_refresh_handle = asyncio.get_running_loop().call_later(
+            self.PEER_REFRESH_DELAY, self._do_peer_refresh
+        )
+
+    def _do_peer_refresh(self) -> None:
+        """Push the current peers to the peer list widget."""
+        self._peer_refresh_handle = None
         if self.node and self.peer_list:
             self.peer_list.update_peers(self.node.peers)
 
+    def on_message_arrived(self, event: MessageArrived) -> None:
+        """Handle a MessageArrived posted by the backend."""
+        self.on_message_received(event.from_peer, event.content)
+
     def on_message_received(self, from_peer: str, content: str) -> None:
-        """Called by backend when a message is received."""
+        """Display a message received from a peer."""
         if self.message_history:
             self.message_history.add_remote_message(from_peer, content)
 
     async def action_quit(self) -> None:
         """Gracefully shut down."""
+        if self._peer_refresh_handle is not None:
+            self._peer_refresh_handle.cancel()
         if self.node:
             await self.node.shutdown()
         self.exit()
@@ -32,11 +32,15 @@ import base64
 import hashlib
 import json
 import logging
+import random
 import socket
-from collections import deque
+import struct
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Coroutine, Deque, Dict, List, Optional, Set, Tuple
 
 import nacl.signing
 from textual.app import App, ComposeResult
@@ -52,6 +56,23 @@ logging.basicConfig(
     format="[%(levelname)-5s] %(message)s",
 )
 
+# Shared compact encoder for wire messages (reused instead of building a new
+# encoder on every json.dumps call with custom separators)
+_WIRE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass
+class Peer:
+    """A discovered peer: its address and Zeroconf service name."""
+
+    # Explicit slots keep per-peer records small (dataclass(slots=True)
+    # requires Python 3.10)
+    __slots__ = ("ip", "port", "name")
+
+    ip: str
+    port: int
+    name: str
+
 
 class TAZCOMNodeGossip:
     """
@@ -65,12 +86,23 @@ class TAZCOMNodeGossip:
 
     # Message protocol constants
     MESSAGE_ENCODING = "utf-8"
-    MESSAGE_TERMINATOR = b"\n"
-    MESSAGE_SIZE_LIMIT = 1024
+    # Every frame is a 2-byte big-endian payload length followed by the payload
+    FRAME_HEADER = struct.Struct(">H")
+    # Largest payload the frame header can describe
+    MESSAGE_SIZE_LIMIT = 0xFFFF
+    ACK_FRAME = FRAME_HEADER.pack(3) + b"ACK"
+    ERROR_FRAME = FRAME_HEADER.pack(5) + b"ERROR"
+    # msg_id key as written by _WIRE_ENCODER, used by _peek_msg_id()
+    _MSG_ID_KEY = b'"msg_id":"'
 
     # Gossip protocol constants
     INITIAL_TTL = 3  # How many hops a message can make
-    SEEN_MESSAGES_MAX_SIZE = 1000  # Max messages to track (circular buffer)
+    GOSSIP_FANOUT = 6  # Max peers a received message is forwarded to
+    SEEN_MESSAGES_MAX_SIZE = 1000  # Max messages to track
+    SEEN_MESSAGES_TTL = 60.0  # seconds a msg_id is remembered
+    MAX_CONCURRENT_SENDS = 32  # Bound on in-flight outbound sends
+    ACK_TIMEOUT = 2.0  # seconds to wait for a peer's ACK
+    CONNECT_TIMEOUT = 3.0  # seconds to wait for a peer to accept a connection
 
     def __init__(self, app: "TAZCOMChatAppGossip") -> None:
         """
@@ -85,16 +117,179 @@ class TAZCOMNodeGossip:
         self.node_id_b64: str
         self.tcp_port: int
         self.local_ip: str
-        self.peers: Dict[str, Dict[str, str]] = {}
+        # Immutable (peer_id, peer) view of peers for the send paths,
+        # republished whenever membership changes
+        self._peers_snapshot: Tuple[Tuple[str, Peer], ...] = ()
+        self.peers = {}
         self.service_name_to_id: Dict[str, str] = {}
+        # Peer IDs advertised at each IP (several nodes may share one host)
+        self.ip_to_peers: Dict[str, Set[str]] = {}
         self.aiozc: Optional[AsyncZeroconf] = None
         self.service_browser: Optional[ServiceBrowser] = None
+        # Running discovery handlers scheduled from Zeroconf's thread
+        self._discovery_tasks: Set[asyncio.Task] = set()
+        # Guards mutations of peers, service_name_to_id and ip_to_peers only.
+        # It must never be held across network I/O (open_connection, drain,
+        # reads); senders read _peers_snapshot or peers without it.
         self.peers_lock: asyncio.Lock = asyncio.Lock()
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
         self.server: Optional[asyncio.Server] = None
 
         # Gossip protocol state
-        self.seen_messages: deque = deque(maxlen=self.SEEN_MESSAGES_MAX_SIZE)
+        # msg_id -> monotonic arrival time, oldest first
+        self.seen_messages: "OrderedDict[str, float]" = OrderedDict()
+
+        # Outbound fan-out state
+        self._send_sem: asyncio.Semaphore = asyncio.Semaphore(
+            self.MAX_CONCURRENT_SENDS
+        )
+        self._fanout_tasks: Set[asyncio.Future] = set()
+
+        # Persistent outbound connections: peer_id -> (reader, writer)
+        self.conns: Dict[str, Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = {}
+        self.conn_locks: Dict[str, asyncio.Lock] = {}
+        # Per-connection reply waiters (None: reply not awaited) and readers
+        self.pending_acks: Dict[str, Deque[Optional[asyncio.Future]]] = {}
+        self.reply_tasks: Dict[str, asyncio.Task] = {}
+        # Writers of inbound connections, closed on shutdown
+        self.inbound_writers: Set[asyncio.StreamWriter] = set()
+
+    @property
+    def peers(self) -> Dict[str, Peer]:
+        """Discovered peers, keyed by peer_id."""
+        return self._peers
+
+    @peers.setter
+    def peers(self, peers: Dict[str, Peer]) -> None:
+        self._peers = peers
+        self._publish_peers()
+
+    def _publish_peers(self) -> None:
+        """
+        Rebuild the peer snapshot read by broadcast and forwarding.
+
+        Must be called after every in-place change to peers; the senders
+        read the snapshot without taking peers_lock.
+        """
+        self._peers_snapshot = tuple(self._peers.items())
+
+    def _mark_seen(self, msg_id: str) -> None:
+        """
+        Record a msg_id in the seen cache with its arrival time.
+
+        Args:
+            msg_id: The message identifier to remember
+        """
+        now = time.monotonic()
+        self.seen_messages[msg_id] = now
+        self._evict_seen(now)
+
+    def _evict_seen(self, now: float) -> None:
+        """
+        Drop the oldest seen ids beyond SEEN_MESSAGES_MAX_SIZE or older
+        than SEEN_MESSAGES_TTL.
+
+        Entries are kept in arrival order, so eviction only ever pops from
+        the front.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        seen = self.seen_messages
+        cutoff = now - self.SEEN_MESSAGES_TTL
+        while seen and (
+            len(seen) > self.SEEN_MESSAGES_MAX_SIZE
+            or next(iter(seen.values())) < cutoff
+        ):
+            seen.popitem(last=False)
+
+    def _spawn_fanout(self, coros: List[Coroutine[Any, Any, None]]) -> None:
+        """
+        Run a batch of per-peer sends as one gathered background future.
+
+        The caller returns immediately; the future is kept until completion
+        so the batch is not garbage-collected mid-flight.
+
+        Args:
+            coros: Send coroutines, one per target peer
+        """
+        if not coros:
+            return
+        batch = asyncio.gather(*coros, return_exceptions=True)
+        self._fanout_tasks.add(batch)
+        batch.add_done_callback(self._fanout_tasks.discard)
+
+    @classmethod
+    def _encode_frame(cls, message: dict) -> bytes:
+        """
+        Encode a message as a length-prefixed wire frame.
+
+        Header and payload are joined here, once per message, and the same
+        bytes object is written to every peer. A per-send writelines() of
+        the two parts would not save that join: the selector transport
+        concatenates its buffers itself, so it would happen once per peer.
+
+        Args:
+            message: The message to serialize
+
+        Returns:
+            The encoded frame
+
+        Raises:
+            ValueError: If the payload exceeds MESSAGE_SIZE_LIMIT
+        """
+        payload = _WIRE_ENCODER.encode(message).encode(cls.MESSAGE_ENCODING)
+        if len(payload) > cls.MESSAGE_SIZE_LIMIT:
+            raise ValueError(f"Message of {len(payload)} bytes exceeds size limit")
+        return cls.FRAME_HEADER.pack(len(payload)) + payload
+
+    @classmethod
+    def _peek_msg_id(cls, payload: bytes) -> Optional[str]:
+        """
+        Extract msg_id from a compact JSON payload without parsing it.
+
+        A JSON string value cannot contain an unescaped '"', so the key
+        pattern only matches the top-level "msg_id" key. Ids containing
+        escapes, or payloads not in compact form, return None and are
+        handled by the full parse.
+
+        Args:
+            payload: The frame payload
+
+        Returns:
+            The msg_id, or None if it cannot be read cheaply
+        """
+        start = payload.find(cls._MSG_ID_KEY)
+        if start < 0:
+            return None
+        start += len(cls._MSG_ID_KEY)
+        end = payload.find(b'"', start)
+        if end < 0:
+            return None
+        raw = payload[start:end]
+        if b"\\" in raw:
+            return None
+        return raw.decode(cls.MESSAGE_ENCODING, "replace")
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Read one length-prefixed frame from a stream.
+
+        Args:
+            reader: The stream to read from
+
+        Returns:
+            The frame payload, or None if the announced length exceeds
+            MESSAGE_SIZE_LIMIT
+
+        Raises:
+            asyncio.IncompleteReadError: If the stream ends mid-frame
+        """
+        header = await reader.readexactly(self.FRAME_HEADER.size)
+        (length,) = self.FRAME_HEADER.unpack(header)
+        if length > self.MESSAGE_SIZE_LIMIT:
+            return None
+        return await reader.readexactly(length)
 
     def _load_or_create_identity(self) -> None:
         """Load or create Ed25519 cryptographic identity."""
@@ -160,39 +355,61 @@ class TAZCOMNodeGossip:
         """
         Handle incoming TCP connection.
 
+        Peers keep their outbound connections open, so frames are read
+        until the peer closes its end.
+
         Implements gossip logic:
         1. Check for duplicate messages
         2. Forward non-duplicate messages if ttl > 0
         3. Display to UI if it's a CHAT message
         """
         addr = writer.get_extra_info("peername")
+        self.inbound_writers.add(writer)
         try:
-            data = await reader.readuntil(self.MESSAGE_TERMINATOR)
+            while True:
+                try:
+                    data = await self._read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break  # Peer closed the connection
+
+                if data is None:
+                    logger.warning(f"Message from {addr} exceeds size limit")
+                    break
+
+                # Fast path: ACK a duplicate without parsing it. Expired ids
+                # are forgotten first so they are not mistaken for duplicates.
+                self._evict_seen(time.monotonic())
+                peeked_id = self._peek_msg_id(data)
+                if peeked_id is not None and peeked_id in self.seen_messages:
+                    logger.debug(f"Ignoring duplicate message: {peeked_id}")
+                    writer.write(self.ACK_FRAME)
+                    await writer.drain()
+                    continue
 
-            if data:
-                message_json = data.decode(self.MESSAGE_ENCODING).strip()
                 try:
-                    message = json.loads(message_json)
+                    # json.loads accepts UTF-8 bytes directly
+                    message = json.loads(data)
                     msg_type = message.get("type")
 
                     if msg_type == "HELLO":
                         # HELLO message: just send ACK
-                        writer.write(b"ACK\n")
+                        writer.write(self.ACK_FRAME)
                         await writer.drain()
 
                     elif msg_type == "CHAT":
                         # CHAT message: implement gossip logic
                         msg_id = message.get("msg_id")
 
-                        # Check if we've seen this message before (duplicate detection)
+                        # Duplicate check for frames the fast path could not
+                        # peek into (e.g. non-compact JSON)
                         if msg_id in self.seen_messages:
                             logger.debug(f"Ignoring duplicate message: {msg_id}")
-                            writer.write(b"ACK\n")
+                            writer.write(self.ACK_FRAME)
                             await writer.drain()
-                            return
+                            continue
 
                         # New message: add to seen cache
-                        self.seen_messages.append(msg_id)
+                        self._mark_seen(msg_id)
 
                         # Extract sender information
                         from_peer = message.get("from", "Unknown")
@@ -209,20 +426,23 @@ class TAZCOMNodeGossip:
                             await self.forward_message(message, addr)
 
                         # Send ACK
-                        writer.write(b"ACK\n")
+                        writer.write(self.ACK_FRAME)
+                        await writer.drain()
+
+                    else:
+                        # Unknown type: still reply, since the sender pairs
+                        # replies with frames by order
+                        writer.write(self.ERROR_FRAME)
                         await writer.drain()
 
                 except json.JSONDecodeError:
-                    writer.write(b"ERROR\n")
+                    writer.write(self.ERROR_FRAME)
                     await writer.drain()
 
-        except asyncio.LimitOverrunError:
-            logger.warning(f"Message from {addr} exceeds size limit")
-            writer.close()
-            await writer.wait_closed()
         except Exception as e:
             logger.warning(f"Error handling connection from {addr}: {e}")
         finally:
+            self.inbound_writers.discard(writer)
             writer.close()
             await writer.wait_closed()
 
@@ -230,72 +450,234 @@ class TAZCOMNodeGossip:
         self, message: dict, received_from_addr: tuple
     ) -> None:
         """
-        Forward a message to all peers (except the sender).
+        Forward a message to a bounded set of peers (except the sender).
 
         Implements gossip forwarding:
         1. Decrement ttl
-        2. Send to all peers (excluding sender)
+        2. Send to up to GOSSIP_FANOUT random peers (excluding the relaying
+           peer and the author)
         3. Run asynchronously to avoid blocking
 
         Args:
-            message: The message to forward (will be modified with new ttl)
+            message: The message to forward (its ttl is decremented in place)
             received_from_addr: Tuple (ip, port) of the sender
         """
-        # Create a copy and decrement ttl
-        forwarded_message = message.copy()
-        forwarded_message["ttl"] = forwarded_message.get("ttl", 1) - 1
-
-        # If ttl becomes 0, don't forward
-        if forwarded_message["ttl"] <= 0:
+        # Decrement ttl; if it becomes 0, don't forward
+        ttl = message.get("ttl", 1) - 1
+        if ttl <= 0:
             logger.debug(f"Message {message.get('msg_id')} ttl exhausted, not forwarding")
             return
 
-        # Get all peers
-        async with self.peers_lock:
-            peer_list = list(self.peers.items())
-
-        # Forward to each peer asynchronously
-        for peer_id, peer_info in peer_list:
-            # Create a task for each peer to avoid blocking
-            asyncio.create_task(
-                self._forward_to_peer(peer_id, peer_info, forwarded_message)
-            )
+        # The message is owned by handle_connection and re-serialized below,
+        # so the ttl is updated in place rather than on a copy
+        message["ttl"] = ttl
+
+        # Get all peers except the original author and the relaying peer.
+        # The relay is only known by IP, so it is skipped only when exactly
+        # one peer is advertised at that address.
+        excluded = {message.get("from"), self.node_id_b64}
+        relay_ids = self.ip_to_peers.get(received_from_addr[0], ())
+        if len(relay_ids) == 1:
+            excluded.update(relay_ids)
+        peer_list = [
+            (peer_id, peer)
+            for peer_id, peer in self._peers_snapshot
+            if peer_id not in excluded
+        ]
+
+        # Bounded fanout: relay to a random subset of GOSSIP_FANOUT peers.
+        # Dedup plus the other relays still reach the rest of the mesh.
+        if len(peer_list) > self.GOSSIP_FANOUT:
+            peer_list = random.sample(peer_list, self.GOSSIP_FANOUT)
+
+        # Serialize once; every peer receives the same frame
+        message_bytes = self._encode_frame(message)
+
+        # Forward to all peers in one background batch to avoid blocking
+        self._spawn_fanout(
+            [
+                self._forward_to_peer(peer_id, peer, message_bytes)
+                for peer_id, peer in peer_list
+            ]
+        )
 
     async def _forward_to_peer(
-        self, peer_id: str, peer_info: Dict[str, str], message: dict
+        self,
+        peer_id: str,
+        peer: Peer,
+        message_bytes: bytes,
+        expect_ack: bool = False,
     ) -> None:
         """
         Send a forwarded message to a specific peer.
 
+        Gossip tolerates loss through dedup and TTL, so by default the
+        frame is written without waiting for the peer's ACK.
+
         Args:
             peer_id: ID of the target peer
-            peer_info: Dictionary with 'ip' and 'port'
-            message: The message to send
+            peer: The target peer
+            message_bytes: The encoded, length-prefixed frame
+            expect_ack: Wait for the peer's ACK before returning
         """
-        peer_ip = peer_info["ip"]
-        peer_port = int(peer_info["port"])
+        async with self._send_sem:
+            try:
+                await self._send_frame(peer_id, peer, message_bytes, expect_ack)
+            except (ConnectionRefusedError, asyncio.TimeoutError):
+                logger.debug(
+                    f"Could not forward to {peer_id} "
+                    f"({peer.ip}:{peer.port})"
+                )
+            except Exception as e:
+                logger.debug(f"Error forwarding to {peer_id}: {e}")
+
+    # ========== Persistent Connections ==========
+
+    async def _get_writer(
+        self, peer_id: str, peer: Peer
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Return the cached connection to a peer, opening one if needed.
 
-        try:
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
+        A cached connection the peer has already closed is discarded and
+        re-dialled. Each new connection gets a reply reader task that
+        consumes the peer's ACK lines.
+
+        Args:
+            peer_id: ID of the target peer
+            peer: The target peer
+
+        Returns:
+            A (reader, writer) pair for the peer
+        """
+        conn = self.conns.get(peer_id)
+        if conn is not None:
+            reader, writer = conn
+            if not writer.is_closing() and not reader.at_eof():
+                return conn
+            self._drop_conn(peer_id)
+
+        conn = await asyncio.wait_for(
+            asyncio.open_connection(peer.ip, peer.port),
+            timeout=self.CONNECT_TIMEOUT,
+        )
+        pending: Deque[Optional[asyncio.Future]] = deque()
+        self.conns[peer_id] = conn
+        self.pending_acks[peer_id] = pending
+        self.reply_tasks[peer_id] = asyncio.create_task(
+            self._read_replies(peer_id, conn, pending)
+        )
+        return conn
+
+    async def _send_frame(
+        self,
+        peer_id: str,
+        peer: Peer,
+        message_bytes: bytes,
+        expect_ack: bool = True,
+    ) -> Optional[bytes]:
+        """
+        Send one framed message over the peer's persistent connection.
 
-            message_json = json.dumps(message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+        The peer answers every frame with one reply frame, in order. Each
+        send queues a waiter (or None when the reply is not wanted) that
+        the connection's reply reader resolves, so frames are pipelined
+        and only callers with expect_ack=True wait for the round trip.
+        On any error the cached connection is closed and removed, so the
+        next send re-dials.
 
-            writer.write(message_bytes)
-            await writer.drain()
+        Args:
+            peer_id: ID of the target peer
+            peer: The target peer
+            message_bytes: The encoded, length-prefixed frame
+            expect_ack: Wait for and return the peer's reply
 
-            # Wait for ACK
-            ack_data = await asyncio.wait_for(
-                reader.readuntil(self.MESSAGE_TERMINATOR), timeout=2.0
+        Returns:
+            The payload of the peer's reply (e.g. b"ACK"), or None if
+            expect_ack is False
+        """
+        lock = self.conn_locks.setdefault(peer_id, asyncio.Lock())
+        async with lock:
+            conn = await self._get_writer(peer_id, peer)
+            writer = conn[1]
+            waiter = (
+                asyncio.get_running_loop().create_future() if expect_ack else None
             )
+            self.pending_acks[peer_id].append(waiter)
+            try:
+                writer.write(message_bytes)
+                await writer.drain()
+            except BaseException:
+                if waiter is not None:
+                    waiter.cancel()  # Never awaited; don't leave it to fail
+                self._drop_conn(peer_id)
+                raise
+
+        if waiter is None:
+            return None
+        try:
+            return await asyncio.wait_for(waiter, timeout=self.ACK_TIMEOUT)
+        except BaseException:
+            if self.conns.get(peer_id) is conn:
+                self._drop_conn(peer_id)
+            raise
 
-            writer.close()
-            await writer.wait_closed()
+    async def _read_replies(
+        self,
+        peer_id: str,
+        conn: Tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        pending: Deque[Optional[asyncio.Future]],
+    ) -> None:
+        """
+        Match reply frames on an outbound connection to their waiters.
 
-        except (ConnectionRefusedError, asyncio.TimeoutError):
-            logger.debug(f"Could not forward to {peer_id} ({peer_ip}:{peer_port})")
-        except Exception as e:
-            logger.debug(f"Error forwarding to {peer_id}: {e}")
+        Replies nobody waits for are read and discarded, so unread ACKs
+        never back up the connection. When the connection ends, it is
+        dropped from the cache.
+
+        Args:
+            peer_id: ID of the peer
+            conn: The (reader, writer) pair being read
+            pending: Waiters in send order, shared with _send_frame()
+        """
+        reader = conn[0]
+        try:
+            while True:
+                reply = await self._read_frame(reader)
+                if reply is None:
+                    logger.warning(f"Reply from {peer_id} exceeds size limit")
+                    break
+                waiter = pending.popleft() if pending else None
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(reply)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            logger.debug(f"Connection to {peer_id} closed: {e}")
+        finally:
+            if self.conns.get(peer_id) is conn:
+                self._drop_conn(peer_id)
+
+    def _drop_conn(self, peer_id: str) -> None:
+        """
+        Close and forget the cached connection to a peer, if any.
+
+        Waiters still expecting a reply on it fail with ConnectionResetError.
+
+        Args:
+            peer_id: ID of the peer
+        """
+        conn = self.conns.pop(peer_id, None)
+        if conn is not None:
+            conn[1].close()
+
+        for waiter in self.pending_acks.pop(peer_id, ()):
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(
+                    ConnectionResetError(f"Connection to {peer_id} closed")
+                )
+
+        task = self.reply_tasks.pop(peer_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
 
     async def _setup_zeroconf(self) -> None:
         """Initialize Zeroconf service publishing and discovery."""
@@ -334,19 +716,38 @@ class TAZCOMNodeGossip:
         name: str,
         state_change: ServiceStateChange,
     ) -> None:
-        """Handle service state changes."""
+        """
+        Handle service state changes.
+
+        Runs on Zeroconf's thread. Handlers are fire-and-forget, so they are
+        handed to the event loop with call_soon_threadsafe rather than
+        run_coroutine_threadsafe, which would also allocate a
+        concurrent.futures.Future that nothing waits on.
+        """
         if self.event_loop is None:
             return
 
         if state_change == ServiceStateChange.Added:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_added(zeroconf, service_type, name), self.event_loop
+            self.event_loop.call_soon_threadsafe(
+                self._spawn_discovery_task,
+                self._on_service_added(zeroconf, service_type, name),
             )
         elif state_change == ServiceStateChange.Removed:
-            asyncio.run_coroutine_threadsafe(
-                self._on_service_removed(name), self.event_loop
+            self.event_loop.call_soon_threadsafe(
+                self._spawn_discovery_task, self._on_service_removed(name)
             )
 
+    def _spawn_discovery_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """
+        Start a discovery handler on the event loop and keep it referenced.
+
+        Args:
+            coro: The handler coroutine
+        """
+        task = asyncio.create_task(coro)
+        self._discovery_tasks.add(task)
+        task.add_done_callback(self._discovery_tasks.discard)
+
     async def _on_service_added(
         self, zeroconf: Zeroconf, service_type: str, name: str
     ) -> None:
@@ -374,11 +775,12 @@ class TAZCOMNodeGossip:
             peer_port = info.port
 
             async with self.peers_lock:
-                self.peers[peer_id] = {
-                    "ip": peer_ip,
-                    "port": str(peer_port),
-                    "name": name,
-                }
+                previous = self.peers.get(peer_id)
+                if previous is not None:
+                    self._unindex_peer_ip(peer_id, previous.ip)
+                self.ip_to_peers.setdefault(peer_ip, set()).add(peer_id)
+                self.peers[peer_id] = Peer(peer_ip, peer_port, name)
+                self._publish_peers()
                 self.service_name_to_id[name] = peer_id
 
             self.app.on_peer_update()
@@ -393,35 +795,45 @@ class TAZCOMNodeGossip:
         async with self.peers_lock:
             peer_id = self.service_name_to_id.pop(name, None)
             if peer_id and peer_id in self.peers:
-                del self.peers[peer_id]
+                self._unindex_peer_ip(peer_id, self.peers.pop(peer_id).ip)
+                self._publish_peers()
+
+        if peer_id:
+            self._drop_conn(peer_id)
+            self.conn_locks.pop(peer_id, None)
 
         self.app.on_peer_update()
 
-    async def send_hello(self, peer_id: str) -> None:
-        """Send a HELLO greeting to a peer."""
-        async with self.peers_lock:
-            peer_info = self.peers.get(peer_id)
-            if not peer_info:
-                return
-            peer_ip = peer_info["ip"]
-            peer_port = int(peer_info["port"])
+    def _unindex_peer_ip(self, peer_id: str, peer_ip: str) -> None:
+        """
+        Remove a peer from the IP index. Caller must hold peers_lock.
 
-        try:
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
-            hello_message = {
-                "type": "HELLO",
-                "from": self.node_id_b64,
-            }
-            message_json = json.dumps(hello_message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+        Args:
+            peer_id: ID of the peer
+            peer_ip: The IP address the peer was indexed under
+        """
+        peer_ids = self.ip_to_peers.get(peer_ip)
+        if peer_ids is not None:
+            peer_ids.discard(peer_id)
+            if not peer_ids:
+                del self.ip_to_peers[peer_ip]
 
-            writer.write(message_bytes)
-            await writer.drain()
+    async def send_hello(self, peer_id: str) -> None:
+        """Send a HELLO greeting to a peer."""
+        # A plain dict read cannot interleave with a mutation on the event
+        # loop, so no lock is taken before the network I/O below
+        peer = self.peers.get(peer_id)
+        if peer is None:
+            return
 
-            ack_data = await reader.readuntil(self.MESSAGE_TERMINATOR)
-            writer.close()
-            await writer.wait_closed()
+        hello_message = {
+            "type": "HELLO",
+            "from": self.node_id_b64,
+        }
+        message_bytes = self._encode_frame(hello_message)
 
+        try:
+            await self._send_frame(peer_id, peer, message_bytes)
         except (ConnectionRefusedError, asyncio.TimeoutError):
             pass
         except Exception as e:
@@ -442,13 +854,17 @@ class TAZCOMNodeGossip:
         if not content.strip():
             return
 
-        # Generate unique msg_id based on content and timestamp
-        timestamp = datetime.now().isoformat()
+        # Generate unique msg_id based on content and timestamp. The wire
+        # timestamp is integer Unix nanoseconds; readers that need a wall
+        # clock time convert it with datetime.fromtimestamp(ts / 1e9)
+        timestamp = time.time_ns()
         msg_id_input = f"{content}:{timestamp}:{self.node_id_b64}"
-        msg_id = hashlib.sha256(msg_id_input.encode()).hexdigest()[:16]
+        # msg_id is only a dedup tag, so a short BLAKE2b digest is enough
+        # and cheaper than truncating SHA-256
+        msg_id = hashlib.blake2b(msg_id_input.encode(), digest_size=8).hexdigest()
 
         # Add to seen messages to prevent loops
-        self.seen_messages.append(msg_id)
+        self._mark_seen(msg_id)
 
         # Create gossip message
         chat_message = {
@@ -461,43 +877,52 @@ class TAZCOMNodeGossip:
         }
 
         # Broadcast to all direct peers
-        async with self.peers_lock:
-            peer_list = list(self.peers.items())
-
-        for peer_id, peer_info in peer_list:
-            asyncio.create_task(
-                self._send_chat_message(peer_id, peer_info, chat_message)
-            )
-
-    async def _send_chat_message(
-        self, peer_id: str, peer_info: Dict[str, str], message: dict
-    ) -> None:
-        """Send a CHAT message to a specific peer."""
-        peer_ip = peer_info["ip"]
-        peer_port = int(peer_info["port"])
+        peer_list = self._peers_snapshot
 
         try:
-            reader, writer = await asyncio.open_connection(peer_ip, peer_port)
-
-            message_json = json.dumps(message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+            message_bytes = self._encode_frame(chat_message)
+        except ValueError:
+            logger.warning("Message exceeds size limit, not sent")
+            return
 
-            writer.write(message_bytes)
-            await writer.drain()
+        self._spawn_fanout(
+            [
+                self._send_chat_message(peer_id, peer, message_bytes)
+                for peer_id, peer in peer_list
+            ]
+        )
 
-            ack_data = await reader.readuntil(self.MESSAGE_TERMINATOR)
-            writer.close()
-            await writer.wait_closed()
+    async def _send_chat_message(
+        self,
+        peer_id: str,
+        peer: Peer,
+        message_bytes: bytes,
+        expect_ack: bool = False,
+    ) -> None:
+        """
+        Send a pre-encoded CHAT frame to a specific peer.
 
-        except (ConnectionRefusedError, asyncio.TimeoutError):
-            pass
-        except Exception as e:
-            logger.debug(f"Error sending CHAT to {peer_id}: {e}")
+        By default the ACK is not awaited; see _forward_to_peer().
+        """
+        async with self._send_sem:
+            try:
+                await self._send_frame(peer_id, peer, message_bytes, expect_ack)
+            except (ConnectionRefusedError, asyncio.TimeoutError):
+                pass
+            except Exception as e:
+                logger.debug(f"Error sending CHAT to {peer_id}: {e}")
 
     async def shutdown(self) -> None:
         """Gracefully shut down the node."""
+        for batch in list(self._fanout_tasks):
+            batch.cancel()
+        for peer_id in list(self.conns):
+            self._drop_conn(peer_id)
+
         if self.server:
             self.server.close()
+            for writer in list(self.inbound_writers):
+                writer.close()
             await self.server.wait_closed()
 
         if self.aiozc:
@@ -511,7 +936,7 @@ class PeerListWidget(Static):
         super().__init__()
         self.peers: Dict[str, str] = {}
 
-    def update_peers(self, peers: Dict[str, Dict[str, str]]) -> None:
+    def update_peers(self, peers: Dict[str, Peer]) -> None:
         """Update the peer list."""
         self.peers = {pid: pid[:8] for pid in peers.keys()}
         self.refresh()
@@ -676,4 +1101,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-based event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
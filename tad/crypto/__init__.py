@@ -11,6 +11,14 @@ Components:
 - E2EEManager: Main encryption/decryption orchestration
 """
 
-from .e2ee import E2EEManager
-
 __all__ = ["E2EEManager"]
+
+
+def __getattr__(name):
+    # Load the E2EE backend on first use (PEP 562), so importing tad.crypto
+    # does not pull in the cryptography package
+    if name == "E2EEManager":
+        from .e2ee import E2EEManager
+
+        return E2EEManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
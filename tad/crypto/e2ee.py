@@ -16,19 +16,80 @@ Security Model:
 5. Replay attack prevention through message signatures (from M2)
 """
 
-import json
+import base64
+import functools
 import logging
 import os
-from typing import Dict, Optional, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from nacl.encoding import HexEncoder
 from nacl.public import SealedBox, PublicKey, PrivateKey
 from nacl.utils import random
 
 logger = logging.getLogger(__name__)
 
+# AES-GCM nonce size (96 bits) and authentication tag size
+NONCE_SIZE = 12
+TAG_SIZE = 16
+# Channel nonces are a random per-install prefix followed by a counter.
+# The 64-bit prefix is what keeps nonces unique between members sharing a
+# channel key (and across restarts); the counter is redrawn with a new
+# prefix before it wraps.
+NONCE_PREFIX_SIZE = 8
+NONCE_COUNTER_LIMIT = 1 << (8 * (NONCE_SIZE - NONCE_PREFIX_SIZE))
+# Ciphertexts and nonces used to be sent as hex; a hex nonce is this long
+_HEX_NONCE_LENGTH = 2 * NONCE_SIZE
+
+
+def _decode_ciphertext(ciphertext_b64: str, nonce_b64: str) -> Tuple[bytes, bytes]:
+    """
+    Decode a base64 ciphertext/nonce pair, accepting the legacy hex encoding.
+
+    The encoding is told apart by the nonce length: 24 characters in hex,
+    16 in base64.
+    """
+    if len(nonce_b64) == _HEX_NONCE_LENGTH:
+        return bytes.fromhex(ciphertext_b64), bytes.fromhex(nonce_b64)
+    return (
+        base64.b64decode(ciphertext_b64, validate=True),
+        base64.b64decode(nonce_b64, validate=True),
+    )
+
+
+def _b64(data: bytes) -> str:
+    """Encode bytes as a base64 string."""
+    return base64.b64encode(data).decode("ascii")
+
+
+# Per-thread scratch buffer that AESGCM.encrypt_into() writes ciphertext to
+_scratch = threading.local()
+
+
+def _scratch_buffer(size: int) -> bytearray:
+    """Get this thread's scratch buffer, grown to at least `size` bytes."""
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(max(size, 2 * len(buf) if buf else 4096))
+        _scratch.buf = buf
+    return buf
+
+
+@functools.lru_cache(maxsize=1024)
+def _sealed_box_for_recipient(recipient_public_key_hex: str) -> SealedBox:
+    """Get a (cached) SealedBox that encrypts to a recipient's public key."""
+    return SealedBox(PublicKey(recipient_public_key_hex, encoder=HexEncoder))
+
+
+@functools.lru_cache(maxsize=8)
+def _sealed_box_for_private_key(private_key_hex: str) -> SealedBox:
+    """Get a (cached) SealedBox that decrypts with one of our private keys."""
+    return SealedBox(PrivateKey(private_key_hex, encoder=HexEncoder))
+
 
 class E2EEManager:
     """
@@ -45,6 +106,14 @@ class E2EEManager:
     def __init__(self):
         """Initialize the E2EE manager."""
         self.channel_keys: Dict[str, bytes] = {}
+        # AESGCM objects per channel: {channel_id: (key, cipher)}, so the key
+        # schedule is built once per key rather than once per message
+        self._aesgcm_cache: Dict[str, Tuple[bytes, AESGCM]] = {}
+        # Nonce state per channel: {channel_id: [prefix, next_counter]}
+        self._nonce_state: Dict[str, list] = {}
+        # Guards _nonce_state: a nonce must never be handed out twice, even
+        # when several threads encrypt for the same channel
+        self._nonce_lock = threading.Lock()
         logger.info("E2EEManager initialized")
 
     # ============================================================
@@ -73,7 +142,9 @@ class E2EEManager:
             raise ValueError(f"Channel key must be 32 bytes, got {len(key)}")
 
         self.channel_keys[channel_id] = key
-        logger.debug(f"Stored key for channel {channel_id}")
+        self._aesgcm_cache[channel_id] = (key, AESGCM(key))
+        self._nonce_state.pop(channel_id, None)
+        logger.debug("Stored key for channel %s", channel_id)
 
     def get_channel_key(self, channel_id: str) -> Optional[bytes]:
         """
@@ -103,68 +174,274 @@ class E2EEManager:
     # Message Encryption and Decryption (AES-256-GCM)
     # ============================================================
 
+    def _get_cipher(self, channel_id: str) -> Optional[AESGCM]:
+        """
+        Get the cached AESGCM object for a channel.
+
+        The cache entry is rebuilt (and the key validated) only if the stored
+        key object has changed, e.g. it was replaced through the channel_keys
+        dict directly; keys from store_channel_key() were validated there.
+
+        Args:
+            channel_id: Channel identifier
+
+        Returns:
+            The channel's AESGCM object, or None if we have no key
+        """
+        key = self.channel_keys.get(channel_id)
+        if key is None:
+            return None
+
+        entry = self._aesgcm_cache.get(channel_id)
+        if entry is None or entry[0] is not key:
+            if len(key) != 32:
+                raise ValueError(f"Channel key must be 32 bytes, got {len(key)}")
+            entry = (key, AESGCM(key))
+            self._aesgcm_cache[channel_id] = entry
+        return entry[1]
+
+    def _take_nonces(self, channel_id: str, count: int) -> List[bytes]:
+        """
+        Reserve the next nonces for a channel.
+
+        Only the first nonce after a key install (or after the counter runs
+        out) costs an os.urandom() call. Safe to call from multiple threads.
+
+        Args:
+            channel_id: Channel identifier
+            count: Number of nonces to reserve
+
+        Returns:
+            List of unique NONCE_SIZE-byte nonces
+        """
+        with self._nonce_lock:
+            state = self._nonce_state.get(channel_id)
+            if state is None or state[1] + count > NONCE_COUNTER_LIMIT:
+                state = [os.urandom(NONCE_PREFIX_SIZE), 0]
+                self._nonce_state[channel_id] = state
+
+            prefix, start = state
+            state[1] = start + count
+        counter_size = NONCE_SIZE - NONCE_PREFIX_SIZE
+        return [
+            prefix + counter.to_bytes(counter_size, "big")
+            for counter in range(start, start + count)
+        ]
+
+    def encrypt_channel_message(
+        self, channel_id: str, plaintext: str
+    ) -> Tuple[str, str]:
+        """
+        Encrypt a message with a stored channel key using AES-256-GCM.
+
+        Args:
+            channel_id: Channel identifier
+            plaintext: Message content to encrypt
+
+        Returns:
+            Tuple of (ciphertext_b64, nonce_b64) both as base64 strings
+
+        Raises:
+            KeyError: If we have no key for the channel
+        """
+        cipher = self._get_cipher(channel_id)
+        if cipher is None:
+            raise KeyError(f"No key for channel {channel_id}")
+        nonce = self._take_nonces(channel_id, 1)[0]
+        return self._encrypt_with(cipher, plaintext, nonce)
+
+    def decrypt_channel_message(
+        self, channel_id: str, ciphertext_b64: str, nonce_b64: str
+    ) -> Optional[str]:
+        """
+        Decrypt a message with a stored channel key using AES-256-GCM.
+
+        Args:
+            channel_id: Channel identifier
+            ciphertext_b64: Encrypted message as base64 (or legacy hex) string
+            nonce_b64: Nonce as base64 (or legacy hex) string
+
+        Returns:
+            Decrypted plaintext message, or None if we have no key or
+            decryption fails
+        """
+        try:
+            cipher = self._get_cipher(channel_id)
+        except ValueError as e:
+            logger.warning("Failed to decrypt message: %s", e)
+            return None
+        if cipher is None:
+            logger.warning("Failed to decrypt message: no key for channel %s", channel_id)
+            return None
+        return self._decrypt_with(cipher, ciphertext_b64, nonce_b64)
+
+    def encrypt_channel_messages(
+        self, channel_id: str, plaintexts: List[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Encrypt several messages with a stored channel key.
+
+        Each message still gets its own nonce and ciphertext, but the cipher
+        is looked up once and the nonces are reserved in one go.
+
+        Args:
+            channel_id: Channel identifier
+            plaintexts: Message contents to encrypt
+
+        Returns:
+            List of (ciphertext_b64, nonce_b64) tuples, in input order
+
+        Raises:
+            KeyError: If we have no key for the channel
+        """
+        cipher = self._get_cipher(channel_id)
+        if cipher is None:
+            raise KeyError(f"No key for channel {channel_id}")
+
+        nonces = self._take_nonces(channel_id, len(plaintexts))
+        return [
+            self._encrypt_with(cipher, plaintext, nonce)
+            for nonce, plaintext in zip(nonces, plaintexts)
+        ]
+
+    def decrypt_channel_messages(
+        self, channel_id: str, messages: List[Tuple[str, str]]
+    ) -> List[Optional[str]]:
+        """
+        Decrypt several messages with a stored channel key.
+
+        Args:
+            channel_id: Channel identifier
+            messages: List of (ciphertext_b64, nonce_b64) tuples
+
+        Returns:
+            List of decrypted plaintexts in input order; an entry is None if
+            that message fails to decrypt (all are None if we have no key)
+        """
+        try:
+            cipher = self._get_cipher(channel_id)
+        except ValueError as e:
+            logger.warning("Failed to decrypt messages: %s", e)
+            cipher = None
+        if cipher is None:
+            logger.warning("Failed to decrypt messages: no key for channel %s", channel_id)
+            return [None] * len(messages)
+
+        return [
+            self._decrypt_with(cipher, ciphertext_b64, nonce_b64)
+            for ciphertext_b64, nonce_b64 in messages
+        ]
+
     @staticmethod
     def encrypt_message(channel_key: bytes, plaintext: str) -> Tuple[str, str]:
         """
         Encrypt a message using AES-256-GCM.
 
+        Builds a new AESGCM object per call; prefer encrypt_channel_message()
+        for stored channel keys.
+
         Args:
             channel_key: 32-byte symmetric key for the channel
             plaintext: Message content to encrypt
 
         Returns:
-            Tuple of (ciphertext_hex, nonce_hex) both as hex strings
+            Tuple of (ciphertext_b64, nonce_b64) both as base64 strings
         """
         if len(channel_key) != 32:
             raise ValueError(f"Channel key must be 32 bytes, got {len(channel_key)}")
 
         # Generate random nonce (96 bits for GCM)
-        nonce = os.urandom(12)
+        nonce = os.urandom(NONCE_SIZE)
+
+        return E2EEManager._encrypt_with(AESGCM(channel_key), plaintext, nonce)
+
+    @staticmethod
+    def decrypt_message(
+        channel_key: bytes, ciphertext_b64: str, nonce_b64: str
+    ) -> Optional[str]:
+        """
+        Decrypt a message using AES-256-GCM.
+
+        Builds a new AESGCM object per call; prefer decrypt_channel_message()
+        for stored channel keys.
+
+        Args:
+            channel_key: 32-byte symmetric key for the channel
+            ciphertext_b64: Encrypted message as base64 (or legacy hex) string
+            nonce_b64: Nonce as base64 (or legacy hex) string
+
+        Returns:
+            Decrypted plaintext message, or None if decryption fails
+        """
+        if len(channel_key) != 32:
+            logger.warning(
+                "Failed to decrypt message: Channel key must be 32 bytes, got %d",
+                len(channel_key),
+            )
+            return None
+
+        return E2EEManager._decrypt_with(AESGCM(channel_key), ciphertext_b64, nonce_b64)
+
+    @staticmethod
+    def _encrypt_with(
+        cipher: AESGCM, plaintext: str, nonce: bytes
+    ) -> Tuple[str, str]:
+        """
+        Encrypt a message with an AESGCM object.
 
-        # Create cipher
-        cipher = AESGCM(channel_key)
+        With cryptography versions that have AESGCM.encrypt_into(), the
+        ciphertext is written into a reused scratch buffer and base64-encoded
+        from there, so no intermediate ciphertext object is allocated.
 
+        Args:
+            cipher: AESGCM object for the channel key
+            plaintext: Message content to encrypt
+            nonce: Unique NONCE_SIZE-byte nonce
+
+        Returns:
+            Tuple of (ciphertext_b64, nonce_b64) both as base64 strings
+        """
         # Encrypt with authentication
         plaintext_bytes = plaintext.encode("utf-8")
-        ciphertext = cipher.encrypt(nonce, plaintext_bytes, None)
-
-        # Return as hex strings for easy serialization
+        encrypt_into = getattr(cipher, "encrypt_into", None)
+        if encrypt_into is None:
+            ciphertext_b64 = _b64(cipher.encrypt(nonce, plaintext_bytes, None))
+        else:
+            size = len(plaintext_bytes) + TAG_SIZE
+            with memoryview(_scratch_buffer(size))[:size] as ciphertext:
+                encrypt_into(nonce, plaintext_bytes, None, ciphertext)
+                ciphertext_b64 = _b64(ciphertext)
+
+        # Return as base64 strings for easy serialization
         return (
-            ciphertext.hex(),
-            nonce.hex(),
+            ciphertext_b64,
+            _b64(nonce),
         )
 
     @staticmethod
-    def decrypt_message(
-        channel_key: bytes, ciphertext_hex: str, nonce_hex: str
+    def _decrypt_with(
+        cipher: AESGCM, ciphertext_b64: str, nonce_b64: str
     ) -> Optional[str]:
         """
-        Decrypt a message using AES-256-GCM.
+        Decrypt a message with an AESGCM object.
 
         Args:
-            channel_key: 32-byte symmetric key for the channel
-            ciphertext_hex: Encrypted message as hex string
-            nonce_hex: Nonce as hex string
+            cipher: AESGCM object for the channel key
+            ciphertext_b64: Encrypted message as base64 (or legacy hex) string
+            nonce_b64: Nonce as base64 (or legacy hex) string
 
         Returns:
             Decrypted plaintext message, or None if decryption fails
         """
         try:
-            if len(channel_key) != 32:
-                raise ValueError(f"Channel key must be 32 bytes, got {len(channel_key)}")
-
-            # Convert from hex
-            ciphertext = bytes.fromhex(ciphertext_hex)
-            nonce = bytes.fromhex(nonce_hex)
+            ciphertext, nonce = _decode_ciphertext(ciphertext_b64, nonce_b64)
 
-            # Create cipher and decrypt
-            cipher = AESGCM(channel_key)
             plaintext_bytes = cipher.decrypt(nonce, ciphertext, None)
 
             return plaintext_bytes.decode("utf-8")
 
         except Exception as e:
-            logger.warning(f"Failed to decrypt message: {e}")
+            logger.warning("Failed to decrypt message: %s", e)
             return None
 
     # ============================================================
@@ -190,20 +467,45 @@ class E2EEManager:
             Encrypted key as hex string
         """
         try:
-            # Reconstruct public key from hex
-            public_key_bytes = bytes.fromhex(recipient_public_key_hex)
-            recipient_public_key = PublicKey(public_key_bytes)
+            # Sealed boxes are cached per recipient key
+            sealed_box = _sealed_box_for_recipient(recipient_public_key_hex)
+            encrypted_key = sealed_box.encrypt(channel_key, encoder=HexEncoder)
 
-            # Create sealed box and encrypt
-            sealed_box = SealedBox(recipient_public_key)
-            encrypted_key = sealed_box.encrypt(channel_key)
-
-            return encrypted_key.hex()
+            return encrypted_key.decode("ascii")
 
         except Exception as e:
             logger.error(f"Failed to encrypt key for recipient: {e}")
             raise
 
+    @staticmethod
+    def encrypt_key_for_recipients(
+        recipient_public_keys_hex: List[str], channel_key: bytes
+    ) -> List[str]:
+        """
+        Encrypt a channel key for several recipients using SealedBox.
+
+        Each recipient's box still uses its own ephemeral key pair; what is
+        shared is the per-recipient SealedBox cache and the method lookups.
+
+        Args:
+            recipient_public_keys_hex: Recipients' public keys as hex strings
+            channel_key: The symmetric channel key to encrypt (32 bytes)
+
+        Returns:
+            Encrypted keys as hex strings, in input order
+        """
+        try:
+            return [
+                _sealed_box_for_recipient(public_key_hex)
+                .encrypt(channel_key, encoder=HexEncoder)
+                .decode("ascii")
+                for public_key_hex in recipient_public_keys_hex
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to encrypt key for recipients: {e}")
+            raise
+
     @staticmethod
     def decrypt_key_from_sender(
         private_key_hex: str, encrypted_key_hex: str
@@ -219,14 +521,9 @@ class E2EEManager:
             The decrypted channel key (32 bytes), or None if decryption fails
         """
         try:
-            # Reconstruct private key from hex
-            private_key_bytes = bytes.fromhex(private_key_hex)
-            private_key = PrivateKey(private_key_bytes)
-
-            # Create sealed box and decrypt
-            sealed_box = SealedBox(private_key)
-            encrypted_key_bytes = bytes.fromhex(encrypted_key_hex)
-            channel_key = sealed_box.decrypt(encrypted_key_bytes)
+            # Sealed boxes are cached per private key
+            sealed_box = _sealed_box_for_private_key(private_key_hex)
+            channel_key = sealed_box.decrypt(encrypted_key_hex, encoder=HexEncoder)
 
             if len(channel_key) != 32:
                 raise ValueError(
@@ -273,6 +570,34 @@ class E2EEManager:
         key = kdf.derive(password.encode("utf-8"))
         return key, salt.hex()
 
+    @staticmethod
+    def derive_key_scrypt(
+        password: str, salt: bytes = None, n: int = 2**15, r: int = 8, p: int = 1
+    ) -> Tuple[bytes, str]:
+        """
+        Derive a strong key from a password using scrypt.
+
+        (Optional utility - memory-hard alternative to
+        derive_key_from_password, preferred for new callers)
+
+        Args:
+            password: Password to derive key from
+            salt: Random salt (generated if not provided)
+            n: CPU/memory cost parameter (power of 2)
+            r: Block size parameter
+            p: Parallelization parameter
+
+        Returns:
+            Tuple of (key, salt_hex) where salt_hex can be stored
+        """
+        if salt is None:
+            salt = os.urandom(16)
+
+        kdf = Scrypt(salt=salt, length=32, n=n, r=r, p=p)
+
+        key = kdf.derive(password.encode("utf-8"))
+        return key, salt.hex()
+
     # ============================================================
     # Utility Methods
     # ============================================================
@@ -284,13 +609,23 @@ class E2EEManager:
         Args:
             channel_id: Channel identifier
         """
+        self._aesgcm_cache.pop(channel_id, None)
+        self._nonce_state.pop(channel_id, None)
         if channel_id in self.channel_keys:
             del self.channel_keys[channel_id]
-            logger.debug(f"Cleared key for channel {channel_id}")
+            logger.debug("Cleared key for channel %s", channel_id)
 
     def clear_all_keys(self) -> None:
-        """Clear all stored channel keys from memory."""
+        """
+        Clear all stored channel keys from memory.
+
+        Also drops the cached decrypting SealedBoxes, which hold our
+        private keys.
+        """
         self.channel_keys.clear()
+        self._aesgcm_cache.clear()
+        self._nonce_state.clear()
+        _sealed_box_for_private_key.cache_clear()
         logger.info("Cleared all channel keys")
 
     def get_managed_channels(self) -> list:
@@ -8,16 +8,64 @@ This module manages node identity:
 - Message signing capabilities
 """
 
+import functools
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import nacl.bindings
 import nacl.encoding
+import nacl.exceptions
+import nacl.public
 import nacl.signing
 
 logger = logging.getLogger(__name__)
 
+_BadSignature = nacl.exceptions.BadSignatureError
+
+# Ed25519 sizes, for rejecting malformed input before it reaches libsodium
+_SIGNATURE_SIZE = nacl.bindings.crypto_sign_BYTES
+_PUBLIC_KEY_SIZE = nacl.bindings.crypto_sign_PUBLICKEYBYTES
+
+# VerifyKeys are cached per signer so the Ed25519 point is decoded once per
+# peer. The caches are bounded so a peer spraying fresh public keys can only
+# evict entries, not grow memory.
+VERIFY_KEY_CACHE_SIZE = 4096
+
+# Batches smaller than this are verified inline; thread hand-off costs more
+VERIFY_BATCH_MIN_PARALLEL = 64
+
+_verify_executor: Optional[ThreadPoolExecutor] = None
+_verify_executor_lock = threading.Lock()
+
+
+def _get_verify_executor() -> ThreadPoolExecutor:
+    """Get the shared signature verification pool, creating it on first use."""
+    global _verify_executor
+    with _verify_executor_lock:
+        if _verify_executor is None:
+            _verify_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="tad-verify",
+            )
+        return _verify_executor
+
+
+@functools.lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def _verify_key_from_hex(public_key_hex: str) -> nacl.signing.VerifyKey:
+    """Get a (cached) VerifyKey for a hex-encoded public key."""
+    return nacl.signing.VerifyKey(public_key_hex, encoder=nacl.encoding.HexEncoder)
+
+
+@functools.lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def _verify_key_from_bytes(public_key_bytes: bytes) -> nacl.signing.VerifyKey:
+    """Get a (cached) VerifyKey for a raw public key."""
+    return nacl.signing.VerifyKey(public_key_bytes)
+
 
 class Identity:
     """
@@ -27,6 +75,7 @@ class Identity:
     - username: Human-readable username
     - signing_key: Private key for signing messages
     - verify_key: Public key for verifying signatures
+    - verify_key_bytes: Raw public key for internal use
     - verify_key_hex: Hex-encoded public key for network transmission
     """
 
@@ -53,6 +102,13 @@ class Identity:
         self.verify_key = verify_key
         self.encryption_private_key = encryption_private_key
         self.encryption_public_key = encryption_public_key
+        # Raw public key, so internal callers don't round-trip through hex
+        self.verify_key_bytes = verify_key.encode(encoder=nacl.encoding.RawEncoder)
+        # Expanded (seed || public key) secret for libsodium's crypto_sign,
+        # derived once so signing doesn't go through SignedMessage objects
+        _, self._signing_secret = nacl.bindings.crypto_sign_seed_keypair(
+            signing_key.encode(encoder=nacl.encoding.RawEncoder)
+        )
         # Hex-encoded public key for network transmission
         self.verify_key_hex = verify_key.encode(
             encoder=nacl.encoding.HexEncoder
@@ -64,6 +120,20 @@ class Identity:
             encoder=nacl.encoding.HexEncoder
         ).decode("utf-8")
 
+    def sign_detached(self, data: bytes) -> bytes:
+        """
+        Sign data with the signing key.
+
+        Args:
+            data: Raw bytes to sign
+
+        Returns:
+            The detached 64-byte Ed25519 signature
+        """
+        # crypto_sign() returns signature || data; keep the detached signature
+        signed = nacl.bindings.crypto_sign(data, self._signing_secret)
+        return signed[: nacl.bindings.crypto_sign_BYTES]
+
     def __repr__(self) -> str:
         return f"Identity(username='{self.username}', verify_key_hex='{self.verify_key_hex[:16]}...')"
 
@@ -217,14 +287,26 @@ class IdentityManager:
             "encryption_private_key_hex": encryption_private_key_hex,
         }
 
-        # Save to file
+        # Save to file: write a temp file and rename it over the profile, so a
+        # crash can't leave a half-written profile behind
         try:
             self.profile_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.profile_path, "w") as f:
-                json.dump(profile_data, f, indent=2)
-
-            # Restrict file permissions for security
-            self.profile_path.chmod(0o600)
+            profile_bytes = json.dumps(profile_data, indent=2).encode("utf-8")
+            tmp_path = self.profile_path.with_name(self.profile_path.name + ".tmp")
+
+            # Create with restricted permissions so the private keys are never
+            # readable by others, not even briefly
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(profile_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.profile_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             logger.info(
                 f"New identity created and saved to {self.profile_path} "
@@ -262,7 +344,26 @@ class IdentityManager:
         if not self.identity:
             raise RuntimeError("No identity loaded. Call load_or_create() first.")
 
-        return self.identity.signing_key.sign(data).signature
+        return self.identity.sign_detached(data)
+
+    def sign_batch(self, items: List[bytes]) -> List[bytes]:
+        """
+        Sign several pieces of data with the private key.
+
+        Args:
+            items: Raw byte strings to sign
+
+        Returns:
+            Detached signatures, in input order
+
+        Raises:
+            RuntimeError: If no identity is loaded
+        """
+        if not self.identity:
+            raise RuntimeError("No identity loaded. Call load_or_create() first.")
+
+        sign = self.identity.sign_detached
+        return [sign(data) for data in items]
 
     def get_public_key_hex(self) -> str:
         """
@@ -297,17 +398,90 @@ class IdentityManager:
             True if signature is valid, False otherwise
         """
         try:
-            # Reconstruct the public key from hex encoding
-            verify_key = nacl.signing.VerifyKey(
-                public_key_hex, encoder=nacl.encoding.HexEncoder
-            )
+            # Reject malformed input without a cache entry or point decode
+            if (
+                len(signature_bytes) != _SIGNATURE_SIZE
+                or len(public_key_hex) != 2 * _PUBLIC_KEY_SIZE
+            ):
+                return False
+
+            # Public keys are decoded once per signer and cached
+            verify_key = _verify_key_from_hex(public_key_hex)
 
             # Verify the signature
             verify_key.verify(message_bytes, signature_bytes)
             return True
 
-        except nacl.exceptions.BadSignatureError:
+        except _BadSignature:
+            return False
+        except Exception as e:
+            logger.warning(f"Error verifying signature: {e}")
+            return False
+
+    @staticmethod
+    def verify_signature_raw(
+        message_bytes: bytes, signature_bytes: bytes, public_key_bytes: bytes
+    ) -> bool:
+        """
+        Verify a signature using a raw (32-byte) public key.
+
+        Same as verify_signature(), for callers that already hold key bytes.
+
+        Args:
+            message_bytes: The original message that was signed
+            signature_bytes: The signature to verify
+            public_key_bytes: Raw public key of the signer
+
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        try:
+            if (
+                len(signature_bytes) != _SIGNATURE_SIZE
+                or len(public_key_bytes) != _PUBLIC_KEY_SIZE
+            ):
+                return False
+
+            verify_key = _verify_key_from_bytes(public_key_bytes)
+            verify_key.verify(message_bytes, signature_bytes)
+            return True
+
+        except _BadSignature:
             return False
         except Exception as e:
             logger.warning(f"Error verifying signature: {e}")
             return False
+
+    @staticmethod
+    def verify_signature_batch(
+        messages: List[Tuple[bytes, bytes, str]]
+    ) -> List[bool]:
+        """
+        Verify many signatures, spreading large batches over a thread pool.
+
+        libsodium's Ed25519 verification runs without the GIL, so workers
+        verify in parallel (e.g. when replaying a chat log).
+
+        Args:
+            messages: List of (message_bytes, signature_bytes, public_key_hex)
+
+        Returns:
+            List of verification results, in input order
+        """
+        verify = IdentityManager.verify_signature
+        workers = os.cpu_count() or 1
+        if workers == 1 or len(messages) < VERIFY_BATCH_MIN_PARALLEL:
+            return [verify(*message) for message in messages]
+
+        # One contiguous chunk per worker keeps the per-task overhead low
+        chunk_size = -(-len(messages) // workers)
+        chunks = [
+            messages[i : i + chunk_size]
+            for i in range(0, len(messages), chunk_size)
+        ]
+        results: List[bool] = []
+        for chunk_results in _get_verify_executor().map(
+            lambda chunk: [verify(*message) for message in chunk], chunks
+        ):
+            results.extend(chunk_results)
+        return results
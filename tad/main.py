@@ -54,6 +54,22 @@ class TADTUIApp(Screen):
         ("shift+tab", "prev_channel", "Prev Channel"),
     ]
 
+    # Slash command -> handler method name (resolved per call, so handlers
+    # can be overridden or patched on the instance)
+    COMMANDS = {
+        "join": "_cmd_join",
+        "leave": "_cmd_leave",
+        "switch": "_cmd_switch",
+        "s": "_cmd_switch",
+        "channels": "_cmd_channels",
+        "peers": "_cmd_peers",
+        "help": "_cmd_help",
+        "create": "_cmd_create",
+        "invite": "_cmd_invite",
+        "export": "_cmd_export",
+        "import": "_cmd_import",
+    }
+
     DEFAULT_CSS = """
     Screen {
         layout: grid;
@@ -116,6 +132,9 @@ class TADTUIApp(Screen):
         self.peer_list: Optional[PeerList] = None
         self.command_input: Optional[CommandInput] = None
 
+        # Background tasks (kept referenced until they finish)
+        self._bg_tasks: set = set()
+
     def compose(self) -> ComposeResult:
         """Compose the TUI layout."""
         yield Header(id="header")
@@ -153,7 +172,7 @@ class TADTUIApp(Screen):
         self.channel_list.set_active_channel(self.ui_state.active_channel)
 
         # Load message history
-        self._load_channel_history(self.ui_state.active_channel)
+        self._spawn(self._load_channel_history(self.ui_state.active_channel))
 
         logger.info("TUI initialized successfully")
 
@@ -165,23 +184,24 @@ class TADTUIApp(Screen):
             history = await self.node.load_channel_history(channel_id, last_n=50)
 
             if history:
-                self.message_view.add_system_message(
-                    f"Loaded {len(history)} messages from {channel_id}"
-                )
-
+                messages = []
                 for msg in history:
                     payload = msg.get("payload", {})
-                    sender = msg.get("sender_id", "unknown")[:8]
                     timestamp = payload.get("timestamp", "")
-                    content = payload.get("content", "")
-                    channel = payload.get("channel_id", channel_id)
-
-                    self.message_view.add_message(
-                        content=content,
-                        sender=sender,
-                        channel=channel,
-                        timestamp=timestamp[:16] if timestamp else "",
+                    messages.append(
+                        dict(
+                            content=payload.get("content", ""),
+                            sender=msg.get("sender_id", "unknown")[:8],
+                            channel=payload.get("channel_id", channel_id),
+                            timestamp=timestamp[:16] if timestamp else "",
+                        )
                     )
+
+                # Write the summary line and the whole history in one batch
+                self.message_view.add_messages(
+                    messages,
+                    system_message=f"Loaded {len(history)} messages from {channel_id}",
+                )
             else:
                 self.message_view.add_system_message(
                     f"No messages yet in {channel_id}"
@@ -196,53 +216,55 @@ class TADTUIApp(Screen):
         if not content.strip():
             return
 
-        # Send message via node
-        try:
-            msg_id = self.app.call_from_thread(
-                self.node.broadcast_message,
-                content,
-                self.ui_state.active_channel,
-            )
+        # Send message via node; this runs on the event loop, so schedule the
+        # broadcast as a task and report its outcome when it completes
+        task = self._spawn(
+            self.node.broadcast_message(content, self.ui_state.active_channel)
+        )
+        task.add_done_callback(self._on_broadcast_done)
 
-            logger.info(f"Message sent: {msg_id}")
+        # Display message immediately
+        self.message_view.add_message(
+            content=content,
+            sender=self.node.username,
+            channel=self.ui_state.active_channel,
+        )
 
-            # Display message immediately
-            self.message_view.add_message(
-                content=content,
-                sender=self.node.username,
-                channel=self.ui_state.active_channel,
-            )
+    def _on_broadcast_done(self, task: asyncio.Task) -> None:
+        """Log the result of a broadcast started by _handle_message()."""
+        if task.cancelled():
+            return
 
-        except Exception as e:
-            self.message_view.add_system_message(f"Error sending message: {e}")
-            logger.error(f"Error sending message: {e}")
+        error = task.exception()
+        if error is not None:
+            self.message_view.add_system_message(f"Error sending message: {error}")
+            logger.error(f"Error sending message: {error}")
+            return
+
+        logger.info(f"Message sent: {task.result()}")
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine as a background task on the running loop."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
 
     def _handle_command(self, command: str, args: list) -> None:
         """Handle a command from the user."""
         logger.info(f"Command: {command} {' '.join(args)}")
 
-        if command == "join":
-            self._cmd_join(args)
-        elif command == "leave":
-            self._cmd_leave(args)
-        elif command in ("switch", "s"):
-            self._cmd_switch(args)
-        elif command == "channels":
-            self._cmd_channels(args)
-        elif command == "peers":
-            self._cmd_peers(args)
-        elif command == "help":
-            self._cmd_help(args)
-        elif command == "create":
-            self._cmd_create(args)
-        elif command == "invite":
-            self._cmd_invite(args)
-        elif command == "export":
-            self._cmd_export(args)
-        elif command == "import":
-            self._cmd_import(args)
-        else:
+        handler_name = self.COMMANDS.get(command)
+        if handler_name is None:
             self.message_view.add_command_output(f"Unknown command: /{command}")
+            return
+
+        getattr(self, handler_name)(args)
+
+    @staticmethod
+    def _normalize_channel(channel_id: str) -> str:
+        """Add the leading # to a channel name if it is missing."""
+        return channel_id if channel_id.startswith("#") else f"#{channel_id}"
 
     def _cmd_create(self, args: list) -> None:
         """Handle /create command."""
@@ -252,9 +274,7 @@ class TADTUIApp(Screen):
             )
             return
 
-        channel_id = args[0]
-        if not channel_id.startswith("#"):
-            channel_id = f"#{channel_id}"
+        channel_id = self._normalize_channel(args[0])
 
         channel_type = "public"
         if len(args) > 1 and args[1].lower() == "private":
@@ -281,9 +301,7 @@ class TADTUIApp(Screen):
             return
 
         target_node_id = args[0]
-        channel_id = args[1]
-        if not channel_id.startswith("#"):
-            channel_id = f"#{channel_id}"
+        channel_id = self._normalize_channel(args[1])
 
         # Call the node method asynchronously
         self.app.call_later(
@@ -300,9 +318,7 @@ class TADTUIApp(Screen):
             self.message_view.add_command_output("Usage: /join <#channel>")
             return
 
-        channel_id = args[0]
-        if not channel_id.startswith("#"):
-            channel_id = f"#{channel_id}"
+        channel_id = self._normalize_channel(args[0])
 
         # Join via node
         self.node.join_channel(channel_id)
@@ -322,9 +338,7 @@ class TADTUIApp(Screen):
             self.message_view.add_command_output("Usage: /leave <#channel>")
             return
 
-        channel_id = args[0]
-        if not channel_id.startswith("#"):
-            channel_id = f"#{channel_id}"
+        channel_id = self._normalize_channel(args[0])
 
         # Can't leave the default channel
         if channel_id == "#general":
@@ -351,9 +365,7 @@ class TADTUIApp(Screen):
             self.message_view.add_command_output("Usage: /switch <#channel>")
             return
 
-        channel_id = args[0]
-        if not channel_id.startswith("#"):
-            channel_id = f"#{channel_id}"
+        channel_id = self._normalize_channel(args[0])
 
         if not self.ui_state.switch_channel(channel_id):
             self.message_view.add_command_output(f"Not subscribed to {channel_id}")
@@ -364,18 +376,15 @@ class TADTUIApp(Screen):
         self.message_view.clear_messages()
 
         # Load history asynchronously
-        self.app.call_later(self._load_channel_history, channel_id)
+        self._spawn(self._load_channel_history(channel_id))
 
         self.message_view.add_system_message(f"Switched to {channel_id}")
         logger.info(f"Switched to channel: {channel_id}")
 
     def _cmd_channels(self, args: list) -> None:
         """Handle /channels command."""
-        channels = list(self.ui_state.subscribed_channels)
-        channels.sort()
-
         output = "Subscribed channels:\n"
-        for ch in channels:
+        for ch in self.ui_state.sorted_channels():
             marker = "▶" if ch == self.ui_state.active_channel else " "
             output += f"  {marker} {ch}\n"
 
@@ -499,7 +508,7 @@ Multi-channel messaging: Type normally to send a message to the active channel."
 
             # Reload current channel history to show imported messages
             if self.ui_state.active_channel:
-                self.app.call_later(self._load_channel_history, self.ui_state.active_channel)
+                self._spawn(self._load_channel_history(self.ui_state.active_channel))
 
         except json.JSONDecodeError as e:
             self.message_view.add_system_message(f"✗ Invalid JSON file: {e}")
@@ -528,21 +537,23 @@ Multi-channel messaging: Type normally to send a message to the active channel."
 
     def action_next_channel(self) -> None:
         """Switch to next channel."""
-        channels = sorted(self.ui_state.subscribed_channels)
+        channels = self.ui_state.sorted_channels()
         if not channels:
             return
 
-        current_idx = channels.index(self.ui_state.active_channel)
+        current_idx = self.ui_state.channel_index(self.ui_state.active_channel)
         next_idx = (current_idx + 1) % len(channels)
         self._cmd_switch([channels[next_idx]])
 
     def action_prev_channel(self) -> None:
         """Switch to previous channel."""
-        channels = sorted(self.ui_state.subscribed_channels)
+        channels = self.ui_state.sorted_channels()
         if not channels:
             return
 
-        current_idx = channels.index(self.ui_state.active_channel)
+        current_idx = self.ui_state.channel_index(self.ui_state.active_channel)
+        if current_idx < 0:
+            current_idx = 0
         prev_idx = (current_idx - 1) % len(channels)
         self._cmd_switch([channels[prev_idx]])
 
@@ -572,4 +583,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-based event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
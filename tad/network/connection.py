@@ -4,17 +4,21 @@ TAD Network Connection Manager
 This module manages TCP connections with peer nodes:
 - Running a TCP server to receive incoming connections
 - Establishing TCP connections to discovered peers
-- Sending and receiving JSON-formatted messages
+- Sending and receiving length-prefixed JSON messages
 - Maintaining active connections for efficient communication
 """
 
 import asyncio
 import json
 import logging
+import struct
 from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Shared compact encoder for wire messages (no whitespace between tokens)
+_WIRE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 class ConnectionManager:
     """
@@ -28,8 +32,11 @@ class ConnectionManager:
 
     # Message protocol constants
     MESSAGE_ENCODING = "utf-8"
-    MESSAGE_TERMINATOR = b"\n"
-    MESSAGE_SIZE_LIMIT = 4096
+    # Largest payload accepted; the StreamReader default that bounded
+    # newline-framed messages before frames were length-prefixed
+    MESSAGE_SIZE_LIMIT = 64 * 1024
+    # Frames are a 4-byte big-endian payload length followed by the payload
+    FRAME_HEADER = struct.Struct(">I")
 
     def __init__(
         self,
@@ -51,8 +58,10 @@ class ConnectionManager:
         self.on_message_received = on_message_received
 
         self.server: Optional[asyncio.Server] = None
-        self.peer_writers: Dict[str, asyncio.StreamWriter] = {}  # addr -> writer
-        self.peer_lock = asyncio.Lock()
+        # addr -> writer. Only touched from the event loop, and never across an
+        # await between a read and the write that depends on it, so it needs
+        # no lock: sends read it directly.
+        self.peer_writers: Dict[str, asyncio.StreamWriter] = {}
         self.active_connections: set = set()  # Track all active connection tasks
 
     async def start(self) -> None:
@@ -76,14 +85,14 @@ class ConnectionManager:
             logger.info("ConnectionManager server stopped")
 
         # Close all peer connections
-        async with self.peer_lock:
-            for addr, writer in list(self.peer_writers.items()):
-                try:
-                    writer.close()
-                    await writer.wait_closed()
-                except Exception:
-                    pass
-            self.peer_writers.clear()
+        writers = list(self.peer_writers.values())
+        self.peer_writers.clear()
+        for writer in writers:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
 
         # Cancel all active connection tasks
         for task in self.active_connections:
@@ -105,10 +114,9 @@ class ConnectionManager:
         try:
             # Check if we already have a connection to this peer
             addr_key = f"{ip}:{port}"
-            async with self.peer_lock:
-                if addr_key in self.peer_writers:
-                    logger.info(f"Already connected to {addr_key}")
-                    return True
+            if addr_key in self.peer_writers:
+                logger.info(f"Already connected to {addr_key}")
+                return True
 
             # Attempt to connect
             try:
@@ -119,9 +127,13 @@ class ConnectionManager:
                 logger.warning(f"Connection timeout to {addr_key}")
                 return False
 
-            # Store the writer for later use
-            async with self.peer_lock:
-                self.peer_writers[addr_key] = writer
+            # Store the writer for later use, unless a concurrent connect to
+            # the same peer finished first
+            if addr_key in self.peer_writers:
+                writer.close()
+                logger.info(f"Already connected to {addr_key}")
+                return True
+            self.peer_writers[addr_key] = writer
 
             logger.info(f"Connected to peer {peer_id} @ {addr_key}")
 
@@ -139,6 +151,34 @@ class ConnectionManager:
             logger.warning(f"Error connecting to {ip}:{port}: {e}")
             return False
 
+    async def connect_to_peers(
+        self, peers: List[Tuple[str, Tuple[str, int]]]
+    ) -> List[bool]:
+        """
+        Connect to several peers concurrently.
+
+        Connection attempts run in parallel, so the worst case is one
+        connect timeout rather than one per peer.
+
+        Args:
+            peers: List of (peer_id, (ip, port)) tuples
+
+        Returns:
+            Per-peer results of connect_to_peer(), in input order
+        """
+        results = [True] * len(peers)
+        pending = []
+        for index, (peer_id, (ip, port)) in enumerate(peers):
+            # Skip the task for peers we are already connected to
+            if f"{ip}:{port}" not in self.peer_writers:
+                pending.append((index, self.connect_to_peer(peer_id, (ip, port))))
+
+        if pending:
+            outcomes = await asyncio.gather(*(coro for _, coro in pending))
+            for (index, _), outcome in zip(pending, outcomes):
+                results[index] = outcome
+        return results
+
     async def _handle_incoming_connection(
         self,
         reader: asyncio.StreamReader,
@@ -154,15 +194,12 @@ class ConnectionManager:
 
         try:
             while True:
-                # Read a message (up to newline)
-                data = await asyncio.wait_for(
-                    reader.readuntil(self.MESSAGE_TERMINATOR), timeout=30.0
-                )
-
-                if not data:
+                data = await asyncio.wait_for(self._read_frame(reader), timeout=30.0)
+                if data is None:
+                    logger.warning(f"Message from {addr_key} exceeds size limit")
                     break
 
-                message = data.decode(self.MESSAGE_ENCODING).strip()
+                message = data.decode(self.MESSAGE_ENCODING)
                 logger.debug(f"Received from {addr_key}: {message}")
 
                 # Invoke the callback
@@ -171,15 +208,10 @@ class ConnectionManager:
                 except Exception as e:
                     logger.warning(f"Error processing message from {addr_key}: {e}")
 
-                # Send acknowledgment
-                ack_response = b"ACK\n"
-                writer.write(ack_response)
-                await writer.drain()
-
         except asyncio.TimeoutError:
             logger.info(f"Connection timeout from {addr_key}")
-        except asyncio.LimitOverrunError:
-            logger.warning(f"Message from {addr_key} exceeds size limit")
+        except asyncio.IncompleteReadError:
+            logger.debug(f"Connection closed from {addr_key}")
         except Exception as e:
             logger.debug(f"Connection closed from {addr_key}: {e}")
         finally:
@@ -187,9 +219,28 @@ class ConnectionManager:
             await writer.wait_closed()
 
             # Remove from peer writers if it was stored
-            async with self.peer_lock:
-                if addr_key in self.peer_writers:
-                    del self.peer_writers[addr_key]
+            if self.peer_writers.get(addr_key) is writer:
+                del self.peer_writers[addr_key]
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Read one length-prefixed frame from a stream.
+
+        Args:
+            reader: The stream to read from
+
+        Returns:
+            The frame payload, or None if the announced length exceeds
+            MESSAGE_SIZE_LIMIT
+
+        Raises:
+            asyncio.IncompleteReadError: If the stream ends mid-frame
+        """
+        header = await reader.readexactly(self.FRAME_HEADER.size)
+        (length,) = self.FRAME_HEADER.unpack(header)
+        if length > self.MESSAGE_SIZE_LIMIT:
+            return None
+        return await reader.readexactly(length)
 
     async def _listen_to_peer(
         self,
@@ -204,14 +255,12 @@ class ConnectionManager:
         """
         try:
             while True:
-                data = await asyncio.wait_for(
-                    reader.readuntil(self.MESSAGE_TERMINATOR), timeout=30.0
-                )
-
-                if not data:
+                data = await asyncio.wait_for(self._read_frame(reader), timeout=30.0)
+                if data is None:
+                    logger.warning(f"Message from {addr_key} exceeds size limit")
                     break
 
-                message = data.decode(self.MESSAGE_ENCODING).strip()
+                message = data.decode(self.MESSAGE_ENCODING)
                 logger.debug(f"Received from {addr_key}: {message}")
 
                 # Invoke the callback
@@ -222,6 +271,8 @@ class ConnectionManager:
 
         except asyncio.TimeoutError:
             logger.debug(f"Peer {addr_key} timeout")
+        except asyncio.IncompleteReadError:
+            logger.debug(f"Peer {addr_key} closed the connection")
         except asyncio.CancelledError:
             logger.debug(f"Peer {addr_key} connection cancelled")
         except Exception as e:
@@ -230,10 +281,9 @@ class ConnectionManager:
             writer.close()
             await writer.wait_closed()
 
-            # Remove from peer writers
-            async with self.peer_lock:
-                if addr_key in self.peer_writers:
-                    del self.peer_writers[addr_key]
+            # Remove from peer writers (unless it was already replaced)
+            if self.peer_writers.get(addr_key) is writer:
+                del self.peer_writers[addr_key]
 
             logger.info(f"Disconnected from {addr_key}")
 
@@ -248,16 +298,54 @@ class ConnectionManager:
         Returns:
             True if message sent successfully, False otherwise
         """
-        async with self.peer_lock:
-            writer = self.peer_writers.get(addr_key)
-            if not writer:
-                logger.warning(f"No connection to {addr_key}")
-                return False
+        writer = self.peer_writers.get(addr_key)
+        if not writer:
+            logger.warning(f"No connection to {addr_key}")
+            return False
 
         try:
-            message_json = json.dumps(message)
-            message_bytes = (message_json + "\n").encode(self.MESSAGE_ENCODING)
+            message_bytes = self._encode_message(message)
+        except ValueError as e:
+            logger.warning(f"Not sending message to {addr_key}: {e}")
+            return False
+        return await self._write_message(addr_key, writer, message_bytes)
+
+    def _encode_message(self, message: dict) -> bytes:
+        """
+        Serialize a message into a length-prefixed wire frame.
+
+        Args:
+            message: Dictionary to be serialized as JSON
+
+        Returns:
+            Encoded frame bytes
 
+        Raises:
+            ValueError: If the encoded message exceeds MESSAGE_SIZE_LIMIT
+        """
+        payload = _WIRE_ENCODER.encode(message).encode(self.MESSAGE_ENCODING)
+        if len(payload) > self.MESSAGE_SIZE_LIMIT:
+            raise ValueError(
+                f"Message of {len(payload)} bytes exceeds "
+                f"{self.MESSAGE_SIZE_LIMIT} byte limit"
+            )
+        return self.FRAME_HEADER.pack(len(payload)) + payload
+
+    async def _write_message(
+        self, addr_key: str, writer: asyncio.StreamWriter, message_bytes: bytes
+    ) -> bool:
+        """
+        Write an encoded message to a peer and wait for it to drain.
+
+        Args:
+            addr_key: Address key "ip:port" (for logging)
+            writer: The peer's StreamWriter
+            message_bytes: Encoded frame from _encode_message()
+
+        Returns:
+            True if message sent successfully, False otherwise
+        """
+        try:
             writer.write(message_bytes)
             await writer.drain()
 
@@ -278,15 +366,24 @@ class ConnectionManager:
         Returns:
             Number of peers the message was successfully sent to
         """
-        async with self.peer_lock:
-            addresses = list(self.peer_writers.keys())
+        writers = list(self.peer_writers.items())
 
-        success_count = 0
-        for addr in addresses:
-            if await self.send_message(addr, message):
-                success_count += 1
+        # Encode once and drain all peers concurrently, so a broadcast takes
+        # as long as the slowest peer rather than the sum of all of them
+        try:
+            message_bytes = self._encode_message(message)
+        except ValueError as e:
+            logger.warning(f"Not broadcasting message: {e}")
+            return 0
+        results = await asyncio.gather(
+            *(
+                self._write_message(addr, writer, message_bytes)
+                for addr, writer in writers
+            )
+        )
+        success_count = sum(results)
 
-        logger.info(f"Broadcast message sent to {success_count}/{len(addresses)} peers")
+        logger.info(f"Broadcast message sent to {success_count}/{len(writers)} peers")
         return success_count
 
     def get_active_writers(self) -> Dict[str, asyncio.StreamWriter]:
@@ -306,5 +403,4 @@ class ConnectionManager:
         Returns:
             List of "ip:port" address strings
         """
-        async with self.peer_lock:
-            return list(self.peer_writers.keys())
+        return list(self.peer_writers.keys())
@@ -236,8 +236,8 @@ class TADNode:
         if self.e2ee_manager.has_channel_key(channel_id):
             try:
                 # 1. Decrypt the content
-                decrypted_content = self.e2ee_manager.decrypt_message(
-                    self.e2ee_manager.get_channel_key(channel_id),
+                decrypted_content = self.e2ee_manager.decrypt_channel_message(
+                    channel_id,
                     content,  # Ciphertext
                     payload.get("nonce"),  # Nonce
                 )
@@ -504,8 +504,8 @@ class TADNode:
 
         # Milestone 6: Decrypt messages if channel is private
         if self.e2ee_manager.has_channel_key(channel_id):
-            decrypted_messages = []
-            channel_key = self.e2ee_manager.get_channel_key(channel_id)
+            payloads = []
+            encrypted = []
 
             for msg in messages:
                 # Ensure payload is a dictionary
@@ -517,11 +517,19 @@ class TADNode:
                     )
                 except (json.JSONDecodeError, TypeError):
                     payload = {"content": msg.get("content", "")}
+                payloads.append(payload)
+                if payload.get("is_encrypted"):
+                    encrypted.append((payload["content"], payload["nonce"]))
+
+            # Decrypt all encrypted payloads with a single cipher lookup
+            plaintexts = iter(
+                self.e2ee_manager.decrypt_channel_messages(channel_id, encrypted)
+            )
 
+            decrypted_messages = []
+            for msg, payload in zip(messages, payloads):
                 if payload.get("is_encrypted"):
-                    decrypted_content = self.e2ee_manager.decrypt_message(
-                        channel_key, payload["content"], payload["nonce"]
-                    )
+                    decrypted_content = next(plaintexts)
                     if decrypted_content is not None:
                         payload["content"] = decrypted_content
                         msg["payload"] = payload
@@ -572,8 +580,9 @@ class TADNode:
         extra_payload = {}
         # Milestone 6: Encrypt message if sending to a private channel
         if self.e2ee_manager.has_channel_key(channel_id):
-            channel_key = self.e2ee_manager.get_channel_key(channel_id)
-            ciphertext, nonce = self.e2ee_manager.encrypt_message(channel_key, content)
+            ciphertext, nonce = self.e2ee_manager.encrypt_channel_message(
+                channel_id, content
+            )
 
             # Replace original content with ciphertext
             content = ciphertext
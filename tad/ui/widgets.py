@@ -278,21 +278,54 @@ class MessageView(Static):
             timestamp: Message timestamp
         """
         log = self.query_one("#message_log", RichLog)
+        log.write(self._format_message(content, sender, channel, timestamp))
 
-        # Format message with colors and structure
+    def add_messages(
+        self, messages: List[Dict[str, str]], system_message: Optional[str] = None
+    ) -> None:
+        """
+        Add several messages to the view in one write.
+
+        The log renders, resizes and scrolls once for the whole batch instead
+        of once per message (e.g. when loading channel history).
+
+        Args:
+            messages: Dicts with add_message() keyword arguments
+            system_message: Optional system message shown before the batch
+        """
+        lines = [self._format_message(**message) for message in messages]
+        if system_message is not None:
+            lines.insert(0, self._format_system_message(system_message))
+        if not lines:
+            return
+
+        log = self.query_one("#message_log", RichLog)
+        log.write(Text("\n").join(lines))
+
+    @staticmethod
+    def _format_message(
+        content: str,
+        sender: str = "System",
+        channel: str = "#general",
+        timestamp: str = "",
+    ) -> Text:
+        """Format a message with colors and structure."""
         formatted = Text()
         formatted.append(f"[{timestamp}] " if timestamp else "")
         formatted.append(f"[{channel}] ", style="cyan")
         formatted.append(f"<{sender}> ", style="yellow bold")
         formatted.append(content, style="white")
-
-        log.write(formatted)
+        return formatted
 
     def add_system_message(self, message: str) -> None:
         """Add a system message (e.g., user joined, left)."""
         log = self.query_one("#message_log", RichLog)
-        formatted = Text(f"→ {message}", style="cyan italic")
-        log.write(formatted)
+        log.write(self._format_system_message(message))
+
+    @staticmethod
+    def _format_system_message(message: str) -> Text:
+        """Format a system message."""
+        return Text(f"→ {message}", style="cyan italic")
 
     def add_command_output(self, output: str) -> None:
         """Add command output to the view."""
@@ -402,14 +435,38 @@ class UIState:
     subscribed_channels: Set[str] = field(default_factory=lambda: {"#general"})
     unread_counts: Dict[str, int] = field(default_factory=dict)
     connected_peers: List[str] = field(default_factory=list)
+    # Sorted channel list and positions, rebuilt lazily after add/remove
+    _sorted_channels: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _channel_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def add_channel(self, channel_id: str) -> None:
         """Add a channel to subscriptions."""
         self.subscribed_channels.add(channel_id)
+        self._sorted_channels = None
 
     def remove_channel(self, channel_id: str) -> None:
         """Remove a channel from subscriptions."""
         self.subscribed_channels.discard(channel_id)
+        self._sorted_channels = None
+
+    def sorted_channels(self) -> List[str]:
+        """Get subscribed channels in display/navigation order."""
+        if self._sorted_channels is None:
+            self._sorted_channels = sorted(self.subscribed_channels)
+            self._channel_index = {
+                channel_id: index
+                for index, channel_id in enumerate(self._sorted_channels)
+            }
+        return self._sorted_channels
+
+    def channel_index(self, channel_id: str) -> int:
+        """Get a channel's position in sorted_channels(), or -1 if absent."""
+        self.sorted_channels()
+        return self._channel_index.get(channel_id, -1)
 
     def switch_channel(self, channel_id: str) -> bool:
         """Switch to a channel."""
@@ -10,6 +10,7 @@ This file provides:
 import asyncio
 import json
 import socket
+import struct
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock
 
@@ -19,6 +20,20 @@ import pytest
 pytest_plugins = ("pytest_asyncio",)
 
 
+def framed_reads(header: struct.Struct, *payloads: bytes) -> list:
+    """
+    Build readexactly() results for length-prefixed frames, then EOF.
+
+    Args:
+        header: The node's FRAME_HEADER struct
+        payloads: Frame payloads, in the order they are read
+    """
+    reads = []
+    for payload in payloads:
+        reads += [header.pack(len(payload)), payload]
+    return reads + [asyncio.IncompleteReadError(b"", None)]
+
+
 @pytest.fixture
 def mock_app():
     """
@@ -172,9 +187,15 @@ def mock_stream_writer():
     Create a mock asyncio.StreamWriter for testing TCP message handling.
     """
     writer = AsyncMock()
-    writer.get_extra_info = Mock(return_value=("127.0.0.1", 54321))
+    writer.get_extra_info = Mock(
+        side_effect=lambda name, default=None: (
+            ("127.0.0.1", 54321) if name == "peername" else default
+        )
+    )
     writer.write = Mock()
     writer.drain = AsyncMock()
+    writer.transport = Mock()
+    writer.transport.get_write_buffer_size.return_value = 0
     writer.close = Mock()
     writer.wait_closed = AsyncMock()
     return writer
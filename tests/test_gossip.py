@@ -8,12 +8,23 @@ These tests focus on the gossip-specific functionality of TAZCOMNodeGossip:
 """
 
 import asyncio
+import functools
 import json
+from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from poc_04_gossip import TAZCOMNodeGossip
+from poc_04_gossip import Peer, TAZCOMNodeGossip
+from tests.conftest import framed_reads
+
+
+_framed_reads = functools.partial(framed_reads, TAZCOMNodeGossip.FRAME_HEADER)
+
+
+def _frame_payload(frame: bytes) -> dict:
+    """Decode the JSON payload of a length-prefixed frame."""
+    return json.loads(frame[TAZCOMNodeGossip.FRAME_HEADER.size:])
 
 
 class TestMessageDeduplication:
@@ -34,13 +45,13 @@ class TestMessageDeduplication:
             "ttl": 2,
         }
 
-        # Manually add msg_id to seen_messages
-        node.seen_messages.append("unique-msg-123")
+        # Manually add msg_id to the seen cache
+        node._mark_seen("unique-msg-123")
 
         # Setup stream to return this message
-        mock_stream_reader.readuntil.return_value = (
-            json.dumps(message) + "\n"
-        ).encode("utf-8")
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(message).encode("utf-8")
+        )
 
         # Call handler
         await node.handle_connection(mock_stream_reader, mock_stream_writer)
@@ -51,7 +62,29 @@ class TestMessageDeduplication:
         # But ACK was still sent
         mock_stream_writer.write.assert_called()
         written_data = mock_stream_writer.write.call_args[0][0]
-        assert written_data == b"ACK\n"
+        assert written_data == TAZCOMNodeGossip.ACK_FRAME
+
+    @pytest.mark.asyncio
+    async def test_duplicate_compact_frame_skips_parse(
+        self, initialized_gossip_node, mock_stream_reader, mock_stream_writer
+    ):
+        """Test that a duplicate in compact wire form is ACKed without json.loads."""
+        node = initialized_gossip_node
+        node._mark_seen("dup-msg-789")
+
+        frame = TAZCOMNodeGossip._encode_frame(
+            {"type": "CHAT", "msg_id": "dup-msg-789", "from": "peer", "content": "Hi", "ttl": 2}
+        )
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            frame[TAZCOMNodeGossip.FRAME_HEADER.size:]
+        )
+
+        with patch("poc_04_gossip.json.loads") as mock_loads:
+            await node.handle_connection(mock_stream_reader, mock_stream_writer)
+
+        mock_loads.assert_not_called()
+        node.app.on_message_received.assert_not_called()
+        assert mock_stream_writer.write.call_args[0][0] == TAZCOMNodeGossip.ACK_FRAME
 
     @pytest.mark.asyncio
     async def test_first_message_is_processed(self, initialized_gossip_node, mock_stream_reader, mock_stream_writer):
@@ -67,9 +100,9 @@ class TestMessageDeduplication:
             "ttl": 2,
         }
 
-        mock_stream_reader.readuntil.return_value = (
-            json.dumps(message) + "\n"
-        ).encode("utf-8")
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(message).encode("utf-8")
+        )
 
         # Ensure msg_id is NOT in seen_messages
         assert "new-msg-456" not in node.seen_messages
@@ -83,6 +116,43 @@ class TestMessageDeduplication:
         # Verify msg_id was added to seen_messages
         assert "new-msg-456" in node.seen_messages
 
+    @pytest.mark.asyncio
+    async def test_every_frame_gets_one_reply(
+        self, initialized_gossip_node, mock_stream_reader, mock_stream_writer
+    ):
+        """Test that unknown message types are answered, keeping replies in order."""
+        node = initialized_gossip_node
+
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps({"type": "PING"}).encode("utf-8"),
+            json.dumps({"type": "HELLO"}).encode("utf-8"),
+        )
+
+        await node.handle_connection(mock_stream_reader, mock_stream_writer)
+
+        replies = [call.args[0] for call in mock_stream_writer.write.call_args_list]
+        assert replies == [TAZCOMNodeGossip.ERROR_FRAME, TAZCOMNodeGossip.ACK_FRAME]
+
+    @pytest.mark.asyncio
+    async def test_oversized_frame_closes_connection(
+        self, initialized_gossip_node, mock_stream_reader, mock_stream_writer
+    ):
+        """Test that a frame announcing more than MESSAGE_SIZE_LIMIT is refused."""
+        node = initialized_gossip_node
+        # The default limit is the largest length the header can encode
+        node.MESSAGE_SIZE_LIMIT = 1024
+
+        mock_stream_reader.readexactly.side_effect = [
+            TAZCOMNodeGossip.FRAME_HEADER.pack(node.MESSAGE_SIZE_LIMIT + 1)
+        ]
+
+        await node.handle_connection(mock_stream_reader, mock_stream_writer)
+
+        # The payload is never read and nothing reaches the UI
+        assert mock_stream_reader.readexactly.call_count == 1
+        node.app.on_message_received.assert_not_called()
+        mock_stream_writer.close.assert_called()
+
 
 class TestMessageForwarding:
     """Tests for message forwarding logic."""
@@ -94,8 +164,8 @@ class TestMessageForwarding:
 
         # Add some peers
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
-            "peer_2": {"ip": "127.0.0.3", "port": "54323", "name": "Peer 2"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
+            "peer_2": Peer("127.0.0.3", 54323, "Peer 2"),
         }
 
         # Mock the _forward_to_peer method
@@ -119,7 +189,7 @@ class TestMessageForwarding:
 
         # Verify ttl was decremented
         first_call_args = node._forward_to_peer.call_args_list[0]
-        forwarded_msg = first_call_args[0][2]
+        forwarded_msg = _frame_payload(first_call_args[0][2])
         assert forwarded_msg["ttl"] == 1  # Decremented from 2
 
     @pytest.mark.asyncio
@@ -128,7 +198,7 @@ class TestMessageForwarding:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._forward_to_peer = AsyncMock()
@@ -154,7 +224,7 @@ class TestMessageForwarding:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._forward_to_peer = AsyncMock()
@@ -172,9 +242,64 @@ class TestMessageForwarding:
 
         # Verify ttl was decremented to 2
         call_args = node._forward_to_peer.call_args_list[0]
-        forwarded_msg = call_args[0][2]
+        forwarded_msg = _frame_payload(call_args[0][2])
         assert forwarded_msg["ttl"] == 2
 
+    @pytest.mark.asyncio
+    async def test_forward_skips_relay_and_origin(self, initialized_gossip_node):
+        """Test that a message is not echoed back to its relay or its author."""
+        node = initialized_gossip_node
+
+        node.peers = {
+            "relay": Peer("127.0.0.2", 54322, "Relay"),
+            "origin_peer": Peer("127.0.0.3", 54323, "Origin"),
+            "other": Peer("127.0.0.4", 54324, "Other"),
+        }
+        node.ip_to_peers = {
+            "127.0.0.2": {"relay"},
+            "127.0.0.3": {"origin_peer"},
+            "127.0.0.4": {"other"},
+        }
+        node._forward_to_peer = AsyncMock()
+
+        message = {
+            "type": "CHAT",
+            "msg_id": "skip-test",
+            "from": "origin_peer",
+            "content": "Test",
+            "ttl": 3,
+        }
+
+        await node.forward_message(message, ("127.0.0.2", 40000))
+
+        node._forward_to_peer.assert_called_once()
+        assert node._forward_to_peer.call_args[0][0] == "other"
+
+    @pytest.mark.asyncio
+    async def test_forward_fanout_is_bounded(self, initialized_gossip_node):
+        """Test that a message is relayed to at most GOSSIP_FANOUT peers."""
+        node = initialized_gossip_node
+
+        node.peers = {
+            f"peer_{i}": Peer(f"127.0.1.{i}", 54000 + i, f"Peer {i}")
+            for i in range(TAZCOMNodeGossip.GOSSIP_FANOUT + 4)
+        }
+        node._forward_to_peer = AsyncMock()
+
+        message = {
+            "type": "CHAT",
+            "msg_id": "fanout-test",
+            "from": "origin_peer",
+            "content": "Test",
+            "ttl": 3,
+        }
+
+        await node.forward_message(message, ("127.0.0.1", 54321))
+
+        targets = [call.args[0] for call in node._forward_to_peer.call_args_list]
+        assert len(targets) == TAZCOMNodeGossip.GOSSIP_FANOUT
+        assert len(set(targets)) == len(targets)
+
 
 class TestMessageBroadcast:
     """Tests for message broadcasting with gossip metadata."""
@@ -185,7 +310,7 @@ class TestMessageBroadcast:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._send_chat_message = AsyncMock()
@@ -198,8 +323,8 @@ class TestMessageBroadcast:
         assert node._send_chat_message.call_count == 2
 
         # Extract msg_ids from the calls
-        msg_id_1 = node._send_chat_message.call_args_list[0][0][2]["msg_id"]
-        msg_id_2 = node._send_chat_message.call_args_list[1][0][2]["msg_id"]
+        msg_id_1 = _frame_payload(node._send_chat_message.call_args_list[0][0][2])["msg_id"]
+        msg_id_2 = _frame_payload(node._send_chat_message.call_args_list[1][0][2])["msg_id"]
 
         # msg_ids should be different
         assert msg_id_1 != msg_id_2
@@ -210,7 +335,7 @@ class TestMessageBroadcast:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._send_chat_message = AsyncMock()
@@ -219,7 +344,7 @@ class TestMessageBroadcast:
 
         # Verify TTL was set
         call_args = node._send_chat_message.call_args_list[0]
-        message = call_args[0][2]
+        message = _frame_payload(call_args[0][2])
         assert message["ttl"] == TAZCOMNodeGossip.INITIAL_TTL
 
     @pytest.mark.asyncio
@@ -228,7 +353,7 @@ class TestMessageBroadcast:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._send_chat_message = AsyncMock()
@@ -240,6 +365,19 @@ class TestMessageBroadcast:
         # Verify msg was added to seen_messages
         assert len(node.seen_messages) == initial_size + 1
 
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_long_non_ascii_message(self, initialized_gossip_node):
+        """Test that escaped non-ASCII text well past 1 KiB is still sent."""
+        node = initialized_gossip_node
+        node.peers = {
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
+        }
+        node._send_chat_message = AsyncMock()
+
+        await node.broadcast_message("Привет, мир! 😀" * 50)
+
+        assert node._send_chat_message.call_count == 1
+
     @pytest.mark.asyncio
     async def test_broadcast_with_no_peers(self, initialized_gossip_node):
         """Test broadcast when no peers are connected."""
@@ -253,15 +391,20 @@ class TestMessageBroadcast:
 
 
 class TestSeenMessagesCache:
-    """Tests for the seen_messages deque cache."""
+    """Tests for the seen_messages cache."""
 
-    @pytest.mark.asyncio
-    async def test_seen_messages_max_size(self, initialized_gossip_node):
-        """Test that seen_messages cache respects max size limit."""
+    def test_seen_messages_expire_by_age(self, initialized_gossip_node):
+        """Test that ids older than SEEN_MESSAGES_TTL are forgotten."""
         node = initialized_gossip_node
 
-        # The cache has a maxlen (circular buffer behavior)
-        assert node.seen_messages.maxlen == TAZCOMNodeGossip.SEEN_MESSAGES_MAX_SIZE
+        with patch("poc_04_gossip.time.monotonic", return_value=1000.0):
+            node._mark_seen("old_msg")
+        later = 1000.0 + TAZCOMNodeGossip.SEEN_MESSAGES_TTL + 1
+        with patch("poc_04_gossip.time.monotonic", return_value=later):
+            node._mark_seen("new_msg")
+
+        assert "old_msg" not in node.seen_messages
+        assert "new_msg" in node.seen_messages
 
     def test_seen_messages_circular_buffer(self, initialized_gossip_node):
         """Test that seen_messages behaves as circular buffer."""
@@ -269,7 +412,7 @@ class TestSeenMessagesCache:
 
         # Add messages beyond max size
         for i in range(TAZCOMNodeGossip.SEEN_MESSAGES_MAX_SIZE + 100):
-            node.seen_messages.append(f"msg_{i}")
+            node._mark_seen(f"msg_{i}")
 
         # Cache should only contain last SEEN_MESSAGES_MAX_SIZE items
         assert len(node.seen_messages) == TAZCOMNodeGossip.SEEN_MESSAGES_MAX_SIZE
@@ -301,9 +444,9 @@ class TestGossipProtocolIntegration:
             "ttl": 2,
         }
 
-        mock_stream_reader.readuntil.return_value = (
-            json.dumps(message) + "\n"
-        ).encode("utf-8")
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(message).encode("utf-8")
+        )
 
         # Ensure msg_id is NOT in seen_messages initially
         assert "integration-test-001" not in node.seen_messages
@@ -320,7 +463,7 @@ class TestGossipProtocolIntegration:
 
         # Setup peer
         node.peers = {
-            "peer_relay": {"ip": "127.0.0.2", "port": "54322", "name": "Relay"},
+            "peer_relay": Peer("127.0.0.2", 54322, "Relay"),
         }
 
         # Mock the forwarding
@@ -339,10 +482,10 @@ class TestGossipProtocolIntegration:
         # Simulate receiving the message
         mock_reader = AsyncMock()
         mock_writer = AsyncMock()
-        mock_writer.get_extra_info.return_value = ("127.0.0.1", 54321)
-        mock_reader.readuntil.return_value = (
-            json.dumps(message) + "\n"
-        ).encode("utf-8")
+        mock_writer.get_extra_info = MagicMock(return_value=("127.0.0.1", 54321))
+        mock_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(message).encode("utf-8")
+        )
 
         await node.handle_connection(mock_reader, mock_writer)
 
@@ -357,6 +500,122 @@ class TestGossipProtocolIntegration:
         node._forward_to_peer.assert_called_once()
 
 
+class TestPersistentConnections:
+    """Tests for the per-peer persistent outbound connections."""
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_sends(self, initialized_gossip_node):
+        """Test that consecutive sends to a peer share one TCP connection."""
+        node = initialized_gossip_node
+        connections = []
+
+        async def handler(reader, writer):
+            connections.append(writer)
+            await node.handle_connection(reader, writer)
+
+        node.server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = node.server.sockets[0].getsockname()[1]
+        peer = Peer("127.0.0.1", port, "Self")
+
+        for _ in range(3):
+            ack = await node._send_frame("peer_1", peer, TAZCOMNodeGossip._encode_frame({"type": "HELLO"}))
+            assert ack == b"ACK"
+
+        assert len(connections) == 1
+        assert "peer_1" in node.conns
+
+        await node.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_send_drops_cached_connection(self, initialized_gossip_node):
+        """Test that a broken connection is removed so the next send re-dials."""
+        node = initialized_gossip_node
+
+        reader = MagicMock()
+        reader.at_eof.return_value = False
+        writer = MagicMock()
+        writer.is_closing.return_value = False
+        writer.drain = AsyncMock(side_effect=ConnectionResetError())
+        node.conns["peer_1"] = (reader, writer)
+        node.pending_acks["peer_1"] = deque()
+
+        peer = Peer("127.0.0.1", 1, "Peer")
+        with pytest.raises(ConnectionResetError):
+            await node._send_frame("peer_1", peer, TAZCOMNodeGossip._encode_frame({"type": "HELLO"}))
+
+        assert "peer_1" not in node.conns
+        writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_times_out(self, initialized_gossip_node):
+        """Test that a peer that never accepts is given up on after CONNECT_TIMEOUT."""
+        node = initialized_gossip_node
+        node.CONNECT_TIMEOUT = 0.05
+
+        async def hang(*args):
+            await asyncio.sleep(10)
+
+        peer = Peer("127.0.0.1", 1, "Peer")
+        with patch("asyncio.open_connection", hang):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(node._get_writer("peer_1", peer), 1.0)
+
+        assert "peer_1" not in node.conns
+
+    @pytest.mark.asyncio
+    async def test_unacked_sends_are_pipelined(self, initialized_gossip_node):
+        """Test that fire-and-forget sends do not block a later ACK wait."""
+        node = initialized_gossip_node
+
+        async def handler(reader, writer):
+            await node.handle_connection(reader, writer)
+
+        node.server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = node.server.sockets[0].getsockname()[1]
+        peer = Peer("127.0.0.1", port, "Self")
+
+        for _ in range(5):
+            ack = await node._send_frame(
+                "peer_1", peer, TAZCOMNodeGossip._encode_frame({"type": "HELLO"}), expect_ack=False
+            )
+            assert ack is None
+
+        ack = await node._send_frame("peer_1", peer, TAZCOMNodeGossip._encode_frame({"type": "HELLO"}))
+        assert ack == b"ACK"
+        assert not node.pending_acks["peer_1"]
+
+        await node.shutdown()
+
+
+class TestServiceDiscovery:
+    """Tests for Zeroconf callbacks crossing into the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_state_change_from_zeroconf_thread_runs_handler(
+        self, initialized_gossip_node
+    ):
+        """Test that a removal reported on another thread runs on the loop."""
+        from zeroconf import ServiceStateChange
+
+        node = initialized_gossip_node
+        node.event_loop = asyncio.get_running_loop()
+        node._on_service_removed = AsyncMock()
+
+        name = "TAZCOM Node abcd1234._tazcom._tcp.local."
+        await asyncio.to_thread(
+            node._on_service_state_change,
+            MagicMock(),
+            "_tazcom._tcp.local.",
+            name,
+            ServiceStateChange.Removed,
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        node._on_service_removed.assert_awaited_once_with(name)
+        assert not node._discovery_tasks
+
+
 class TestMessageID:
     """Tests for message ID generation."""
 
@@ -366,7 +625,7 @@ class TestMessageID:
         node = initialized_gossip_node
 
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         node._send_chat_message = AsyncMock()
@@ -375,7 +634,7 @@ class TestMessageID:
 
         # Extract msg_id from the sent message
         call_args = node._send_chat_message.call_args_list[0]
-        msg_id = call_args[0][2]["msg_id"]
+        msg_id = _frame_payload(call_args[0][2])["msg_id"]
 
         # msg_id should be a string
         assert isinstance(msg_id, str)
@@ -384,7 +643,7 @@ class TestMessageID:
         assert len(msg_id) > 0
 
         # msg_id should be deterministic (hash-based)
-        assert len(msg_id) == 16  # SHA256 truncated to 16 chars
+        assert len(msg_id) == 16  # 8-byte BLAKE2b digest as hex
 
 
 class TestGossipShutdown:
@@ -397,7 +656,7 @@ class TestGossipShutdown:
 
         # Setup peers
         node.peers = {
-            "peer_1": {"ip": "127.0.0.2", "port": "54322"},
+            "peer_1": Peer("127.0.0.2", 54322, "Peer 1"),
         }
 
         # Mock _forward_to_peer to simulate pending operation
@@ -0,0 +1,142 @@
+"""
+Unit tests for TAD identity management.
+
+Test Coverage:
+- Detached signatures from sign_data() / sign_batch()
+- Verification of malformed signatures and keys
+- Batch verification on the thread pool
+- Atomic, owner-only profile writes
+"""
+
+import os
+import stat
+
+import pytest
+
+import tad.identity
+from tad.identity import VERIFY_BATCH_MIN_PARALLEL, IdentityManager
+
+
+@pytest.fixture
+def identity_manager(tmp_path):
+    """Create an IdentityManager with a fresh identity in a temp directory."""
+    manager = IdentityManager(profile_path=str(tmp_path / "profile.json"))
+    manager.load_or_create("alice")
+    return manager
+
+
+class TestSigning:
+    """Tests for message signing."""
+
+    def test_sign_data_matches_signing_key(self, identity_manager):
+        """Test that sign_data() produces the SigningKey's detached signature."""
+        identity = identity_manager.identity
+        data = b"hello, tad"
+
+        signature = identity_manager.sign_data(data)
+
+        assert signature == identity.signing_key.sign(data).signature
+        assert IdentityManager.verify_signature(
+            data, signature, identity.verify_key_hex
+        )
+
+    def test_identity_sign_detached(self, identity_manager):
+        """Test that Identity.sign_detached() matches SigningKey.sign()."""
+        identity = identity_manager.identity
+
+        assert identity.sign_detached(b"data") == (
+            identity.signing_key.sign(b"data").signature
+        )
+
+    def test_sign_batch_matches_sign_data(self, identity_manager):
+        """Test that sign_batch() signs each item like sign_data(), in order."""
+        identity = identity_manager.identity
+        items = [b"", b"one", b"two" * 100]
+
+        signatures = identity_manager.sign_batch(items)
+
+        assert signatures == [
+            identity.signing_key.sign(data).signature for data in items
+        ]
+        for data, signature in zip(items, signatures):
+            assert IdentityManager.verify_signature(
+                data, signature, identity.verify_key_hex
+            )
+
+    def test_verify_rejects_malformed_input(self, identity_manager):
+        """Test that wrongly typed or sized input fails verification quietly."""
+        identity = identity_manager.identity
+        signature = identity_manager.sign_data(b"a")
+        key_hex = identity.verify_key_hex
+        key_bytes = identity.verify_key_bytes
+
+        assert not IdentityManager.verify_signature(b"a", None, key_hex)
+        assert not IdentityManager.verify_signature(b"a", signature, None)
+        assert not IdentityManager.verify_signature(b"a", signature, 12345)
+        assert not IdentityManager.verify_signature(b"a", signature[:-1], key_hex)
+        assert not IdentityManager.verify_signature_raw(b"a", None, key_bytes)
+        assert not IdentityManager.verify_signature_raw(b"a", signature, None)
+        assert not IdentityManager.verify_signature_raw(b"a", signature, key_bytes[:-1])
+        assert IdentityManager.verify_signature_raw(b"a", signature, key_bytes)
+
+
+class TestProfilePersistence:
+    """Tests for writing profile.json."""
+
+    def test_profile_is_owner_only(self, tmp_path):
+        """Test that a new profile has mode 0600 and leaves no temp file."""
+        profile_path = tmp_path / "profile.json"
+        IdentityManager(profile_path=str(profile_path)).load_or_create("alice")
+
+        assert stat.S_IMODE(profile_path.stat().st_mode) == 0o600
+        assert not (tmp_path / "profile.json.tmp").exists()
+
+    def test_failed_write_removes_temp_file(self, tmp_path, monkeypatch):
+        """Test that a failed write leaves neither a profile nor a temp file."""
+        profile_path = tmp_path / "profile.json"
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+
+        with pytest.raises(OSError):
+            IdentityManager(profile_path=str(profile_path)).load_or_create("alice")
+
+        assert not profile_path.exists()
+        assert not (tmp_path / "profile.json.tmp").exists()
+
+
+class TestBatchVerification:
+    """Tests for verify_signature_batch()."""
+
+    def test_thread_pool_batch_keeps_input_order(
+        self, identity_manager, monkeypatch
+    ):
+        """Test that a pooled batch flags the tampered entry, in input order."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        pool_calls = []
+        get_executor = tad.identity._get_verify_executor
+
+        def tracking_get_executor():
+            pool_calls.append(True)
+            return get_executor()
+
+        monkeypatch.setattr(
+            tad.identity, "_get_verify_executor", tracking_get_executor
+        )
+
+        public_key_hex = identity_manager.identity.verify_key_hex
+        items = [f"message {i}".encode() for i in range(VERIFY_BATCH_MIN_PARALLEL * 2)]
+        messages = [
+            (data, signature, public_key_hex)
+            for data, signature in zip(items, identity_manager.sign_batch(items))
+        ]
+        tampered = 77
+        data, signature, key = messages[tampered]
+        messages[tampered] = (data + b"!", signature, key)
+
+        results = IdentityManager.verify_signature_batch(messages)
+
+        assert pool_calls, "Batch should have used the thread pool"
+        assert results == [i != tampered for i in range(len(messages))]
@@ -132,8 +132,9 @@ class TestFullApplicationFlow:
         app.peer_list = MagicMock()
         app.peer_list.update_peers = MagicMock()
 
-        # Call peer update callback
+        # Call peer update callback and let the coalesced refresh run
         app.on_peer_update()
+        await asyncio.sleep(app.PEER_REFRESH_DELAY * 2)
 
         # Verify peer list was updated
         app.peer_list.update_peers.assert_called_once_with(app.node.peers)
@@ -229,14 +230,74 @@ class TestUIWidgetUpdates:
         app.peer_list = MagicMock()
         app.peer_list.update_peers = MagicMock()
 
-        # Call update
+        # Call update and let the coalesced refresh run
         app.on_peer_update()
+        await asyncio.sleep(app.PEER_REFRESH_DELAY * 2)
 
         # Verify correct peers dict was passed
         app.peer_list.update_peers.assert_called_once()
         args, _ = app.peer_list.update_peers.call_args
         assert args[0] == peers
 
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_peer_list_widget_caches_render(self, temp_node_dir):
+        """Test that the peer list only re-renders when the peer set changes."""
+        from poc_03_chat_basic import PeerListWidget
+
+        widget = PeerListWidget()
+        assert widget.render() == PeerListWidget.EMPTY_MARKUP
+
+        with patch.object(widget, "refresh") as mock_refresh:
+            peers = {"peer_bbbb_1": {}, "peer_aaaa_2": {}}
+            widget.update_peers(peers)
+            rendered = widget.render()
+            assert "peer_aaa" in rendered and "peer_bbb" in rendered
+
+            # Same peer IDs (e.g. a re-announce): no refresh, same markup
+            widget.update_peers(dict(peers))
+            assert mock_refresh.call_count == 1
+            assert widget.render() is rendered
+
+            widget.update_peers({})
+            assert mock_refresh.call_count == 2
+            assert widget.render() == PeerListWidget.EMPTY_MARKUP
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_message_history_batches_writes(self, temp_node_dir):
+        """Test that messages arriving together are written in one batch."""
+        from textual.app import App
+
+        from poc_03_chat_basic import MessageHistoryWidget
+
+        widget = MessageHistoryWidget()
+        assert widget.max_lines == MessageHistoryWidget.MAX_LINES
+
+        class HistoryApp(App):
+            def compose(self):
+                yield widget
+
+        async with HistoryApp().run_test():
+            with patch.object(widget, "write") as mock_write:
+                widget.add_remote_message("peer_aaaa_1", "first [bold")
+                widget.add_local_message("second")
+                widget.add_remote_message("peer_bbbb_2", "[/red]third")
+                mock_write.assert_not_called()
+
+                await asyncio.sleep(MessageHistoryWidget.FLUSH_DELAY * 4)
+
+                mock_write.assert_called_once()
+                text = mock_write.call_args[0][0]
+                lines = text.plain.split("\n")
+                assert len(lines) == 3
+                assert lines[0].endswith("first [bold")
+                assert "second" in lines[1]
+                assert lines[2].endswith("[/red]third")
+                # Peer markup is shown literally and never styles other lines
+                assert not any(span.style == "bold" for span in text.spans)
+        assert widget.message_count == 3
+
     @pytest.mark.asyncio
     @pytest.mark.timeout(30)
     async def test_message_history_widget_display(self, temp_node_dir):
@@ -299,8 +360,10 @@ class TestConcurrentOperations:
             app.node.peers = {f"peer_{j}": {} for j in range(i)}
             app.on_peer_update()
 
-        # All updates should be processed
-        assert app.peer_list.update_peers.call_count == 5
+        await asyncio.sleep(app.PEER_REFRESH_DELAY * 2)
+
+        # The burst should collapse into a single refresh with the final peers
+        app.peer_list.update_peers.assert_called_once_with(app.node.peers)
 
 
 class TestCleanup:
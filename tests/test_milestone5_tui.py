@@ -11,7 +11,7 @@ Tests focus on:
 
 import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
 from typing import Optional
 
@@ -192,6 +192,35 @@ class TestChannelCommands:
 
         assert "#dev" in app.ui_state.subscribed_channels
 
+    def test_handle_command_dispatch(self, app_with_mocks):
+        """Test slash commands dispatch through the command table."""
+        app = app_with_mocks
+
+        app._handle_command("join", ["dev"])
+        assert "#dev" in app.ui_state.subscribed_channels
+
+        app._cmd_switch = Mock()
+        app._handle_command("s", ["#dev"])
+        app._cmd_switch.assert_called_once_with(["#dev"])
+
+        app._handle_command("bogus", [])
+        app.message_view.add_command_output.assert_called_with(
+            "Unknown command: /bogus"
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_message_schedules_broadcast(self, app_with_mocks):
+        """Test sending a message schedules the broadcast on the event loop."""
+        app = app_with_mocks
+        app.node.broadcast_message = AsyncMock(return_value="msg-1")
+
+        app._handle_message("hello")
+        app.message_view.add_message.assert_called_once()
+
+        await asyncio.gather(*app._bg_tasks)
+        app.node.broadcast_message.assert_awaited_once_with("hello", "#general")
+        assert not app._bg_tasks
+
     def test_join_calls_widget_add(self, app_with_mocks):
         """Test /join calls channel_list.add_channel."""
         app = app_with_mocks
@@ -328,6 +357,23 @@ class TestChannelNavigation:
         assert channels1 == channels2
         assert channels1 == ["#aaa", "#general", "#mmm", "#zzz"]
 
+    def test_sorted_channels_cache_invalidation(self):
+        """Test that the cached channel order follows add/remove."""
+        state = UIState()
+        state.add_channel("#zzz")
+
+        assert state.sorted_channels() == ["#general", "#zzz"]
+        assert state.sorted_channels() is state.sorted_channels()
+        assert state.channel_index("#zzz") == 1
+
+        state.add_channel("#aaa")
+        assert state.sorted_channels() == ["#aaa", "#general", "#zzz"]
+        assert state.channel_index("#zzz") == 2
+
+        state.remove_channel("#zzz")
+        assert state.sorted_channels() == ["#aaa", "#general"]
+        assert state.channel_index("#zzz") == -1
+
 
 class TestUIConsistency:
     """Test UI state consistency invariants."""
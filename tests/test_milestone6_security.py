@@ -10,13 +10,22 @@ Tests the implementation of:
 """
 
 import asyncio
+import base64
 import pytest
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from tad.node import TADNode
 from tad.crypto.e2ee import E2EEManager
 
+
+@pytest.fixture(autouse=True)
+def _isolated_profiles(temp_node_dir):
+    """Write each test's <username>_profile.json under a temporary directory."""
+    return temp_node_dir
+
+
 # Helper to create and start a node
 async def create_and_start_node(username: str) -> TADNode:
     """Factory to create and fully start a TADNode."""
@@ -235,4 +244,184 @@ async def test_invite_permissions():
 
     await node_A.stop()
     await node_B.stop()
-    await node_C.stop()
\ No newline at end of file
+    await node_C.stop()
+
+
+def test_channel_cipher_cache():
+    """
+    Verify that channel messages reuse a cached AESGCM object, interoperate
+    with the static helpers, and drop the cache when the key is cleared.
+    """
+    manager = E2EEManager()
+    channel_id = "#cached"
+    key = manager.generate_channel_key()
+    manager.store_channel_key(channel_id, key)
+
+    cipher = manager._get_cipher(channel_id)
+    assert cipher is manager._get_cipher(channel_id), "Cipher should be cached"
+
+    ciphertext, nonce = manager.encrypt_channel_message(channel_id, "hello")
+    assert E2EEManager.decrypt_message(key, ciphertext, nonce) == "hello"
+    ciphertext, nonce = E2EEManager.encrypt_message(key, "world")
+    assert manager.decrypt_channel_message(channel_id, ciphertext, nonce) == "world"
+
+    manager.clear_channel_key(channel_id)
+    assert channel_id not in manager._aesgcm_cache
+    assert manager.decrypt_channel_message(channel_id, ciphertext, nonce) is None
+    with pytest.raises(KeyError):
+        manager.encrypt_channel_message(channel_id, "hello")
+
+
+def test_channel_message_batches():
+    """
+    Verify that batched channel encryption uses a distinct nonce per message
+    and that batched decryption preserves order and isolates failures.
+    """
+    manager = E2EEManager()
+    channel_id = "#batch"
+    manager.store_channel_key(channel_id, manager.generate_channel_key())
+
+    plaintexts = ["one", "two", "three"]
+    encrypted = manager.encrypt_channel_messages(channel_id, plaintexts)
+    assert len({nonce for _, nonce in encrypted}) == len(plaintexts)
+
+    # Tamper with the middle message
+    encrypted[1] = (encrypted[0][0], encrypted[1][1])
+    assert manager.decrypt_channel_messages(channel_id, encrypted) == [
+        "one",
+        None,
+        "three",
+    ]
+    assert manager.decrypt_channel_messages("#missing", encrypted) == [None] * 3
+
+
+def test_ciphertext_encoding_accepts_legacy_hex():
+    """
+    Verify that ciphertexts are base64-encoded and that hex-encoded ones
+    from older nodes (or older history) still decrypt.
+    """
+    key = E2EEManager.generate_channel_key()
+    ciphertext, nonce = E2EEManager.encrypt_message(key, "hello")
+    assert len(nonce) == 16, "A 12-byte nonce is 16 base64 characters"
+
+    legacy_ciphertext = base64.b64decode(ciphertext).hex()
+    legacy_nonce = base64.b64decode(nonce).hex()
+    assert E2EEManager.decrypt_message(key, legacy_ciphertext, legacy_nonce) == "hello"
+    assert E2EEManager.decrypt_message(key, "not base64!", nonce) is None
+
+
+def test_key_exchange_reuses_sealed_boxes():
+    """
+    Verify that channel keys round-trip through SealedBox key exchange, that
+    repeat sends to the same recipient reuse the cached box, and that
+    clear_all_keys() drops the boxes holding private keys.
+    """
+    from nacl.public import PrivateKey
+
+    from tad.crypto import e2ee
+
+    private_key = PrivateKey.generate()
+    public_key_hex = bytes(private_key.public_key).hex()
+    private_key_hex = bytes(private_key).hex()
+    channel_key = E2EEManager.generate_channel_key()
+
+    hits_before = e2ee._sealed_box_for_recipient.cache_info().hits
+    first = E2EEManager.encrypt_key_for_recipient(public_key_hex, channel_key)
+    second = E2EEManager.encrypt_key_for_recipient(public_key_hex, channel_key)
+    assert e2ee._sealed_box_for_recipient.cache_info().hits > hits_before
+    assert first != second, "Sealed boxes use a fresh ephemeral key per call"
+
+    for encrypted in (first, second):
+        assert (
+            E2EEManager.decrypt_key_from_sender(private_key_hex, encrypted)
+            == channel_key
+        )
+
+    assert e2ee._sealed_box_for_private_key.cache_info().currsize > 0
+    E2EEManager().clear_all_keys()
+    assert e2ee._sealed_box_for_private_key.cache_info().currsize == 0
+
+
+def test_derive_key_scrypt():
+    """
+    Verify that scrypt derivation is deterministic for a given salt and
+    produces a usable 32-byte channel key.
+    """
+    key, salt_hex = E2EEManager.derive_key_scrypt("hunter2", n=2**10)
+    assert len(key) == 32
+    again, _ = E2EEManager.derive_key_scrypt(
+        "hunter2", salt=bytes.fromhex(salt_hex), n=2**10
+    )
+    assert again == key
+    other, _ = E2EEManager.derive_key_scrypt(
+        "hunter3", salt=bytes.fromhex(salt_hex), n=2**10
+    )
+    assert other != key
+
+
+def test_channel_nonces_are_prefix_and_counter():
+    """
+    Verify that channel nonces share a random prefix with an increasing
+    counter, and that installing a new key draws a new prefix.
+    """
+    manager = E2EEManager()
+    channel_id = "#nonces"
+    manager.store_channel_key(channel_id, manager.generate_channel_key())
+
+    nonces = [
+        base64.b64decode(nonce)
+        for _, nonce in manager.encrypt_channel_messages(channel_id, ["a", "b"])
+    ]
+    _, nonce = manager.encrypt_channel_message(channel_id, "c")
+    nonces.append(base64.b64decode(nonce))
+
+    assert len({n[:8] for n in nonces}) == 1, "Nonces should share a prefix"
+    assert [int.from_bytes(n[8:], "big") for n in nonces] == [0, 1, 2]
+
+    manager.store_channel_key(channel_id, manager.generate_channel_key())
+    _, nonce = manager.encrypt_channel_message(channel_id, "d")
+    assert base64.b64decode(nonce)[:8] != nonces[0][:8]
+
+
+def test_channel_nonces_unique_across_threads():
+    """
+    Verify that concurrent encryption from several threads never reuses a
+    nonce for the same channel key.
+    """
+    manager = E2EEManager()
+    channel_id = "#threads"
+    manager.store_channel_key(channel_id, manager.generate_channel_key())
+
+    def take(_):
+        return [manager._take_nonces(channel_id, 1)[0] for _ in range(500)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nonces = [n for batch in executor.map(take, range(8)) for n in batch]
+
+    assert len(set(nonces)) == len(nonces) == 4000
+
+
+def test_encrypt_key_for_recipients():
+    """
+    Verify that a channel key fanned out to several members can be opened
+    by each of them, and only by them.
+    """
+    from nacl.public import PrivateKey
+
+    private_keys = [PrivateKey.generate() for _ in range(3)]
+    channel_key = E2EEManager.generate_channel_key()
+
+    encrypted = E2EEManager.encrypt_key_for_recipients(
+        [bytes(key.public_key).hex() for key in private_keys], channel_key
+    )
+    assert len(encrypted) == len(private_keys)
+
+    for private_key, encrypted_key in zip(private_keys, encrypted):
+        assert (
+            E2EEManager.decrypt_key_from_sender(bytes(private_key).hex(), encrypted_key)
+            == channel_key
+        )
+    assert (
+        E2EEManager.decrypt_key_from_sender(bytes(private_keys[0]).hex(), encrypted[1])
+        is None
+    )
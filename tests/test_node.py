@@ -6,13 +6,19 @@ We mock Zeroconf, TCP streams, and other external dependencies.
 """
 
 import asyncio
+import functools
 import json
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from poc_03_chat_basic import TAZCOMNode
+from poc_03_chat_basic import MessageArrived, TAZCOMNode
+from tests.conftest import framed_reads
+
+
+_framed_reads = functools.partial(framed_reads, TAZCOMNode.FRAME_HEADER)
 
 
 class TestIdentityManagement:
@@ -82,20 +88,22 @@ class TestPeerManagement:
         """Test that peer discovery correctly adds peer to list."""
         node = initialized_node
 
-        # Mock the Zeroconf service discovery
+        # Mock the Zeroconf service resolution
         mock_zeroconf = MagicMock()
-        mock_zeroconf.get_service_info.return_value = mock_zeroconf_service_info
+        mock_zeroconf_service_info.async_request = AsyncMock(return_value=True)
 
         # Call the service added handler
-        await node._on_service_added(
-            mock_zeroconf, "_tazcom._tcp.local.", "TAZCOM Node x9y8z7w6._tazcom._tcp.local."
-        )
+        with patch("poc_03_chat_basic.AsyncServiceInfo", return_value=mock_zeroconf_service_info):
+            await node._on_service_added(
+                mock_zeroconf, "_tazcom._tcp.local.", "TAZCOM Node x9y8z7w6._tazcom._tcp.local."
+            )
 
         # Verify peer was added
         peer_id = "x9y8z7w6v5u4t3s2..."
         assert peer_id in node.peers, "Peer should be added to peers dict"
         assert node.peers[peer_id]["ip"] == "127.0.0.2"
-        assert node.peers[peer_id]["port"] == "54322"
+        assert node.peers[peer_id]["port"] == 54322
+        assert node.peers[peer_id]["addr"] == ("127.0.0.2", 54322)
 
         # Verify callback was called
         node.app.on_peer_update.assert_called()
@@ -115,15 +123,147 @@ class TestPeerManagement:
         }
         mock_info.addresses = [127 << 24 | 2]
         mock_info.port = 54322
+        mock_info.async_request = AsyncMock(return_value=True)
 
         mock_zeroconf = MagicMock()
-        mock_zeroconf.get_service_info.return_value = mock_info
 
-        await node._on_service_added(mock_zeroconf, "_tazcom._tcp.local.", "test")
+        with patch("poc_03_chat_basic.AsyncServiceInfo", return_value=mock_info):
+            await node._on_service_added(mock_zeroconf, "_tazcom._tcp.local.", "test")
 
         # Peer should NOT be added (we ignore our own service)
         assert "a1b2c3d4e5f6g7h8..." not in node.peers
 
+    @pytest.mark.asyncio
+    async def test_on_service_added_unresolved(self, initialized_node):
+        """Test that a service whose records never arrive is skipped."""
+        node = initialized_node
+
+        mock_info = MagicMock()
+        mock_info.async_request = AsyncMock(return_value=False)
+
+        with patch("poc_03_chat_basic.AsyncServiceInfo", return_value=mock_info):
+            await node._on_service_added(
+                MagicMock(), "_tazcom._tcp.local.", "TAZCOM Node gone1234._tazcom._tcp.local."
+            )
+
+        assert len(node.peers) == 0
+        node.app.on_peer_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_service_state_change_filters_foreign_names(self, initialized_node):
+        """Test that only TAZCOM services are queued for the mDNS worker."""
+        from zeroconf import ServiceStateChange
+
+        node = initialized_node
+
+        node._on_service_state_change(
+            MagicMock(), "_tazcom._tcp.local.", "Printer._tazcom._tcp.local.", ServiceStateChange.Added
+        )
+        assert node._mdns_events.empty()
+
+        node._on_service_state_change(
+            MagicMock(),
+            "_tazcom._tcp.local.",
+            "TAZCOM Node new45678._tazcom._tcp.local.",
+            ServiceStateChange.Added,
+        )
+        assert node._mdns_events.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_mdns_worker_coalesces_events(self, initialized_node):
+        """Test that duplicate and already-known announcements cause no work."""
+        from zeroconf import ServiceStateChange
+
+        node = initialized_node
+        node._on_service_added = AsyncMock()
+        node._on_service_removed = AsyncMock()
+
+        known = "TAZCOM Node known123._tazcom._tcp.local."
+        node._seen_names.add(known)
+        node.service_name_to_id[known] = "known_peer"
+        new = "TAZCOM Node new45678._tazcom._tcp.local."
+
+        for state, name in [
+            (ServiceStateChange.Added, known),  # re-announcement
+            (ServiceStateChange.Added, new),
+            (ServiceStateChange.Added, new),  # duplicate announcement
+        ]:
+            node._on_service_state_change(MagicMock(), "_tazcom._tcp.local.", name, state)
+
+        worker = asyncio.create_task(node._mdns_worker())
+        await asyncio.sleep(node.MDNS_COALESCE_DELAY * 4)
+        worker.cancel()
+
+        node._on_service_removed.assert_not_called()
+        node._on_service_added.assert_called_once()
+        assert node._on_service_added.call_args[0][2] == new
+        assert not node._resolve_tasks
+
+    @pytest.mark.asyncio
+    async def test_mdns_worker_re_resolves_flapping_service(self, initialized_node):
+        """Test that a known service removed and re-added in one batch is resolved again."""
+        from zeroconf import ServiceStateChange
+
+        node = initialized_node
+        node._on_service_added = AsyncMock()
+        node._on_service_removed = AsyncMock()
+
+        known = "TAZCOM Node known123._tazcom._tcp.local."
+        node._seen_names.add(known)
+        node.service_name_to_id[known] = "known_peer"
+
+        for state in (ServiceStateChange.Removed, ServiceStateChange.Added):
+            node._on_service_state_change(MagicMock(), "_tazcom._tcp.local.", known, state)
+
+        worker = asyncio.create_task(node._mdns_worker())
+        await asyncio.sleep(node.MDNS_COALESCE_DELAY * 4)
+        worker.cancel()
+
+        node._on_service_removed.assert_not_called()
+        node._on_service_added.assert_called_once()
+        assert node._on_service_added.call_args[0][2] == known
+
+    @pytest.mark.asyncio
+    async def test_mdns_worker_does_not_wait_for_resolution(self, initialized_node):
+        """Test that a slow resolution runs in the background and is cancelled on removal."""
+        from zeroconf import ServiceStateChange
+
+        node = initialized_node
+        resolving = asyncio.Event()
+
+        async def slow_add(zeroconf, service_type, name):
+            resolving.set()
+            await asyncio.sleep(10)
+
+        node._on_service_added = slow_add
+        node._on_service_removed = AsyncMock()
+        slow = "TAZCOM Node slow1234._tazcom._tcp.local."
+        other = "TAZCOM Node other123._tazcom._tcp.local."
+        node.service_name_to_id[other] = "other_peer"
+
+        worker = asyncio.create_task(node._mdns_worker())
+        node._on_service_state_change(
+            MagicMock(), "_tazcom._tcp.local.", slow, ServiceStateChange.Added
+        )
+        await asyncio.wait_for(resolving.wait(), 1.0)
+        task = node._resolve_tasks[slow]
+
+        # The worker keeps handling events while the resolution is pending
+        node._on_service_state_change(
+            MagicMock(), "_tazcom._tcp.local.", other, ServiceStateChange.Removed
+        )
+        await asyncio.sleep(node.MDNS_COALESCE_DELAY * 4)
+        node._on_service_removed.assert_awaited_once_with(other)
+
+        node._on_service_state_change(
+            MagicMock(), "_tazcom._tcp.local.", slow, ServiceStateChange.Removed
+        )
+        await asyncio.sleep(node.MDNS_COALESCE_DELAY * 4)
+        worker.cancel()
+
+        assert task.cancelled()
+        assert slow not in node._resolve_tasks
+
     @pytest.mark.asyncio
     async def test_on_service_removed(self, initialized_node):
         """Test that peer removal works correctly."""
@@ -166,13 +306,13 @@ class TestMessageHandling:
 
     @pytest.mark.asyncio
     async def test_handle_hello_message(self, initialized_node, mock_stream_reader, mock_stream_writer):
-        """Test handling of HELLO message."""
+        """Test that a HELLO from an older peer is still acknowledged."""
         node = initialized_node
 
         hello_msg = {"type": "HELLO", "from": "peer_id_123"}
-        mock_stream_reader.readuntil.return_value = (
-            json.dumps(hello_msg) + "\n"
-        ).encode("utf-8")
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(hello_msg).encode("utf-8")
+        )
 
         # Call handler
         await node.handle_connection(mock_stream_reader, mock_stream_writer)
@@ -180,7 +320,7 @@ class TestMessageHandling:
         # Verify ACK was sent
         mock_stream_writer.write.assert_called()
         written_data = mock_stream_writer.write.call_args[0][0]
-        assert written_data == b"ACK\n"
+        assert written_data == TAZCOMNode.ACK_FRAME
 
     @pytest.mark.asyncio
     async def test_handle_chat_message(self, initialized_node, mock_stream_reader, mock_stream_writer):
@@ -193,20 +333,23 @@ class TestMessageHandling:
             "timestamp": "2025-11-04T10:23:45",
             "content": "Hello, world!",
         }
-        mock_stream_reader.readuntil.return_value = (
-            json.dumps(chat_msg) + "\n"
-        ).encode("utf-8")
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            json.dumps(chat_msg).encode("utf-8")
+        )
 
         # Call handler
         await node.handle_connection(mock_stream_reader, mock_stream_writer)
 
         # Verify callback was called with correct message
-        node.app.on_message_received.assert_called_once_with("peer_id_123", "Hello, world!")
+        node.app.post_message.assert_called_once()
+        event = node.app.post_message.call_args[0][0]
+        assert isinstance(event, MessageArrived)
+        assert (event.from_peer, event.content) == ("peer_id_123", "Hello, world!")
 
         # Verify ACK was sent
         mock_stream_writer.write.assert_called()
         written_data = mock_stream_writer.write.call_args[0][0]
-        assert written_data == b"ACK\n"
+        assert written_data == TAZCOMNode.ACK_FRAME
 
     @pytest.mark.asyncio
     async def test_handle_invalid_json(self, initialized_node, mock_stream_reader, mock_stream_writer):
@@ -214,7 +357,7 @@ class TestMessageHandling:
         node = initialized_node
 
         # Send invalid JSON
-        mock_stream_reader.readuntil.return_value = b"not valid json\n"
+        mock_stream_reader.readexactly.side_effect = _framed_reads(b"not valid json")
 
         # Call handler
         await node.handle_connection(mock_stream_reader, mock_stream_writer)
@@ -222,25 +365,91 @@ class TestMessageHandling:
         # Verify ERROR was sent
         mock_stream_writer.write.assert_called()
         written_data = mock_stream_writer.write.call_args[0][0]
-        assert written_data == b"ERROR\n"
+        assert written_data == TAZCOMNode.ERROR_FRAME
 
     @pytest.mark.asyncio
     async def test_handle_message_too_large(self, initialized_node, mock_stream_reader, mock_stream_writer):
         """Test handling of oversized message."""
         node = initialized_node
 
-        # Simulate message size exceeded error
-        mock_stream_reader.readuntil.side_effect = asyncio.LimitOverrunError(
-            "message size exceeded", 0
-        )
+        # Announce a payload larger than the size limit
+        mock_stream_reader.readexactly.side_effect = [
+            TAZCOMNode.FRAME_HEADER.pack(TAZCOMNode.MESSAGE_SIZE_LIMIT + 1)
+        ]
 
         # Call handler
         await node.handle_connection(mock_stream_reader, mock_stream_writer)
 
-        # Verify connection was closed
+        # Verify connection was closed without reading the payload
+        assert mock_stream_reader.readexactly.call_count == 1
         mock_stream_writer.close.assert_called()
         mock_stream_writer.wait_closed.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_handle_multiple_messages_on_one_connection(
+        self, initialized_node, mock_stream_reader, mock_stream_writer
+    ):
+        """Test that a pooled connection can carry several frames."""
+        node = initialized_node
+
+        mock_stream_reader.readexactly.side_effect = _framed_reads(
+            *(
+                json.dumps({"type": "CHAT", "from": "peer_id_123", "content": text}).encode("utf-8")
+                for text in ("one", "two")
+            )
+        )
+
+        await node.handle_connection(mock_stream_reader, mock_stream_writer)
+
+        assert node.app.post_message.call_count == 2
+        assert mock_stream_writer.write.call_count == 2
+        mock_stream_writer.close.assert_called()
+
+
+class TestConnectionPool:
+    """Tests for the outbound connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_sends(self, initialized_node):
+        """Test that consecutive sends to a peer share one TCP connection."""
+        node = initialized_node
+        connections = []
+
+        async def handler(reader, writer):
+            connections.append(writer)
+            await node.handle_connection(reader, writer)
+
+        node.server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = node.server.sockets[0].getsockname()[1]
+
+        for _ in range(3):
+            frame = node._encode_chat("ping", "2025-11-04T10:23:45")
+            ack = await node._send_frame("peer_1", "127.0.0.1", port, frame)
+            assert ack == b"ACK"
+
+        assert len(connections) == 1
+        assert node.conn_pool["peer_1"].qsize() == 1
+
+        await node.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_expired_connection_not_reused(self, initialized_node):
+        """Test that connections older than POOL_MAX_LIFETIME are replaced."""
+        node = initialized_node
+
+        stale_writer = Mock()
+        stale_writer.is_closing.return_value = False
+        stale_reader = Mock()
+        stale_reader.at_eof.return_value = False
+        node._release("peer_1", (stale_reader, stale_writer, -node.POOL_MAX_LIFETIME * 2))
+
+        fresh = (Mock(), Mock())
+        with patch("asyncio.open_connection", AsyncMock(return_value=fresh)):
+            reader, writer, _ = await node._acquire("peer_1", "127.0.0.1", 1)
+
+        stale_writer.close.assert_called_once()
+        assert (reader, writer) == fresh
+
 
 class TestBroadcastMessage:
     """Tests for message broadcasting to peers."""
@@ -276,6 +485,68 @@ class TestBroadcastMessage:
         # Verify _send_chat_message was called for each peer
         assert node._send_chat_message.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_broadcast_shares_one_encoded_frame(self, initialized_node):
+        """Test that every peer receives the same pre-encoded CHAT frame."""
+        node = initialized_node
+        node.peers = {
+            "peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"},
+            "peer_2": {"ip": "127.0.0.3", "port": "54323", "name": "Peer 2"},
+        }
+        node._send_chat_message = AsyncMock()
+
+        await node.broadcast_message('Say "hi"')
+
+        frames = [call.args[2] for call in node._send_chat_message.call_args_list]
+        assert frames[0] is frames[1]
+        header_size = TAZCOMNode.FRAME_HEADER.size
+        (length,) = TAZCOMNode.FRAME_HEADER.unpack(frames[0][:header_size])
+        assert length == len(frames[0]) - header_size
+        message = json.loads(frames[0][header_size:])
+        assert message["type"] == "CHAT"
+        assert message["from"] == node.node_id_b64
+        assert message["content"] == 'Say "hi"'
+        datetime.fromisoformat(message["timestamp"])
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_long_non_ascii_message(self, initialized_node):
+        """Test that escaped non-ASCII text well past 1 KiB is still sent."""
+        node = initialized_node
+        node.peers = {"peer_1": {"ip": "127.0.0.2", "port": "54322", "name": "Peer 1"}}
+        node._send_chat_message = AsyncMock()
+
+        await node.broadcast_message("Привет, мир! 😀" * 50)
+
+        node._send_chat_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_times_out_on_silent_peer(self, initialized_node):
+        """Test that a peer that never ACKs is abandoned after SEND_TIMEOUT."""
+        node = initialized_node
+        node.SEND_TIMEOUT = 0.05
+
+        async def hang(*args):
+            await asyncio.sleep(10)
+
+        node._send_frame = hang
+        peer = {"addr": ("127.0.0.2", 54322)}
+
+        await asyncio.wait_for(node._send_chat_message("peer_1", peer, b""), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_spawn_broadcast_tracks_task(self, initialized_node):
+        """Test that spawn_broadcast runs the broadcast as a tracked task."""
+        node = initialized_node
+        node.broadcast_message = AsyncMock()
+
+        node.spawn_broadcast("hello")
+        assert len(node._broadcast_tasks) == 1
+        await asyncio.gather(*node._broadcast_tasks)
+        await asyncio.sleep(0)
+
+        node.broadcast_message.assert_awaited_once_with("hello")
+        assert not node._broadcast_tasks
+
     @pytest.mark.asyncio
     async def test_broadcast_empty_message(self, initialized_node):
         """Test that empty messages are not broadcast."""